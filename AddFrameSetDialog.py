@@ -1,9 +1,9 @@
-from PyQt5 import uic
-from PyQt5.QtCore import QSettings, QObject, QEvent
+from PyQt5.QtCore import QObject, QEvent
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QDialog
 
 from MultiOsUtil import MultiOsUtil
+from SettingsCache import SettingsCache
 from tracelog import *
 
 from BiasFrameSet import BiasFrameSet
@@ -20,17 +20,15 @@ class AddFrameSetDialog(QDialog):
         QDialog.__init__(self)
         # Watch window events so we can catch and record resize events
 
-        self.ui = uic.loadUi(MultiOsUtil.path_for_file_in_program_directory("AddFrameSet.ui"))
+        self.ui = MultiOsUtil.load_ui_form("AddFrameSet.ui", QDialog)
         self._numFramesValid = False   # Set as part of field validation
         self._exposureValid = False
         self._completedValid = False
         self._frameSet: FrameSet
 
         # Set window font sizes according to saved preference
-        settings = QSettings()
-        standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
         MultiOsUtil.set_font_sizes(parent=self.ui,
-                                   standard_size=standard_font_size,
+                                   standard_size=SettingsCache.instance().get_standard_font_size(),
                                    title_prefix=MultiOsUtil.MAIN_TITLE_LABEL_PREFIX,
                                    title_increment=MultiOsUtil.MAIN_TITLE_FONT_SIZE_INCREMENT,
                                    subtitle_prefix=MultiOsUtil.SUBTITLE_LABEL_PREFIX,
@@ -48,7 +46,7 @@ class AddFrameSetDialog(QDialog):
     def setupUI(self, new_set: bool, frame_set=None):
         """Initialize UI fields in the dialog"""
         # Set size from last resize, if any
-        settings = QSettings()
+        settings = SettingsCache.instance()
         if settings.contains(MultiOsUtil.LAST_ADDFRAME_SIZE_SETTING):
             last_size = settings.value(MultiOsUtil.LAST_ADDFRAME_SIZE_SETTING)
             self.ui.resize(last_size)
@@ -228,6 +226,5 @@ class AddFrameSetDialog(QDialog):
     def eventFilter(self, object: QObject, event: QEvent) -> bool:
         if event.type() == QEvent.Resize:
             window_size = event.size()
-            settings = QSettings()
-            settings.setValue(MultiOsUtil.LAST_ADDFRAME_SIZE_SETTING, window_size)
+            SettingsCache.instance().set_value(MultiOsUtil.LAST_ADDFRAME_SIZE_SETTING, window_size)
         return False  # Didn't handle event
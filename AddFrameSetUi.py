@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'AddFrameSet.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_dialogRoot(object):
+    def setupUi(self, dialogRoot):
+        dialogRoot.setObjectName("dialogRoot")
+        dialogRoot.setWindowModality(QtCore.Qt.NonModal)
+        dialogRoot.resize(382, 328)
+        dialogRoot.setModal(False)
+        self.gridLayout_3 = QtWidgets.QGridLayout(dialogRoot)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.MainTitle_1 = QtWidgets.QLabel(dialogRoot)
+        self.MainTitle_1.setObjectName("MainTitle_1")
+        self.gridLayout_3.addWidget(self.MainTitle_1, 0, 0, 1, 2, QtCore.Qt.AlignHCenter)
+        self.label_2 = QtWidgets.QLabel(dialogRoot)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout_3.addWidget(self.label_2, 1, 0, 1, 1)
+        self.numberOfFrames = QtWidgets.QLineEdit(dialogRoot)
+        self.numberOfFrames.setObjectName("numberOfFrames")
+        self.gridLayout_3.addWidget(self.numberOfFrames, 1, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(dialogRoot)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout_3.addWidget(self.label_3, 2, 0, 1, 1)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.biasButton = QtWidgets.QRadioButton(dialogRoot)
+        self.biasButton.setObjectName("biasButton")
+        self.frameTypeGroup = QtWidgets.QButtonGroup(dialogRoot)
+        self.frameTypeGroup.setObjectName("frameTypeGroup")
+        self.frameTypeGroup.addButton(self.biasButton)
+        self.gridLayout.addWidget(self.biasButton, 0, 0, 1, 1)
+        self.darkButton = QtWidgets.QRadioButton(dialogRoot)
+        self.darkButton.setObjectName("darkButton")
+        self.frameTypeGroup.addButton(self.darkButton)
+        self.gridLayout.addWidget(self.darkButton, 1, 0, 1, 1)
+        self.gridLayout_3.addLayout(self.gridLayout, 2, 1, 1, 1)
+        self.label_4 = QtWidgets.QLabel(dialogRoot)
+        self.label_4.setObjectName("label_4")
+        self.gridLayout_3.addWidget(self.label_4, 3, 0, 1, 1)
+        self.exposureSeconds = QtWidgets.QLineEdit(dialogRoot)
+        self.exposureSeconds.setObjectName("exposureSeconds")
+        self.gridLayout_3.addWidget(self.exposureSeconds, 3, 1, 1, 1)
+        self.label_5 = QtWidgets.QLabel(dialogRoot)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout_3.addWidget(self.label_5, 4, 0, 1, 1)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.binning11 = QtWidgets.QRadioButton(dialogRoot)
+        self.binning11.setObjectName("binning11")
+        self.binningGroup = QtWidgets.QButtonGroup(dialogRoot)
+        self.binningGroup.setObjectName("binningGroup")
+        self.binningGroup.addButton(self.binning11)
+        self.gridLayout_2.addWidget(self.binning11, 0, 0, 1, 1)
+        self.binning22 = QtWidgets.QRadioButton(dialogRoot)
+        self.binning22.setObjectName("binning22")
+        self.binningGroup.addButton(self.binning22)
+        self.gridLayout_2.addWidget(self.binning22, 1, 0, 1, 1)
+        self.binning33 = QtWidgets.QRadioButton(dialogRoot)
+        self.binning33.setObjectName("binning33")
+        self.binningGroup.addButton(self.binning33)
+        self.gridLayout_2.addWidget(self.binning33, 2, 0, 1, 1)
+        self.binning44 = QtWidgets.QRadioButton(dialogRoot)
+        self.binning44.setObjectName("binning44")
+        self.binningGroup.addButton(self.binning44)
+        self.gridLayout_2.addWidget(self.binning44, 3, 0, 1, 1)
+        self.gridLayout_3.addLayout(self.gridLayout_2, 4, 1, 1, 1)
+        self.completedLabel = QtWidgets.QLabel(dialogRoot)
+        self.completedLabel.setObjectName("completedLabel")
+        self.gridLayout_3.addWidget(self.completedLabel, 5, 0, 1, 1)
+        self.completedFrames = QtWidgets.QLineEdit(dialogRoot)
+        self.completedFrames.setObjectName("completedFrames")
+        self.gridLayout_3.addWidget(self.completedFrames, 5, 1, 1, 1)
+        self.addButton = QtWidgets.QPushButton(dialogRoot)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.addButton.sizePolicy().hasHeightForWidth())
+        self.addButton.setSizePolicy(sizePolicy)
+        self.addButton.setDefault(True)
+        self.addButton.setObjectName("addButton")
+        self.gridLayout_3.addWidget(self.addButton, 7, 0, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(355, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem, 6, 0, 1, 2)
+        self.cancelButton = QtWidgets.QPushButton(dialogRoot)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cancelButton.sizePolicy().hasHeightForWidth())
+        self.cancelButton.setSizePolicy(sizePolicy)
+        self.cancelButton.setObjectName("cancelButton")
+        self.gridLayout_3.addWidget(self.cancelButton, 7, 1, 1, 1, QtCore.Qt.AlignRight)
+
+        self.retranslateUi(dialogRoot)
+        QtCore.QMetaObject.connectSlotsByName(dialogRoot)
+
+    def retranslateUi(self, dialogRoot):
+        _translate = QtCore.QCoreApplication.translate
+        dialogRoot.setWindowTitle(_translate("dialogRoot", "Dialog"))
+        self.MainTitle_1.setText(_translate("dialogRoot", "Define New Frame Set"))
+        self.label_2.setText(_translate("dialogRoot", "Number of Frames:"))
+        self.numberOfFrames.setToolTip(_translate("dialogRoot", "How many frames of this type should be taken?"))
+        self.label_3.setText(_translate("dialogRoot", "Frame Type:"))
+        self.biasButton.setToolTip(_translate("dialogRoot", "This frame set is for zero-length bias frames"))
+        self.biasButton.setText(_translate("dialogRoot", "Bias"))
+        self.darkButton.setToolTip(_translate("dialogRoot", "This frame set is for dark frames of the given exposure length"))
+        self.darkButton.setText(_translate("dialogRoot", "Dark"))
+        self.label_4.setText(_translate("dialogRoot", "Exposure Seconds:"))
+        self.exposureSeconds.setToolTip(_translate("dialogRoot", "Exposure time, in seconds, for dark frames"))
+        self.label_5.setText(_translate("dialogRoot", "Binning:"))
+        self.binning11.setToolTip(_translate("dialogRoot", "Frames will be binned 1 x 1"))
+        self.binning11.setText(_translate("dialogRoot", "1 x 1"))
+        self.binning22.setToolTip(_translate("dialogRoot", "Frames will be binned 2 x 2"))
+        self.binning22.setText(_translate("dialogRoot", "2 x 2"))
+        self.binning33.setToolTip(_translate("dialogRoot", "Frames will be binned 3 x 3"))
+        self.binning33.setText(_translate("dialogRoot", "3 x 3"))
+        self.binning44.setToolTip(_translate("dialogRoot", "Frames will be binned 4 x 4"))
+        self.binning44.setText(_translate("dialogRoot", "4 x 4"))
+        self.completedLabel.setText(_translate("dialogRoot", "Completed:"))
+        self.completedFrames.setToolTip(_translate("dialogRoot", "Change the \"number already completed\" value to cause frames to be taken again."))
+        self.addButton.setToolTip(_translate("dialogRoot", "Close this window and add the frame set described here to the frame plan."))
+        self.addButton.setText(_translate("dialogRoot", "Save"))
+        self.cancelButton.setToolTip(_translate("dialogRoot", "Abandon this window, don\'t add a frame set to the plan."))
+        self.cancelButton.setText(_translate("dialogRoot", "Cancel"))
+
+
+# Written by compile_ui_forms.py, used by MultiOsUtil.load_ui_form
+FORM_CLASS_NAME = "Ui_dialogRoot"
+UI_SOURCE_SHA1 = "3fa72eb821d02daeb21863f35115199b98d30370"
@@ -6,13 +6,13 @@
 #   _darkExposures      array of exposure values (float, seconds) for dark frames
 import re
 
-from PyQt5.QtCore import QObject, QEvent, QSettings
+from PyQt5.QtCore import QObject, QEvent
 from PyQt5.QtGui import QFont
 
 from MultiOsUtil import MultiOsUtil
+from SettingsCache import SettingsCache
 from tracelog import *
 
-from PyQt5 import uic
 from PyQt5.QtWidgets import QDialog
 
 from Validators import Validators
@@ -38,13 +38,11 @@ class BulkEntryDialog(QDialog):
     def __init__(self):
         # print("BulkEntryDialog/init entered")
         QDialog.__init__(self)
-        self.ui = uic.loadUi(MultiOsUtil.path_for_file_in_program_directory("BulkEntry.ui"))
+        self.ui = MultiOsUtil.load_ui_form("BulkEntry.ui", QDialog)
 
         # Set window font sizes according to saved preference
-        settings = QSettings()
-        standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
         MultiOsUtil.set_font_sizes(parent=self.ui,
-                                   standard_size=standard_font_size,
+                                   standard_size=SettingsCache.instance().get_standard_font_size(),
                                    title_prefix=MultiOsUtil.MAIN_TITLE_LABEL_PREFIX,
                                    title_increment=MultiOsUtil.MAIN_TITLE_FONT_SIZE_INCREMENT,
                                    subtitle_prefix=MultiOsUtil.SUBTITLE_LABEL_PREFIX,
@@ -85,7 +83,7 @@ class BulkEntryDialog(QDialog):
 
     def set_up_ui(self):
         # Set size from last resize, if any
-        settings = QSettings()
+        settings = SettingsCache.instance()
         if settings.contains(MultiOsUtil.LAST_BULKADD_SIZE_SETTING):
             last_size = settings.value(MultiOsUtil.LAST_BULKADD_SIZE_SETTING)
             self.ui.resize(last_size)
@@ -220,6 +218,5 @@ class BulkEntryDialog(QDialog):
     def eventFilter(self, the_object: QObject, event: QEvent) -> bool:
         if event.type() == QEvent.Resize:
             window_size = event.size()
-            settings = QSettings()
-            settings.setValue(MultiOsUtil.LAST_BULKADD_SIZE_SETTING, window_size)
+            SettingsCache.instance().set_value(MultiOsUtil.LAST_BULKADD_SIZE_SETTING, window_size)
         return False  # Didn't handle event
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'BulkEntry.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_Dialog(object):
+    def setupUi(self, Dialog):
+        Dialog.setObjectName("Dialog")
+        Dialog.resize(718, 459)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(Dialog.sizePolicy().hasHeightForWidth())
+        Dialog.setSizePolicy(sizePolicy)
+        self.gridLayout = QtWidgets.QGridLayout(Dialog)
+        self.gridLayout.setObjectName("gridLayout")
+        spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.gridLayout.addItem(spacerItem, 1, 0, 1, 1)
+        self.Subtitle_1 = QtWidgets.QLabel(Dialog)
+        self.Subtitle_1.setObjectName("Subtitle_1")
+        self.gridLayout.addWidget(self.Subtitle_1, 2, 0, 1, 1)
+        self.biasFramesCount = QtWidgets.QLineEdit(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.biasFramesCount.sizePolicy().hasHeightForWidth())
+        self.biasFramesCount.setSizePolicy(sizePolicy)
+        self.biasFramesCount.setMinimumSize(QtCore.QSize(120, 0))
+        self.biasFramesCount.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.biasFramesCount.setMaxLength(5)
+        self.biasFramesCount.setObjectName("biasFramesCount")
+        self.gridLayout.addWidget(self.biasFramesCount, 2, 1, 1, 1)
+        self.label_3 = QtWidgets.QLabel(Dialog)
+        self.label_3.setObjectName("label_3")
+        self.gridLayout.addWidget(self.label_3, 2, 2, 1, 1)
+        self.biasMessage = QtWidgets.QLabel(Dialog)
+        self.biasMessage.setObjectName("biasMessage")
+        self.gridLayout.addWidget(self.biasMessage, 2, 3, 1, 2)
+        self.verticalLayout = QtWidgets.QVBoxLayout()
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.biasBin11 = QtWidgets.QCheckBox(Dialog)
+        self.biasBin11.setChecked(True)
+        self.biasBin11.setObjectName("biasBin11")
+        self.verticalLayout.addWidget(self.biasBin11)
+        self.biasBin22 = QtWidgets.QCheckBox(Dialog)
+        self.biasBin22.setChecked(True)
+        self.biasBin22.setObjectName("biasBin22")
+        self.verticalLayout.addWidget(self.biasBin22)
+        self.biasBin33 = QtWidgets.QCheckBox(Dialog)
+        self.biasBin33.setObjectName("biasBin33")
+        self.verticalLayout.addWidget(self.biasBin33)
+        self.biasBin44 = QtWidgets.QCheckBox(Dialog)
+        self.biasBin44.setObjectName("biasBin44")
+        self.verticalLayout.addWidget(self.biasBin44)
+        self.gridLayout.addLayout(self.verticalLayout, 3, 2, 1, 1)
+        self.Subtitle_2 = QtWidgets.QLabel(Dialog)
+        self.Subtitle_2.setObjectName("Subtitle_2")
+        self.gridLayout.addWidget(self.Subtitle_2, 4, 0, 1, 1)
+        self.darkFramesCount = QtWidgets.QLineEdit(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.darkFramesCount.sizePolicy().hasHeightForWidth())
+        self.darkFramesCount.setSizePolicy(sizePolicy)
+        self.darkFramesCount.setMinimumSize(QtCore.QSize(120, 0))
+        self.darkFramesCount.setMaximumSize(QtCore.QSize(120, 16777215))
+        self.darkFramesCount.setMaxLength(5)
+        self.darkFramesCount.setObjectName("darkFramesCount")
+        self.gridLayout.addWidget(self.darkFramesCount, 4, 1, 1, 1)
+        self.label_5 = QtWidgets.QLabel(Dialog)
+        self.label_5.setObjectName("label_5")
+        self.gridLayout.addWidget(self.label_5, 4, 2, 1, 1)
+        self.darkMessage = QtWidgets.QLabel(Dialog)
+        self.darkMessage.setObjectName("darkMessage")
+        self.gridLayout.addWidget(self.darkMessage, 4, 3, 1, 2)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.darkBin11 = QtWidgets.QCheckBox(Dialog)
+        self.darkBin11.setChecked(True)
+        self.darkBin11.setObjectName("darkBin11")
+        self.verticalLayout_2.addWidget(self.darkBin11)
+        self.darkBin22 = QtWidgets.QCheckBox(Dialog)
+        self.darkBin22.setChecked(True)
+        self.darkBin22.setObjectName("darkBin22")
+        self.verticalLayout_2.addWidget(self.darkBin22)
+        self.darkBin33 = QtWidgets.QCheckBox(Dialog)
+        self.darkBin33.setObjectName("darkBin33")
+        self.verticalLayout_2.addWidget(self.darkBin33)
+        self.darkBin44 = QtWidgets.QCheckBox(Dialog)
+        self.darkBin44.setObjectName("darkBin44")
+        self.verticalLayout_2.addWidget(self.darkBin44)
+        self.gridLayout.addLayout(self.verticalLayout_2, 5, 2, 1, 1)
+        self.widget = QtWidgets.QWidget(Dialog)
+        self.widget.setObjectName("widget")
+        self.label_6 = QtWidgets.QLabel(self.widget)
+        self.label_6.setGeometry(QtCore.QRect(0, 10, 121, 61))
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_6.sizePolicy().hasHeightForWidth())
+        self.label_6.setSizePolicy(sizePolicy)
+        self.label_6.setWordWrap(True)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout.addWidget(self.widget, 6, 1, 1, 1)
+        self.exposureLengths = QtWidgets.QTextEdit(Dialog)
+        self.exposureLengths.setObjectName("exposureLengths")
+        self.gridLayout.addWidget(self.exposureLengths, 6, 2, 1, 3)
+        self.saveButton = QtWidgets.QPushButton(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.saveButton.sizePolicy().hasHeightForWidth())
+        self.saveButton.setSizePolicy(sizePolicy)
+        self.saveButton.setAutoDefault(False)
+        self.saveButton.setDefault(True)
+        self.saveButton.setObjectName("saveButton")
+        self.gridLayout.addWidget(self.saveButton, 7, 0, 1, 1)
+        self.exposuresMessage = QtWidgets.QLabel(Dialog)
+        self.exposuresMessage.setObjectName("exposuresMessage")
+        self.gridLayout.addWidget(self.exposuresMessage, 7, 2, 1, 2)
+        self.cancelButton = QtWidgets.QPushButton(Dialog)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.cancelButton.sizePolicy().hasHeightForWidth())
+        self.cancelButton.setSizePolicy(sizePolicy)
+        self.cancelButton.setObjectName("cancelButton")
+        self.gridLayout.addWidget(self.cancelButton, 7, 4, 1, 1)
+        self.MainTitle_1 = QtWidgets.QLabel(Dialog)
+        self.MainTitle_1.setObjectName("MainTitle_1")
+        self.gridLayout.addWidget(self.MainTitle_1, 0, 0, 1, 5, QtCore.Qt.AlignHCenter)
+
+        self.retranslateUi(Dialog)
+        QtCore.QMetaObject.connectSlotsByName(Dialog)
+
+    def retranslateUi(self, Dialog):
+        _translate = QtCore.QCoreApplication.translate
+        Dialog.setWindowTitle(_translate("Dialog", "Dialog"))
+        self.Subtitle_1.setText(_translate("Dialog", "Bias Frames"))
+        self.biasFramesCount.setToolTip(_translate("Dialog", "How many bias frames, of each of the following binnings, should be taken?"))
+        self.label_3.setText(_translate("Dialog", "each, binned:"))
+        self.biasMessage.setText(_translate("Dialog", "<html><head/><body><p><br/></p></body></html>"))
+        self.biasBin11.setToolTip(_translate("Dialog", "Take bias frames binned 1 x 1"))
+        self.biasBin11.setText(_translate("Dialog", "1 x 1"))
+        self.biasBin22.setToolTip(_translate("Dialog", "Take bias frames binned 2 x 2"))
+        self.biasBin22.setText(_translate("Dialog", "2 x 2"))
+        self.biasBin33.setToolTip(_translate("Dialog", "Take bias frames binned 3 x 3"))
+        self.biasBin33.setText(_translate("Dialog", "3 x 3"))
+        self.biasBin44.setToolTip(_translate("Dialog", "Take bias frames binned 4 x 4"))
+        self.biasBin44.setText(_translate("Dialog", "4 x 4"))
+        self.Subtitle_2.setText(_translate("Dialog", "Dark Frames"))
+        self.darkFramesCount.setToolTip(_translate("Dialog", "How many dark frames of the combination of the following binnings and exposure times, should be taken?"))
+        self.label_5.setText(_translate("Dialog", "each, binned:"))
+        self.darkMessage.setText(_translate("Dialog", "<html><head/><body><p><br/></p></body></html>"))
+        self.darkBin11.setToolTip(_translate("Dialog", "Take dark frames binned 1 x 1"))
+        self.darkBin11.setText(_translate("Dialog", "1 x 1"))
+        self.darkBin22.setToolTip(_translate("Dialog", "Take dark frames binned 2 x 2"))
+        self.darkBin22.setText(_translate("Dialog", "2 x 2"))
+        self.darkBin33.setToolTip(_translate("Dialog", "Take dark frames binned 3 x 3"))
+        self.darkBin33.setText(_translate("Dialog", "3 x 3"))
+        self.darkBin44.setToolTip(_translate("Dialog", "Take dark frames binned 4 x 4"))
+        self.darkBin44.setText(_translate("Dialog", "4 x 4"))
+        self.label_6.setText(_translate("Dialog", "Exposure lengths, in seconds:"))
+        self.exposureLengths.setToolTip(_translate("Dialog", "Enter one or more exposure lenghts, in seconds, separated by spaces or commas"))
+        self.saveButton.setToolTip(_translate("Dialog", "Save the frames described here back to the frames plan."))
+        self.saveButton.setText(_translate("Dialog", "Save"))
+        self.exposuresMessage.setText(_translate("Dialog", "<html><head/><body><p><br/></p></body></html>"))
+        self.cancelButton.setToolTip(_translate("Dialog", "Exit without generating any new frames."))
+        self.cancelButton.setText(_translate("Dialog", "Cancel"))
+        self.MainTitle_1.setText(_translate("Dialog", "Bulk Entry of Frame Set Requirements"))
+
+
+# Written by compile_ui_forms.py, used by MultiOsUtil.load_ui_form
+FORM_CLASS_NAME = "Ui_Dialog"
+UI_SOURCE_SHA1 = "867f197819dcad86650bb9b5f40962299de2e03d"
@@ -0,0 +1,115 @@
+# One night of a multi-night campaign produced by CampaignPlanner: the night's session window
+# and the frames (from the master plan) assigned to it.
+from datetime import date, datetime, timedelta
+
+from BiasFrameSet import BiasFrameSet
+from DarkFrameSet import DarkFrameSet
+from DataModel import DataModel
+from EndDate import EndDate
+from EndTime import EndTime
+from FrameSet import FrameSet
+from SessionTimeInfo import SessionTimeInfo
+from StartDate import StartDate
+from StartTime import StartTime
+
+
+class CampaignNight:
+
+    def __init__(self, night_date: date,
+                 start_date_time: datetime,  # Local time, as DataModel uses
+                 end_date_time: datetime,
+                 capacity_seconds: float):  # Time available for frames, after session overhead
+        self._night_date: date = night_date
+        self._start_date_time: datetime = start_date_time
+        self._end_date_time: datetime = end_date_time
+        self._capacity_seconds: float = capacity_seconds
+        self._planned_seconds: float = 0
+        # Assignments as a list of [master plan index, frame set, number of frames]
+        self._allocations: [] = []
+
+    # Getters
+    def get_night_date(self) -> date:
+        return self._night_date
+
+    def get_start_date_time(self) -> datetime:
+        return self._start_date_time
+
+    def get_end_date_time(self) -> datetime:
+        return self._end_date_time
+
+    def get_capacity_seconds(self) -> float:
+        return self._capacity_seconds
+
+    def get_planned_seconds(self) -> float:
+        return self._planned_seconds
+
+    def get_remaining_seconds(self) -> float:
+        return self._capacity_seconds - self._planned_seconds
+
+    def get_allocations(self) -> []:
+        return self._allocations
+
+    # Record that some frames from the given master-plan frame set are to be taken this night.
+    # Frames of the same set assigned in pieces are merged into one allocation.
+    def allocate(self, plan_index: int, frame_set: FrameSet, number_of_frames: int, seconds_per_frame: float):
+        """Assign frames from a master plan frame set to this night"""
+        assert number_of_frames > 0
+        for allocation in self._allocations:
+            if allocation[0] == plan_index:
+                allocation[2] += number_of_frames
+                break
+        else:
+            self._allocations.append([plan_index, frame_set, number_of_frames])
+            self._allocations.sort(key=lambda a: a[0])  # Keep the master plan's order
+        self._planned_seconds += number_of_frames * seconds_per_frame
+
+    # The frame sets to acquire this night, as new FrameSet objects with nothing complete.
+    # This is the frame set list SessionThreadWorker takes.
+    def get_frame_sets(self) -> [FrameSet]:
+        """Make the list of frame sets to be acquired on this night"""
+        result: [FrameSet] = []
+        for (_, frame_set, number_of_frames) in self._allocations:
+            if isinstance(frame_set, BiasFrameSet):
+                result.append(BiasFrameSet(number_of_frames=number_of_frames,
+                                           binning=frame_set.get_binning(), number_complete=0))
+            else:
+                assert isinstance(frame_set, DarkFrameSet)
+                result.append(DarkFrameSet(number_of_frames=number_of_frames,
+                                           exposure=frame_set.get_exposure_seconds(),
+                                           binning=frame_set.get_binning(), number_complete=0))
+        return result
+
+    def get_number_of_frames(self) -> int:
+        return sum(allocation[2] for allocation in self._allocations)
+
+    # Session start and end information for this night, as SessionThreadWorker takes it
+    def get_session_time_info(self) -> SessionTimeInfo:
+        """Make the session start and end time description for this night"""
+        return SessionTimeInfo(False, self._start_date_time, False, self._end_date_time)
+
+    # Make a complete plan (data model) for this night, with the location, server, and temperature
+    # settings of the given master plan, that can be saved and run as an ordinary session.
+    # Start and end are given as times to the minute, rounded inward so the session stays in the window.
+    def make_data_model(self, master_model: DataModel) -> DataModel:
+        """Make a stand-alone data model for this night's session"""
+        night_model = DataModel()
+        night_model.load_from_model(master_model)
+        night_model.set_saved_frame_sets(self.get_frame_sets())
+
+        start = self._start_date_time
+        if start.second > 0 or start.microsecond > 0:
+            start = start.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        end = self._end_date_time.replace(second=0, microsecond=0)
+        night_model.set_start_date_type(StartDate.GIVEN_DATE)
+        night_model.set_given_start_date(f"{start.year}-{start.month}-{start.day}")
+        night_model.set_start_time_type(StartTime.GIVEN_TIME)
+        night_model.set_given_start_time(start.strftime("%H:%M"))
+        night_model.set_end_date_type(EndDate.GIVEN_DATE)
+        night_model.set_given_end_date(f"{end.year}-{end.month}-{end.day}")
+        night_model.set_end_time_type(EndTime.GIVEN_TIME)
+        night_model.set_given_end_time(end.strftime("%H:%M"))
+        return night_model
+
+    def __str__(self):
+        return f"CampaignNight<{self._night_date}: {self.get_number_of_frames()} frames, " \
+               + f"{round(self._planned_seconds)} of {round(self._capacity_seconds)} seconds>"
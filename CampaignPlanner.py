@@ -0,0 +1,116 @@
+# Split the frame plan of a data model across as few nights as possible.
+# Each night's dark window comes from the model's start and end time settings (via DataModel.calc_night_windows),
+# less an allowance for the session's own overhead (cooling, measuring download times).  Frames are then packed
+# into the nights in date order; a frame set may be split across nights.  The result is a list of CampaignNight
+# objects, each of which can produce a stand-alone plan that an ordinary session runs.
+import os
+from datetime import date
+from math import isnan, floor
+
+from CampaignNight import CampaignNight
+from DarkFrameSet import DarkFrameSet
+from DataModel import DataModel
+from FrameSet import FrameSet
+from tracelog import *
+
+
+class CampaignPlanner:
+    # Estimated download seconds by binning, used when measured values aren't given
+    DEFAULT_DOWNLOAD_SECONDS: {int: float} = {1: 20.0, 2: 8.0, 3: 5.0, 4: 4.0}
+    FALLBACK_DOWNLOAD_SECONDS: float = 20.0  # For a binning not in the table
+    FRAME_OVERHEAD_SECONDS: float = 2.0  # Commands and status polling around each frame
+    PLAN_FILE_EXTENSION = ".ewho2"  # Same as MainWindow.SAVED_FILE_EXTENSION
+
+    def __init__(self, data_model: DataModel,
+                 download_seconds: {int: float} = None,
+                 cooling_allowance_seconds: float = None):  # Default: the model's max cooling wait, if regulated
+        self._data_model: DataModel = data_model
+        self._download_seconds: {int: float} = dict(CampaignPlanner.DEFAULT_DOWNLOAD_SECONDS)
+        if download_seconds is not None:
+            self._download_seconds.update(download_seconds)
+        if cooling_allowance_seconds is None:
+            cooling_allowance_seconds = data_model.get_max_cooling_wait_time() \
+                if data_model.get_temperature_regulated() else 0
+        self._cooling_allowance_seconds: float = cooling_allowance_seconds
+
+    def get_download_seconds(self, binning: int) -> float:
+        return self._download_seconds.get(binning, CampaignPlanner.FALLBACK_DOWNLOAD_SECONDS)
+
+    # Estimated time to acquire one frame of the given set: exposure, download, and overhead.
+    # SessionThreadWorker estimates a frame as exposure plus the download time it measured for the binning at
+    # the start of the session; with no measurement yet, the planner uses its own download table (unless
+    # measured times are given) and adds FRAME_OVERHEAD_SECONDS, erring toward fewer frames per night.
+    def seconds_per_frame(self, frame_set: FrameSet) -> float:
+        """Estimate the time to take one frame of the given frame set"""
+        exposure = frame_set.get_exposure_seconds() if isinstance(frame_set, DarkFrameSet) else 0.0
+        return exposure + self.get_download_seconds(frame_set.get_binning()) \
+            + CampaignPlanner.FRAME_OVERHEAD_SECONDS
+
+    # Time each night's session spends before acquiring frames: cooling, and a bias frame at each binning
+    # to measure download times.
+    def session_overhead_seconds(self, frame_sets: [FrameSet]) -> float:
+        """Estimate session time not available for acquiring frames"""
+        binnings = set(frame_set.get_binning() for frame_set in frame_sets)
+        return self._cooling_allowance_seconds + sum(self.get_download_seconds(b) for b in binnings)
+
+    # Assign the incomplete frames of the plan to nights in the given date range.
+    # Nights are filled in date order, each as fully as possible, which minimizes the number of nights used.
+    # Within a night, frame sets are packed longest-frame-first so the short frames are left to fill the
+    # gaps; the night's allocations are kept in master plan order so frames are acquired in that order.
+    # Nights with no dark window (e.g. twilight all night at high latitude) are skipped.
+    # Returns the nights used, and a list of [plan index, frame set, count] for frames that did not fit.
+    @tracelog
+    def plan(self, first_date: date, last_date: date) -> ([CampaignNight], []):
+        """Assign the plan's frames to as few nights as possible in a date range"""
+        remaining: [] = []  # [plan index, frame set, number still needed, seconds per frame]
+        for (index, frame_set) in enumerate(self._data_model.get_saved_frame_sets()):
+            number_needed = frame_set.get_number_of_frames() - frame_set.get_number_complete()
+            if number_needed > 0:
+                remaining.append([index, frame_set, number_needed, self.seconds_per_frame(frame_set)])
+        remaining.sort(key=lambda r: r[3], reverse=True)
+        overhead = self.session_overhead_seconds([r[1] for r in remaining])
+
+        nights: [CampaignNight] = []
+        windows = self._data_model.calc_night_windows(first_date, last_date)
+        for night_index in range(len(windows)):
+            if len(remaining) == 0:
+                break
+            window_seconds = float(windows.durations[night_index])
+            if isnan(window_seconds) or window_seconds <= overhead:
+                continue
+            night = CampaignNight(windows.dates[night_index].astype(date),
+                                  windows.get_local_start(night_index),
+                                  windows.get_local_end(night_index),
+                                  window_seconds - overhead)
+            for entry in remaining:
+                (plan_index, frame_set, number_needed, seconds_per_frame) = entry
+                number_fitting = min(number_needed, floor(night.get_remaining_seconds() / seconds_per_frame))
+                if number_fitting > 0:
+                    night.allocate(plan_index, frame_set, number_fitting, seconds_per_frame)
+                    entry[2] -= number_fitting
+            remaining = [entry for entry in remaining if entry[2] > 0]
+            if night.get_number_of_frames() > 0:
+                nights.append(night)
+
+        leftovers = sorted([[r[0], r[1], r[2]] for r in remaining], key=lambda r: r[0])
+        return nights, leftovers
+
+    # Write a plan file for each night, named from the given base path and the night's date,
+    # e.g. "darks.ewho2" becomes "darks-night-2026-10-19.ewho2".
+    # Returns success, the list of files written, and an error message
+    @tracelog
+    def write_night_plans(self, nights: [CampaignNight], base_file_path: str) -> (bool, [str], str):
+        """Write a stand-alone plan file for each night of a campaign"""
+        (root, extension) = os.path.splitext(base_file_path)
+        if extension == "":
+            extension = CampaignPlanner.PLAN_FILE_EXTENSION
+        files_written: [str] = []
+        for night in nights:
+            file_name = f"{root}-night-{night.get_night_date().isoformat()}{extension}"
+            try:
+                with open(file_name, "w") as night_file:
+                    night_file.write(night.make_data_model(self._data_model).serialize_to_json())
+                files_written.append(file_name)
+            except OSError as error:
+                return False, files_written, f"Unable to write \"{file_name}\": {error}"
+        return True, files_written, ""
@@ -0,0 +1,111 @@
+# Data model for the session console list view.
+# Only the most recent lines (up to a capacity from the settings) are kept for display, so a long
+# session doesn't grow memory and repaint cost without limit; every line is also written to a log
+# file if one has been started.
+# Lines added during one pass of the event loop are collected and added to the list together, when
+# control returns to the event loop, and the linesAppended signal (used to scroll to the bottom) is
+# emitted once for the whole batch.
+from collections import deque
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QVariant, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
+
+from SettingsCache import SettingsCache
+
+
+class ConsoleListModel(QAbstractListModel):
+
+    linesAppended = pyqtSignal()  # A batch of lines has been added at the bottom
+
+    def __init__(self, capacity: int = None):
+        QAbstractListModel.__init__(self)
+        self._capacity: int = capacity if capacity is not None else SettingsCache.instance().get_console_capacity()
+        self._lines: deque = deque()
+        self._pending_lines: [str] = []
+        self._flush_scheduled: bool = False
+        self._log_file = None
+        self._font: QFont = QFont()
+        self._font.setPointSize(SettingsCache.instance().get_standard_font_size())
+        SettingsCache.instance().settingChanged.connect(self.setting_changed)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self._lines)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return self._lines[index.row()]
+        elif role == Qt.FontRole:
+            return self._font
+        else:
+            return QVariant()
+
+    def get_capacity(self) -> int:
+        return self._capacity
+
+    # Add a line at the bottom.  It appears when control returns to the event loop.
+    def add_line(self, line: str):
+        """Queue a line to be added to the console"""
+        self._pending_lines.append(line)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self.flush_pending_lines)
+
+    # Add the queued lines to the list in one batch, first removing the oldest lines if
+    # necessary to stay within the capacity.
+    def flush_pending_lines(self):
+        """Add all the queued lines to the console"""
+        self._flush_scheduled = False
+        new_lines = self._pending_lines
+        self._pending_lines = []
+        if len(new_lines) == 0:
+            return
+        if self._log_file is not None:
+            self._log_file.write("".join(line + "\n" for line in new_lines))
+            self._log_file.flush()
+
+        new_lines = new_lines[-self._capacity:]
+        number_to_remove = min(len(self._lines) + len(new_lines) - self._capacity, len(self._lines))
+        if number_to_remove > 0:
+            self.beginRemoveRows(QModelIndex(), 0, number_to_remove - 1)
+            for _ in range(number_to_remove):
+                self._lines.popleft()
+            self.endRemoveRows()
+        first_new_row = len(self._lines)
+        self.beginInsertRows(QModelIndex(), first_new_row, first_new_row + len(new_lines) - 1)
+        self._lines.extend(new_lines)
+        self.endInsertRows()
+        self.linesAppended.emit()
+
+    # Start writing all console lines to the given file (appending if it exists).
+    # Return success and an error message
+    def start_log_file(self, file_path: str) -> (bool, str):
+        """Begin copying console lines to a log file"""
+        self.stop_log_file()
+        try:
+            self._log_file = open(file_path, "a")
+        except OSError as error:
+            return False, str(error)
+        return True, ""
+
+    def stop_log_file(self):
+        """Stop copying console lines to the log file, first writing any that are queued"""
+        if self._log_file is not None:
+            self.flush_pending_lines()
+            self._log_file.close()
+            self._log_file = None
+
+    def setting_changed(self, key: str):
+        """Receive notice of a changed setting; redraw in the new font, or trim to the new capacity"""
+        if key == SettingsCache.CONSOLE_CAPACITY_SETTING:
+            self._capacity = SettingsCache.instance().get_console_capacity()
+            number_to_remove = len(self._lines) - self._capacity
+            if number_to_remove > 0:
+                self.beginRemoveRows(QModelIndex(), 0, number_to_remove - 1)
+                for _ in range(number_to_remove):
+                    self._lines.popleft()
+                self.endRemoveRows()
+        elif key == SettingsCache.STANDARD_FONT_SIZE_SETTING:
+            self._font = QFont()
+            self._font.setPointSize(SettingsCache.instance().get_standard_font_size())
+            if len(self._lines) > 0:
+                self.dataChanged.emit(self.index(0), self.index(len(self._lines) - 1), [Qt.FontRole])
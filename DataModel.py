@@ -1,11 +1,9 @@
 import json
-from datetime import date, datetime, timedelta, time, MAXYEAR
+from datetime import date, datetime, timedelta, time, timezone, MAXYEAR
 from json import JSONDecodeError
 from time import strptime, mktime
 from typing import Optional
 
-import ephem
-
 from BiasFrameSet import BiasFrameSet
 from CameraCoolingInfo import CameraCoolingInfo
 from DarkFrameSet import DarkFrameSet
@@ -14,6 +12,8 @@ from DataModelEncoder import DataModelEncoder
 from EndDate import EndDate
 from EndTime import EndTime
 from FrameSet import FrameSet
+from RealClock import RealClock
+from SessionClock import SessionClock
 from SessionTimeInfo import SessionTimeInfo
 from StartDate import StartDate
 from StartTime import StartTime
@@ -378,7 +378,8 @@ class DataModel:
         # print("sessionReadyToRun")
         address_known = len(self._netAddress.strip()) > 0
         port_known = len(self._portNumber.strip()) > 0
-        some_framesets_needed = len(self.get_incomplete_framesets()) > 0
+        some_framesets_needed = any(fs.get_number_of_frames() > fs.get_number_complete()
+                                    for fs in self._savedFrameSets)
         return address_known & port_known & some_framesets_needed
 
     # Get list of frameSets where # wanted > numberComplete
@@ -419,6 +420,35 @@ class DataModel:
         self._savedFrameSets.insert(at_index, new_frame_set)
         # print(f"insertFrameSet({at_index}) exits.  Number = {len(self._savedFrameSets)}")
 
+    # Insert a batch of framesets at the given position, or at the end if no position given
+    @tracelog
+    def insert_frame_sets(self, new_frame_sets: [FrameSet], at_index: int = None) -> None:
+        """Insert several frame sets, in order, into the frame sets list"""
+        if at_index is None:
+            at_index = len(self._savedFrameSets)
+        self._savedFrameSets[at_index:at_index] = new_frame_sets
+
+    # Delete the framesets at the given indices (in any order)
+    @tracelog
+    def delete_frame_sets(self, indices: [int]) -> None:
+        """Delete several frame sets from the frame sets list"""
+        for index in sorted(set(indices), reverse=True):
+            assert 0 <= index < len(self._savedFrameSets)
+            del self._savedFrameSets[index]
+
+    # Move the framesets at the given indices up (offset -1) or down (offset +1) one place each.
+    # Each moves past the unselected frame set next to it, so a block of adjacent rows moves together.
+    # Return the new indices of the moved frame sets.
+    @tracelog
+    def move_frame_sets(self, indices: [int], offset: int) -> [int]:
+        """Move several frame sets one place up or down in the frame sets list"""
+        assert offset in (-1, +1)
+        frame_sets = self._savedFrameSets
+        for index in sorted(indices, reverse=(offset > 0)):
+            assert 0 <= index + offset < len(frame_sets)
+            frame_sets[index], frame_sets[index + offset] = frame_sets[index + offset], frame_sets[index]
+        return [index + offset for index in indices]
+
     # Generate a (probably large) list of FrameSets with the given specifications
     #   - a number of bias frames at each of the given binnings
     #   - a number of dark frames at each combination of given binnings and exposures
@@ -468,6 +498,7 @@ class DataModel:
         (year, month, day) = self.interpret_start_date(start_date_type, given_start_date)
         # print(f"   Using date: {year},{month},{day}")
         observer = self.get_observer(year, month, day, self.NAVAL_OBSERVATORY_HORIZON)
+        import ephem
         sun = ephem.Sun()
         sunset_utc = observer.next_setting(sun)
         sunset_local_time = ephem.localtime(sunset_utc).time()
@@ -486,6 +517,7 @@ class DataModel:
         (year, month, day) = self.interpret_end_date(end_date_type, given_end_date)
 
         observer = self.get_observer(year, month, day, self.NAVAL_OBSERVATORY_HORIZON)
+        import ephem
         sun = ephem.Sun()
         sunrise_utc = observer.next_rising(sun)
         sunrise_local_time = ephem.localtime(sunrise_utc).time()
@@ -525,6 +557,7 @@ class DataModel:
         (year, month, day) = self.interpret_start_date(start_date_type, given_start_date)
 
         observer = self.get_observer(year, month, day, self.CIVIL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         dusk_utc = observer.next_setting(sun, use_center=True)
         dusk_local_time = ephem.localtime(dusk_utc).time()
@@ -551,6 +584,7 @@ class DataModel:
         (year, month, day) = self.interpret_start_date(start_date_type, given_start_date)
 
         observer = self.get_observer(year, month, day, self.NAUTICAL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         dusk_utc = observer.next_setting(sun, use_center=True)
         dusk_local_time = ephem.localtime(dusk_utc).time()
@@ -564,6 +598,7 @@ class DataModel:
         (year, month, day) = self.interpret_start_date(start_date_type, given_start_date)
 
         observer = self.get_observer(year, month, day, self.ASTRONOMICAL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         dusk_utc = observer.next_setting(sun, use_center=True)
         dusk_local_time = ephem.localtime(dusk_utc).time()
@@ -579,6 +614,7 @@ class DataModel:
         (year, month, day) = self.interpret_end_date(end_date_type, given_end_date)
 
         observer = self.get_observer(year, month, day, self.CIVIL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         sunrise_utc = observer.next_rising(sun)
         sunrise_local_time = ephem.localtime(sunrise_utc).time()
@@ -604,6 +640,7 @@ class DataModel:
         (year, month, day) = self.interpret_end_date(end_date_type, given_end_date)
 
         observer = self.get_observer(year, month, day, self.NAUTICAL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         sunrise_utc = observer.next_rising(sun)
         sunrise_local_time = ephem.localtime(sunrise_utc).time()
@@ -629,6 +666,7 @@ class DataModel:
         (year, month, day) = self.interpret_end_date(end_date_type, given_end_date)
 
         observer = self.get_observer(year, month, day, self.ASTRONOMICAL_TWILIGHT_HORIZON)
+        import ephem
         sun = ephem.Sun()
         sunrise_utc = observer.next_rising(sun)
         sunrise_local_time = ephem.localtime(sunrise_utc).time()
@@ -645,6 +683,44 @@ class DataModel:
             # print(f"   Adjusted Astronomical dawn: {sunrise_local_time}")
         return sunrise_local_time
 
+    # Calculate the session window (start and end time, per this model's start and end time types)
+    # for every night in a date range, in one vectorized calculation rather than a loop over the
+    # calc_* methods above.  Given (clock) start and end times are taken as local time on the
+    # evening of each date and, for end times before noon, the following morning.
+    @tracelog
+    def calc_night_windows(self, first_date: date, last_date: date):
+        """Calculate nightly session windows for a range of dates"""
+        from TwilightTable import TwilightTable
+        from NightWindows import NightWindows
+        assert self.can_calculate_sunrise()
+        table = TwilightTable(self.get_latitude(), self.get_longitude())
+        start_type = self.get_start_time_type()
+        end_type = self.get_end_time_type()
+        windows = table.night_windows(first_date, last_date,
+                                      start_type if start_type != StartTime.GIVEN_TIME else StartTime.SUNSET,
+                                      end_type if end_type != EndTime.GIVEN_TIME else EndTime.SUNRISE)
+        if start_type == StartTime.GIVEN_TIME or end_type == EndTime.GIVEN_TIME:
+            starts = windows.starts.copy()
+            ends = windows.ends.copy()
+            given_start = datetime.strptime(self.get_given_start_time(), "%H:%M").time()
+            given_end = datetime.strptime(self.get_given_end_time(), "%H:%M").time()
+            end_day_offset = timedelta(days=1) if given_end < time(12, 0) else timedelta(days=0)
+            for index in range(len(windows)):
+                night: date = windows.dates[index].astype(date)
+                if start_type == StartTime.GIVEN_TIME:
+                    starts[index] = self.local_to_utc64(datetime.combine(night, given_start))
+                if end_type == EndTime.GIVEN_TIME:
+                    ends[index] = self.local_to_utc64(datetime.combine(night + end_day_offset, given_end))
+            windows = NightWindows(windows.dates, starts, ends)
+        return windows
+
+    @staticmethod
+    def local_to_utc64(local_date_time: datetime):
+        """Convert a naive local datetime to a UTC numpy datetime64"""
+        import numpy
+        utc_date_time = local_date_time.astimezone(timezone.utc).replace(tzinfo=None)
+        return numpy.datetime64(utc_date_time, "s")
+
     # Produce a JSON serialization of this data model for writing to a file
     @tracelog
     def serialize_to_json(self) -> str:
@@ -712,13 +788,15 @@ class DataModel:
     #      If "when done", record that as boolean flag.
     #      Otherwise, use specified date and time.
     #      If date & time is  earlier than the start date & time, advance one day
+    #  "Now" and "today" come from the given clock (e.g. a simulation's virtual clock), or the real clock.
 
     @tracelog
-    def get_session_time_info(self) -> SessionTimeInfo:
+    def get_session_time_info(self, clock: SessionClock = None) -> SessionTimeInfo:
         """Create complete description of session start/end parameters"""
         # First, start time
-        today: date = date.today()
-        right_now: time = datetime.now().time()
+        now: datetime = (clock if clock is not None else RealClock()).now()
+        today: date = now.date()
+        right_now: time = now.time()
         _start_date_type = self.get_start_date_type()
         if _start_date_type == StartDate.NOW:
             start_now = True
@@ -734,8 +812,7 @@ class DataModel:
             start_date = self.parse_date(self.get_given_start_date())
             start_time = self.appropriate_start_time()
         if not start_now:
-            _current_time_localized = datetime.now().time()
-            if (start_date == today) and (start_time < _current_time_localized):
+            if (start_date == today) and (start_time < right_now):
                 print("Missed start time, start now")
                 # We've missed the start time, just start now
                 start_now = True
@@ -858,7 +935,10 @@ class DataModel:
                                  self._temperatureAbortRiseLimit,
                                  self._warmUpWhenDone, self._warmUpWhenDoneSecs)
 
-    def get_observer(self, year: int, month: int, day: int, horizon: str) -> ephem.Observer:
+    # ephem is imported inside the methods that use it, not at the top of this module,
+    # so that loading the program (or a plan file) doesn't wait for it
+    def get_observer(self, year: int, month: int, day: int, horizon: str) -> "ephem.Observer":
+        import ephem
         result = ephem.Observer()
         result.lat = str(self.get_latitude())
         result.lon = str(self.get_longitude())
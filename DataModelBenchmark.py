@@ -0,0 +1,180 @@
+# Micro-benchmarks of the DataModel operations whose cost grows with the plan, or that are run often:
+# saving and loading plans, Bulk Add's frame set generation, finding the incomplete frame sets, and the
+# session time and twilight calculations.  Plans of each size are generated from a seed, so a run can be
+# repeated exactly.  For each operation it reports the best and mean time over several repeats, and the
+# peak memory allocated while it runs (measured in a separate, untimed run, since tracemalloc slows things).
+import json
+import os
+import random
+import tempfile
+import tracemalloc
+from datetime import date, datetime, timedelta
+from time import perf_counter
+
+from BiasFrameSet import BiasFrameSet
+from DarkFrameSet import DarkFrameSet
+from DataModel import DataModel
+from DataModelDecoder import DataModelDecoder
+from EndDate import EndDate
+from EndTime import EndTime
+from FrameSet import FrameSet
+from SessionBenchmark import SessionBenchmark
+from StartDate import StartDate
+from StartTime import StartTime
+from tracelog import *
+
+
+class DataModelBenchmark:
+    REPORT_FORMAT_VERSION = 1
+    DEFAULT_SIZES = (10, 100, 1000, 10000, 100000)  # Frame sets in the synthetic plans
+    DEFAULT_REPEATS = 3
+    EXPOSURES = (1, 2, 5, 10, 15, 30, 60, 90, 120, 180, 240, 300, 450, 600, 900, 1200)
+    # Bulk Add cross products: (bias binnings, dark binnings, number of dark exposures)
+    GENERATE_SIZES = ((4, 4, 25), (4, 4, 250), (4, 4, 2500), (4, 4, 25000))
+    CALC_DATE = date(2026, 6, 21)  # Twilight calculations are for this date, so runs are comparable
+    NIGHT_WINDOW_DAYS = 366
+    LATITUDE = 45.0
+    LONGITUDE = -75.0
+    TIME_ZONE = -5
+
+    def __init__(self, seed: int = 1, sizes: [int] = DEFAULT_SIZES, repeats: int = DEFAULT_REPEATS):
+        self._seed: int = seed
+        self._sizes: [int] = list(sizes)
+        self._repeats: int = repeats
+
+    # A plan with the given number of frame sets, random but the same every time for a given seed and size
+    def make_plan(self, size: int) -> DataModel:
+        """Generate a reproducible synthetic plan"""
+        generator = random.Random(f"{self._seed}-{size}")
+        frame_sets: [FrameSet] = []
+        for _ in range(size):
+            number_of_frames = generator.randint(1, 64)
+            number_complete = generator.choice((0, 0, number_of_frames, generator.randint(0, number_of_frames)))
+            binning = generator.randint(1, 4)
+            if generator.random() < 0.2:
+                frame_sets.append(BiasFrameSet(number_of_frames, binning, number_complete))
+            else:
+                frame_sets.append(DarkFrameSet(number_of_frames, generator.choice(DataModelBenchmark.EXPOSURES),
+                                               binning, number_complete))
+        data_model = self.make_located_model()
+        data_model.set_saved_frame_sets(frame_sets)
+        return data_model
+
+    # An empty plan with a fixed location and twilight-based start and end, so the time calculations
+    # don't depend on the saved preferences
+    @staticmethod
+    def make_located_model() -> DataModel:
+        data_model = DataModel()
+        data_model.set_latitude(DataModelBenchmark.LATITUDE)
+        data_model.set_longitude(DataModelBenchmark.LONGITUDE)
+        data_model.set_time_zone(DataModelBenchmark.TIME_ZONE)
+        data_model.set_start_date_type(StartDate.TODAY)
+        data_model.set_start_time_type(StartTime.CIVIL_DUSK)
+        data_model.set_end_date_type(EndDate.TODAY_TOMORROW)
+        data_model.set_end_time_type(EndTime.CIVIL_DAWN)
+        return data_model
+
+    # Time an operation.  "prepare" (if given) is called before each run, untimed, and its result is passed
+    # to the operation - for operations that consume their input.
+    def measure(self, operation_name: str, size: int, operation, prepare=None) -> {str: object}:
+        """Time an operation over the repeats, then measure its peak memory"""
+        times = []
+        for _ in range(self._repeats):
+            argument = prepare() if prepare is not None else None
+            started = perf_counter()
+            operation(argument)
+            times.append(perf_counter() - started)
+        argument = prepare() if prepare is not None else None
+        tracemalloc.start()
+        operation(argument)
+        (_, peak_bytes) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return {"operation": operation_name,
+                "size": size,
+                "best_seconds": round(min(times), 6),
+                "mean_seconds": round(sum(times) / len(times), 6),
+                "peak_bytes": peak_bytes}
+
+    # The operations whose cost depends on the number of frame sets, on a plan of the given size
+    def measure_plan_operations(self, size: int) -> [{str: object}]:
+        data_model = self.make_plan(size)
+        serialized = data_model.serialize_to_json()
+        results = [self.measure("serialize_to_json", size, lambda _: data_model.serialize_to_json()),
+                   self.measure("get_incomplete_framesets", size, lambda _: data_model.get_incomplete_framesets()),
+                   self.measure("update_from_loaded_json", size,
+                                lambda loaded: DataModel().update_from_loaded_json(loaded),
+                                prepare=lambda: json.loads(serialized, cls=DataModelDecoder))]
+        (file_descriptor, file_path) = tempfile.mkstemp(suffix=".ewho2")
+        try:
+            with os.fdopen(file_descriptor, "w") as plan_file:
+                plan_file.write(serialized)
+            results.append(self.measure("make_from_file_named", size,
+                                        lambda _: DataModel.make_from_file_named(file_path)))
+        finally:
+            os.remove(file_path)
+        return results
+
+    # Bulk Add's generation of every combination of binnings and exposures
+    def measure_generate_frame_sets(self) -> [{str: object}]:
+        results = []
+        for (bias_binnings, dark_binnings, exposures) in DataModelBenchmark.GENERATE_SIZES:
+            bias_binning_list = list(range(1, bias_binnings + 1))
+            dark_binning_list = list(range(1, dark_binnings + 1))
+            exposure_list = [float(exposure) for exposure in range(1, exposures + 1)]
+            size = bias_binnings + dark_binnings * exposures
+            results.append(self.measure("generate_frame_sets", size,
+                                        lambda _: DataModel.generate_frame_sets(16, bias_binning_list,
+                                                                                16, dark_binning_list,
+                                                                                exposure_list)))
+        return results
+
+    # The session time and twilight calculations, which don't depend on the plan's size
+    def measure_time_calculations(self) -> [{str: object}]:
+        data_model = self.make_located_model()
+        calc_date = DataModelBenchmark.CALC_DATE
+        results = [self.measure("get_session_time_info", 0, lambda _: data_model.get_session_time_info())]
+        for (name, date_type) in (("calc_sunset", StartDate.GIVEN_DATE),
+                                  ("calc_civil_dusk", StartDate.GIVEN_DATE),
+                                  ("calc_nautical_dusk", StartDate.GIVEN_DATE),
+                                  ("calc_astronomical_dusk", StartDate.GIVEN_DATE),
+                                  ("calc_sunrise", EndDate.GIVEN_DATE),
+                                  ("calc_civil_dawn", EndDate.GIVEN_DATE),
+                                  ("calc_nautical_dawn", EndDate.GIVEN_DATE),
+                                  ("calc_astronomical_dawn", EndDate.GIVEN_DATE)):
+            calc_method = getattr(data_model, name)
+            results.append(self.measure(name, 0,
+                                        lambda _, method=calc_method, kind=date_type: method(kind, calc_date)))
+        last_date = calc_date + timedelta(days=DataModelBenchmark.NIGHT_WINDOW_DAYS - 1)
+        results.append(self.measure("calc_night_windows", DataModelBenchmark.NIGHT_WINDOW_DAYS,
+                                    lambda _: data_model.calc_night_windows(calc_date, last_date)))
+        return results
+
+    @tracelog
+    def run(self) -> {str: object}:
+        """Run all the benchmarks and collect their results in a report"""
+        results = []
+        for size in self._sizes:
+            results.extend(self.measure_plan_operations(size))
+        results.extend(self.measure_generate_frame_sets())
+        results.extend(self.measure_time_calculations())
+        return {"report_format": DataModelBenchmark.REPORT_FORMAT_VERSION,
+                "program_version": SessionBenchmark.program_version(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "settings": {"seed": self._seed, "sizes": self._sizes, "repeats": self._repeats},
+                "results": results}
+
+    # Lines comparing each operation's best time and peak memory with an earlier report
+    @staticmethod
+    def compare_reports(earlier: {str: object}, later: {str: object}) -> [str]:
+        """Describe the changes in each operation's time and memory between two reports"""
+        earlier_results = {(result["operation"], result["size"]): result for result in earlier["results"]}
+        lines = []
+        for result in later["results"]:
+            before = earlier_results.get((result["operation"], result["size"]))
+            if before is None:
+                continue
+            time_ratio = result["best_seconds"] / before["best_seconds"] if before["best_seconds"] > 0 else 1.0
+            memory_ratio = result["peak_bytes"] / before["peak_bytes"] if before["peak_bytes"] > 0 else 1.0
+            lines.append(f"{result['operation']:26} {result['size']:7}  time x{time_ratio:5.2f}  "
+                         f"memory x{memory_ratio:5.2f}")
+        return lines
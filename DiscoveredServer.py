@@ -0,0 +1,24 @@
+# One host found by ServerDiscovery: its address, how long it took to accept a connection on the
+# TheSkyX port, and whether it answered a script the way TheSkyX does (and how quickly).
+from tracelog import *
+
+
+class DiscoveredServer:
+
+    def __init__(self, address: str, connect_seconds: float):
+        self.address: str = address
+        self.connect_seconds: float = connect_seconds
+        self.is_theskyx: bool = False  # Answered the probe script with a TheSkyX reply
+        self.round_trip_seconds: float = None  # From sending the probe to the end of the reply
+        self.message: str = ""  # Why it isn't thought to be TheSkyX, if it isn't
+
+    # Better servers first: those that answered as TheSkyX, then the quickest
+    def sort_key(self) -> (bool, float):
+        return (not self.is_theskyx,
+                self.round_trip_seconds if self.round_trip_seconds is not None else self.connect_seconds)
+
+    # For a list, e.g. "192.168.1.20  (TheSkyX, 12 ms)"
+    def __str__(self) -> str:
+        if self.is_theskyx:
+            return f"{self.address}  (TheSkyX, {self.round_trip_seconds * 1000:.0f} ms)"
+        return f"{self.address}  (port open, {self.message})"
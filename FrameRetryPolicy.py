@@ -0,0 +1,79 @@
+# What the session does when a frame fails, by the kind of failure: take the frame again (up to some number
+# of times), skip the rest of its frame set, or abort the session.  A frame that has used up its retries
+# gets the rule's fallback: skip or abort.
+# As text (for the preferences and the command line) the rules are e.g. "start=retry:2:skip,timeout=abort":
+# each kind of failure with its action and, for "retry", the number of retries and the fallback (abort if
+# not given).  Kinds not mentioned keep their default rules.
+# Failures with no rule here, such as losing TheSkyX for longer than the reconnect time, abort the session.
+from tracelog import *
+
+
+class FrameRetryPolicy:
+    # Kinds of failure
+    START_FAILED = "start"  # The camera wouldn't start the exposure
+    CAMERA_ERROR = "camera"  # The camera reported an error during the exposure (e.g. it was aborted in TheSkyX)
+    COMPLETION_TIMEOUT = "timeout"  # The camera didn't report the exposure complete in time
+    FAILURE_KINDS = (START_FAILED, CAMERA_ERROR, COMPLETION_TIMEOUT)
+    # Actions
+    RETRY = "retry"
+    SKIP = "skip"
+    ABORT = "abort"
+    FALLBACK_ACTIONS = (SKIP, ABORT)
+    DEFAULT_TEXT = "start=retry:2:skip,camera=retry:2:skip,timeout=retry:1:skip"
+
+    def __init__(self, rules: {str: (str, int, str)} = None):  # Kind -> (action, retries, fallback)
+        self._rules: {str: (str, int, str)} = {kind: (FrameRetryPolicy.RETRY, 2, FrameRetryPolicy.SKIP)
+                                               for kind in FrameRetryPolicy.FAILURE_KINDS}
+        self._rules[FrameRetryPolicy.COMPLETION_TIMEOUT] = (FrameRetryPolicy.RETRY, 1, FrameRetryPolicy.SKIP)
+        if rules is not None:
+            self._rules.update(rules)
+
+    # A policy from its text form.  Return the policy (None if the text is invalid) and an error message
+    @staticmethod
+    def parse(text: str):
+        """Make a retry policy from rules such as start=retry:2:skip,timeout=abort"""
+        rules: {str: (str, int, str)} = {}
+        for rule_text in text.split(","):
+            rule_text = rule_text.strip()
+            if rule_text == "":
+                continue
+            (kind, _, action_text) = rule_text.partition("=")
+            kind = kind.strip()
+            if kind not in FrameRetryPolicy.FAILURE_KINDS:
+                return None, f"Unknown kind of failure \"{kind}\" (expected one of " \
+                    + ", ".join(FrameRetryPolicy.FAILURE_KINDS) + ")"
+            parts = [part.strip() for part in action_text.split(":")]
+            if parts[0] in FrameRetryPolicy.FALLBACK_ACTIONS and len(parts) == 1:
+                rules[kind] = (parts[0], 0, parts[0])
+            elif parts[0] == FrameRetryPolicy.RETRY and len(parts) in (2, 3) and parts[1].isdigit() \
+                    and (len(parts) == 2 or parts[2] in FrameRetryPolicy.FALLBACK_ACTIONS):
+                rules[kind] = (FrameRetryPolicy.RETRY, int(parts[1]),
+                               parts[2] if len(parts) == 3 else FrameRetryPolicy.ABORT)
+            else:
+                return None, f"Invalid rule \"{rule_text}\" (expected e.g. {kind}=retry:2:skip or {kind}=abort)"
+        return FrameRetryPolicy(rules), ""
+
+    def as_text(self) -> str:
+        """Describe the policy in the form parse reads"""
+        rule_texts = []
+        for kind in FrameRetryPolicy.FAILURE_KINDS:
+            (action, retries, fallback) = self._rules[kind]
+            rule_texts.append(f"{kind}={action}:{retries}:{fallback}" if action == FrameRetryPolicy.RETRY
+                              else f"{kind}={action}")
+        return ",".join(rule_texts)
+
+    # What to do about a failure of the given kind, when the frame has already been retried the given
+    # number of times
+    def action_for(self, failure_kind: str, retries_so_far: int) -> str:
+        """Decide whether to retry the frame, skip its frame set, or abort the session"""
+        if failure_kind not in self._rules:
+            return FrameRetryPolicy.ABORT
+        (action, retries, fallback) = self._rules[failure_kind]
+        if action == FrameRetryPolicy.RETRY:
+            return FrameRetryPolicy.RETRY if retries_so_far < retries else fallback
+        return action
+
+    # Number of retries a frame gets for a failure of the given kind
+    def retries_for(self, failure_kind: str) -> int:
+        (action, retries, _) = self._rules.get(failure_kind, (FrameRetryPolicy.ABORT, 0, FrameRetryPolicy.ABORT))
+        return retries if action == FrameRetryPolicy.RETRY else 0
@@ -1,30 +1,59 @@
-from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QVariant, Qt, QSettings
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QVariant, Qt
+from PyQt5.QtGui import QFont, QFontMetrics
 
 from FrameSet import FrameSet
-from MultiOsUtil import MultiOsUtil
+from SettingsCache import SettingsCache
 from tracelog import *
 
 
 class FrameSetPlanTableModel (QAbstractTableModel):
 
     _columnHeaders = (" # Frames ", " Type ", " Exposure ", " Binning ", " Complete ")
+    # Widest value expected in each column, used to size the columns without measuring every row
+    _columnSamples = ("99999", "Dark", "99999.9", "4 x 4", "99999")
+    FETCH_BATCH_SIZE = 500  # Rows given to the view at a time as it scrolls
+    COLUMN_PADDING = 16  # Pixels added to the measured column width
 
     # Constructor takes and keeps a pointer to the data model
+    # Cell strings are formatted once per row and kept in _row_cache (None until first displayed), which
+    # parallels the frame set list.  Anything that changes a frame set must go through this model, or
+    # call table_row_changed, so the cached row is discarded.
+    # The view is only told about the first _rows_fetched rows; it asks for more (fetchMore) as it is
+    # scrolled toward the end, so a very large plan doesn't have to be laid out all at once.
     def __init__(self, the_data_model):
         QAbstractTableModel.__init__(self)
         self._dataModel = the_data_model
+        self._row_cache: [tuple] = [None] * len(the_data_model.get_saved_frame_sets())
+        self._rows_fetched: int = min(len(self._row_cache), FrameSetPlanTableModel.FETCH_BATCH_SIZE)
+        self._cell_font: QFont = None
+        self._header_font: QFont = None
+        self.make_fonts()
+        SettingsCache.instance().settingChanged.connect(self.setting_changed)
 
     # Methods required by the parent data model
     #tracelog
     def rowCount(self, parent_model_index: QModelIndex) -> int:
         # print(f"rowCount({parent_model_index}")
-        return len(self._dataModel.get_saved_frame_sets())
+        return self._rows_fetched
 
     #tracelog
     def columnCount(self, parent_model_index) -> int:
         return FrameSet.NUMBER_OF_DISPLAY_FIELDS
 
+    def canFetchMore(self, parent_model_index: QModelIndex) -> bool:
+        return self._rows_fetched < len(self._row_cache)
+
+    def fetchMore(self, parent_model_index: QModelIndex):
+        self.fetch_through(self._rows_fetched + FrameSetPlanTableModel.FETCH_BATCH_SIZE - 1)
+
+    # Make sure the view has been told about all the rows up to the given one
+    def fetch_through(self, row_index: int):
+        last_row = min(row_index, len(self._row_cache) - 1)
+        if last_row >= self._rows_fetched:
+            self.beginInsertRows(QModelIndex(), self._rows_fetched, last_row)
+            self._rows_fetched = last_row + 1
+            self.endInsertRows()
+
     #tracelog
     def data(self, index: QModelIndex, role: Qt.DisplayRole):
         row_num: int = index.row()
@@ -32,14 +61,15 @@ class FrameSetPlanTableModel (QAbstractTableModel):
         # print(f"data(({row_num},{column_num}),{role})")
         if role == Qt.DisplayRole:
             assert((row_num >= 0) & (row_num < len(self._dataModel.get_saved_frame_sets())))
-            the_frame_set: FrameSet = self._dataModel.get_frame_set(row_num)
-            result: QVariant = QVariant(the_frame_set.fieldNumberAsString(column_num))
+            row_strings = self._row_cache[row_num]
+            if row_strings is None:
+                the_frame_set: FrameSet = self._dataModel.get_frame_set(row_num)
+                row_strings = tuple(the_frame_set.fieldNumberAsString(column)
+                                    for column in range(FrameSet.NUMBER_OF_DISPLAY_FIELDS))
+                self._row_cache[row_num] = row_strings
+            result: QVariant = QVariant(row_strings[column_num])
         elif role == Qt.FontRole:
-            settings = QSettings()
-            standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
-            font = QFont()
-            font.setPointSize(standard_font_size)
-            result = font
+            result = self._cell_font
         else:
             result = QVariant()
         return result
@@ -53,34 +83,142 @@ class FrameSetPlanTableModel (QAbstractTableModel):
                 assert((column_number >= 0) & (column_number < len(self._columnHeaders)))
                 result = self._columnHeaders[column_number]
             elif role == Qt.FontRole:
-                settings = QSettings()
-                standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
-                font = QFont()
-                font.setPointSize(standard_font_size)
-                font.setBold(True)
-                result = font
+                result = self._header_font
         return result
 
-    # Add a frameset to the end of the list in this model
+    # Width for each column, measured from the header and the widest expected value in the current fonts
+    def column_widths(self) -> [int]:
+        header_metrics = QFontMetrics(self._header_font)
+        cell_metrics = QFontMetrics(self._cell_font)
+        return [max(header_metrics.horizontalAdvance(header), cell_metrics.horizontalAdvance(sample))
+                + FrameSetPlanTableModel.COLUMN_PADDING
+                for (header, sample) in zip(self._columnHeaders, self._columnSamples)]
+
+    # The fonts used for every cell and header, made when the font size setting changes
+    def make_fonts(self):
+        standard_font_size = SettingsCache.instance().get_standard_font_size()
+        self._cell_font = QFont()
+        self._cell_font.setPointSize(standard_font_size)
+        self._header_font = QFont()
+        self._header_font.setPointSize(standard_font_size)
+        self._header_font.setBold(True)
+
+    def setting_changed(self, key: str):
+        """Receive notice of a changed setting; redraw in the new font if it was the font size"""
+        if key == SettingsCache.STANDARD_FONT_SIZE_SETTING:
+            self.make_fonts()
+            if self._rows_fetched > 0:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(self._rows_fetched - 1, FrameSet.NUMBER_OF_DISPLAY_FIELDS - 1),
+                                      [Qt.FontRole])
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columnHeaders) - 1)
+
+    # Add a frameset to the end of the list in this model.  The new row is selected afterward,
+    # so the view is first given all the rows.
     @tracelog
     def addFrameSet(self, new_frame_set: FrameSet):
-        frame_sets: [FrameSet] = self._dataModel.get_saved_frame_sets()
-        self.beginInsertRows(QModelIndex(), len(frame_sets), len(frame_sets))
-        self._dataModel.add_frame_set(new_frame_set)
-        self.endInsertRows()
+        self.fetch_through(len(self._row_cache) - 1)
+        self.insertFrameSets([new_frame_set])
 
     # Insert a frameset into the list at the given index position
     @tracelog
     def insertFrameSet(self, new_frame_set: FrameSet, at_index: int):
-        self.beginInsertRows(QModelIndex(), at_index, at_index)
-        self._dataModel.insert_frame_set(new_frame_set, at_index)
-        self.endInsertRows()
+        self.insertFrameSets([new_frame_set], at_index)
 
     # Delete the frameSet at the given index
     @tracelog
     def deleteRow(self, index_to_delete: int):
         num_frame_sets: int = len(self._dataModel.get_saved_frame_sets())
         assert ((index_to_delete >= 0) and (index_to_delete < num_frame_sets))
-        self.beginRemoveRows(QModelIndex(), index_to_delete, index_to_delete)
-        self._dataModel.delete_frame_set(index_to_delete)
-        self.endRemoveRows()
+        self.deleteRows([index_to_delete])
+
+    # Insert a batch of framesets at the given index (or at the end) with one notification to the view.
+    # Rows inserted beyond those the view has fetched aren't announced; the view fetches them as usual.
+    @tracelog
+    def insertFrameSets(self, new_frame_sets: [FrameSet], at_index: int = None):
+        if len(new_frame_sets) == 0:
+            return
+        if at_index is None:
+            at_index = len(self._row_cache)
+        if at_index > self._rows_fetched:
+            self._dataModel.insert_frame_sets(new_frame_sets, at_index)
+            self._row_cache[at_index:at_index] = [None] * len(new_frame_sets)
+        else:
+            self.beginInsertRows(QModelIndex(), at_index, at_index + len(new_frame_sets) - 1)
+            self._dataModel.insert_frame_sets(new_frame_sets, at_index)
+            self._row_cache[at_index:at_index] = [None] * len(new_frame_sets)
+            self._rows_fetched += len(new_frame_sets)
+            self.endInsertRows()
+
+    # Delete the framesets at the given indices.  The view is notified once for each block of
+    # adjacent rows (so once for the usual contiguous selection), working from the bottom up.
+    @tracelog
+    def deleteRows(self, indices_to_delete: [int]):
+        rows = sorted(set(indices_to_delete), reverse=True)
+        while len(rows) > 0:
+            last_row = rows.pop(0)
+            first_row = last_row
+            while len(rows) > 0 and rows[0] == first_row - 1:
+                first_row = rows.pop(0)
+            # Only the part of the block the view has fetched is announced
+            last_fetched_row = min(last_row, self._rows_fetched - 1)
+            if first_row > last_fetched_row:
+                self._dataModel.delete_frame_sets(list(range(first_row, last_row + 1)))
+                del self._row_cache[first_row:last_row + 1]
+            else:
+                self.beginRemoveRows(QModelIndex(), first_row, last_fetched_row)
+                self._dataModel.delete_frame_sets(list(range(first_row, last_row + 1)))
+                del self._row_cache[first_row:last_row + 1]
+                self._rows_fetched -= last_fetched_row - first_row + 1
+                self.endRemoveRows()
+
+    # Move the framesets at the given indices up (-1) or down (+1) one place, as one layout change.
+    # Return their new indices.
+    @tracelog
+    def moveFrameSets(self, indices_to_move: [int], offset: int) -> [int]:
+        # A row moved down past the fetched rows must still be in the view afterward
+        if len(indices_to_move) > 0:
+            self.fetch_through(max(indices_to_move) + offset)
+        self.layoutAboutToBeChanged.emit()
+        old_order = list(range(len(self._row_cache)))
+        new_indices = self._dataModel.move_frame_sets(indices_to_move, offset)
+        # Apply the same moves to a list of original row numbers, to find where each row went
+        for index in sorted(indices_to_move, reverse=(offset > 0)):
+            old_order[index], old_order[index + offset] = old_order[index + offset], old_order[index]
+        new_row_of = {old_row: new_row for (new_row, old_row) in enumerate(old_order)}
+        self._row_cache = [self._row_cache[old_row] for old_row in old_order]
+        old_persistent = self.persistentIndexList()
+        new_persistent = [self.index(new_row_of[index.row()], index.column()) for index in old_persistent]
+        self.changePersistentIndexList(old_persistent, new_persistent)
+        self.layoutChanged.emit()
+        return new_indices
+
+    # Replace the frameset at the given index (e.g. with the result of editing it)
+    @tracelog
+    def replaceFrameSet(self, new_frame_set: FrameSet, at_index: int):
+        self._dataModel.set_frame_set(at_index, new_frame_set)
+        self.table_row_changed(at_index)
+
+    # One of the frame sets has changed (e.g. its completed count) - re-format and redraw its row
+    def table_row_changed(self, row_index: int):
+        assert (0 <= row_index < len(self._row_cache))
+        self._row_cache[row_index] = None
+        if row_index < self._rows_fetched:
+            self.dataChanged.emit(self.index(row_index, 0),
+                                  self.index(row_index, FrameSet.NUMBER_OF_DISPLAY_FIELDS - 1),
+                                  [Qt.DisplayRole])
+
+    # As above, finding the row by the frame set object
+    def frame_set_changed(self, frame_set: FrameSet):
+        for (row_index, row_frame_set) in enumerate(self._dataModel.get_saved_frame_sets()):
+            if row_frame_set is frame_set:
+                self.table_row_changed(row_index)
+                break
+
+    # Many or all of the frame sets have changed (e.g. completed counts reset)
+    def all_rows_changed(self):
+        self._row_cache = [None] * len(self._row_cache)
+        if self._rows_fetched > 0:
+            self.dataChanged.emit(self.index(0, 0),
+                                  self.index(self._rows_fetched - 1, FrameSet.NUMBER_OF_DISPLAY_FIELDS - 1),
+                                  [Qt.DisplayRole])
@@ -1,22 +1,50 @@
-from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QVariant, Qt, QSettings
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QVariant, Qt
+from PyQt5.QtGui import QFont, QFontMetrics
 
 from FrameSet import FrameSet
-from MultiOsUtil import MultiOsUtil
+from SettingsCache import SettingsCache
 from tracelog import *
 
 class FrameSetSessionTableModel(QAbstractTableModel):
     _columnHeaders = ("Frames", "Type", "Seconds", "Binned", "Done")
+    # Widest value expected in each column, used to size the columns without measuring every row
+    _columnSamples = ("99999", "Dark", "99999.9", "4 x 4", "99999")
+    FETCH_BATCH_SIZE = 500  # Rows given to the view at a time as it scrolls
+    COLUMN_PADDING = 16  # Pixels added to the measured column width
 
     # Constructor takes and keeps a pointer to the data model
+    # Cell strings are formatted once per row and kept in _row_cache until table_row_changed
+    # reports that the row's frame set has changed.
+    # The view is only told about the first _rows_fetched rows, and fetches more as it scrolls.
     def __init__(self, session_framesets_list):
         QAbstractTableModel.__init__(self)
         self._framesets_list = session_framesets_list
+        self._row_cache: [tuple] = [None] * len(session_framesets_list)
+        self._rows_fetched: int = min(len(session_framesets_list), FrameSetSessionTableModel.FETCH_BATCH_SIZE)
+        self._cell_font: QFont = None
+        self._header_font: QFont = None
+        self.make_fonts()
+        SettingsCache.instance().settingChanged.connect(self.setting_changed)
 
     # Methods required by the parent data model
     #tracelog
     def rowCount(self, parent_model_index) -> int:
-        return len(self._framesets_list)
+        return self._rows_fetched
+
+    def canFetchMore(self, parent_model_index: QModelIndex) -> bool:
+        return self._rows_fetched < len(self._framesets_list)
+
+    def fetchMore(self, parent_model_index: QModelIndex):
+        self.fetch_through(self._rows_fetched + FrameSetSessionTableModel.FETCH_BATCH_SIZE - 1)
+
+    # Make sure the view has been told about all the rows up to the given one
+    # (e.g. before highlighting the row the session is working on)
+    def fetch_through(self, row_index: int):
+        last_row = min(row_index, len(self._framesets_list) - 1)
+        if last_row >= self._rows_fetched:
+            self.beginInsertRows(QModelIndex(), self._rows_fetched, last_row)
+            self._rows_fetched = last_row + 1
+            self.endInsertRows()
 
     #tracelog
     def columnCount(self, parent_model_index) -> int:
@@ -29,14 +57,15 @@ class FrameSetSessionTableModel(QAbstractTableModel):
         # print(f"data(({row_num},{column_num}),{role})")
         if role == Qt.DisplayRole:
             assert ((row_num >= 0) & (row_num < len(self._framesets_list)))
-            the_frame_set: FrameSet = self._framesets_list[row_num]
-            result: QVariant = QVariant(the_frame_set.fieldNumberAsString(column_num))
+            row_strings = self._row_cache[row_num]
+            if row_strings is None:
+                the_frame_set: FrameSet = self._framesets_list[row_num]
+                row_strings = tuple(the_frame_set.fieldNumberAsString(column)
+                                    for column in range(FrameSet.NUMBER_OF_DISPLAY_FIELDS))
+                self._row_cache[row_num] = row_strings
+            result: QVariant = QVariant(row_strings[column_num])
         elif role == Qt.FontRole:
-            settings = QSettings()
-            standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
-            font = QFont()
-            font.setPointSize(standard_font_size)
-            result = font
+            result = self._cell_font
         else:
             result = QVariant()
         return result
@@ -50,14 +79,36 @@ class FrameSetSessionTableModel(QAbstractTableModel):
                 assert ((column_number >= 0) & (column_number < len(self._columnHeaders)))
                 result = self._columnHeaders[column_number]
             elif role == Qt.FontRole:
-                settings = QSettings()
-                standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
-                font = QFont()
-                font.setPointSize(standard_font_size)
-                font.setBold(True)
-                result = font
+                result = self._header_font
         return result
 
+    # Width for each column, measured from the header and the widest expected value in the current fonts
+    def column_widths(self) -> [int]:
+        header_metrics = QFontMetrics(self._header_font)
+        cell_metrics = QFontMetrics(self._cell_font)
+        return [max(header_metrics.horizontalAdvance(header), cell_metrics.horizontalAdvance(sample))
+                + FrameSetSessionTableModel.COLUMN_PADDING
+                for (header, sample) in zip(self._columnHeaders, self._columnSamples)]
+
+    # The fonts used for every cell and header, made when the font size setting changes
+    def make_fonts(self):
+        standard_font_size = SettingsCache.instance().get_standard_font_size()
+        self._cell_font = QFont()
+        self._cell_font.setPointSize(standard_font_size)
+        self._header_font = QFont()
+        self._header_font.setPointSize(standard_font_size)
+        self._header_font.setBold(True)
+
+    def setting_changed(self, key: str):
+        """Receive notice of a changed setting; redraw in the new font if it was the font size"""
+        if key == SettingsCache.STANDARD_FONT_SIZE_SETTING:
+            self.make_fonts()
+            if self._rows_fetched > 0:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(self._rows_fetched - 1, len(self._columnHeaders) - 1),
+                                      [Qt.FontRole])
+            self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._columnHeaders) - 1)
+
     # Received notice that one of the stored frame sets has changed (at time of writing,
     # this would be a change to the number-completed field).  Emit the appropriate signals so
     # that the table view updates.
@@ -65,7 +116,9 @@ class FrameSetSessionTableModel(QAbstractTableModel):
     def table_row_changed(self, row_index: int):
         # print(f"FrameSetSessionTableModel/table_row_changed({row_index})")
         assert (0 <= row_index < len(self._framesets_list))
-        top_left_index = self.index(row_index, 0)
-        bottom_right_index = self.index(row_index, len(self._columnHeaders) - 1)
-        roles = [Qt.DisplayRole] * len(self._columnHeaders)
-        self.dataChanged.emit(top_left_index, bottom_right_index, roles)
+        self._row_cache[row_index] = None
+        if row_index < self._rows_fetched:
+            top_left_index = self.index(row_index, 0)
+            bottom_right_index = self.index(row_index, len(self._columnHeaders) - 1)
+            roles = [Qt.DisplayRole] * len(self._columnHeaders)
+            self.dataChanged.emit(top_left_index, bottom_right_index, roles)
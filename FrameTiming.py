@@ -0,0 +1,58 @@
+# Where the time went while one frame was acquired.  The session worker fills one in for every frame,
+# timing on the session clock, so simulated sessions report their (virtual) times.
+#
+# A frame is: configure the camera (only for the first frame of a frame set), check the temperature
+# (if aborting on a temperature rise), send the start command, sleep for the predicted exposure + download
+# time, then poll the camera until it says the image is complete.  The camera may have finished before
+# that last poll; "slack" is the most time that could have been lost between the camera finishing and the
+# worker noticing - from the last poll that found it still busy (or the end of the predicted sleep) to
+# the poll that found it done.
+# save_seconds is the time the frameAcquired handler spent saving the plan, in real time.  (In the GUI
+# that is on the UI thread, so it overlaps the next frame rather than delaying it.)
+from datetime import datetime
+
+from tracelog import *
+
+
+class FrameTiming:
+    # Columns of the per-frame CSV, in order
+    FIELD_NAMES = ("row_index", "frame_set", "frame_number", "started", "exposure_seconds",
+                   "configure_seconds", "temperature_check_seconds", "start_command_seconds",
+                   "predicted_seconds", "actual_seconds", "resync_seconds", "resync_polls",
+                   "slack_seconds", "save_seconds")
+
+    def __init__(self, row_index: int, frame_set_text: str, frame_number: int, started: datetime,
+                 exposure_seconds: float):
+        self.row_index: int = row_index  # In the session's list of frame sets
+        self.frame_set: str = frame_set_text
+        self.frame_number: int = frame_number  # Within this session's frames of the set, from 1
+        self.started: datetime = started
+        self.exposure_seconds: float = exposure_seconds
+        self.configure_seconds: float = 0.0  # Setting the camera's frame type, binning and exposure
+        self.temperature_check_seconds: float = 0.0
+        self.start_command_seconds: float = 0.0
+        self.predicted_seconds: float = 0.0  # Exposure plus measured download time
+        self.actual_seconds: float = 0.0  # From the start command's reply to completion being seen
+        self.resync_seconds: float = 0.0  # Polling for completion after the predicted time
+        self.resync_polls: int = 0
+        self.slack_seconds: float = 0.0
+        self.save_seconds: float = 0.0
+
+    # The time between frames not spent exposing, by cause
+    def dead_time_by_cause(self) -> {str: float}:
+        """Break down this frame's time other than the exposure itself"""
+        return {"configuring": self.configure_seconds,
+                "temperature_checks": self.temperature_check_seconds,
+                "start_command": self.start_command_seconds,
+                "download": max(self.predicted_seconds - self.exposure_seconds, 0.0),
+                "waiting_for_completion": self.resync_seconds,
+                "saving": self.save_seconds}
+
+    def as_row(self) -> {str: object}:
+        """Return the timing as a dictionary of the CSV columns"""
+        row = {name: getattr(self, name) for name in FrameTiming.FIELD_NAMES}
+        row["started"] = self.started.isoformat(timespec="seconds")
+        for (name, value) in row.items():
+            if isinstance(value, float):
+                row[name] = round(value, 3)
+        return row
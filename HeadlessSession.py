@@ -0,0 +1,198 @@
+# Run an acquisition session from a plan file with no GUI.
+# This does what MainWindow does when "Begin Session" is clicked - runs a SessionThreadWorker in its own
+# thread - but receives the worker's signals itself: console lines are printed (and optionally logged to a file),
+# and the plan file is re-saved after each frame so the completed counts are kept up to date.
+# At the end, the session's timing report is written beside the plan file.
+# Given a metrics port, the session's progress is served there for monitoring (see SessionMetricsServer).
+# If the connection to TheSkyX is lost partway through, the session keeps trying it for reconnect_seconds
+# before giving up (see SessionThreadWorker.reconnect_to_server).
+# Given a clock and server (e.g. a VirtualClock and a SimulatedTheSkyX) the session runs with those
+# instead of the real time and TheSkyX; console lines are then stamped with the clock's time.
+import signal
+from time import perf_counter
+
+from PyQt5.QtCore import QObject, QThread, QTimer, QCoreApplication
+
+from DataModel import DataModel
+from FrameRetryPolicy import FrameRetryPolicy
+from FrameSet import FrameSet
+from RealClock import RealClock
+from SessionClock import SessionClock
+from SessionController import SessionController
+from SessionMetricsServer import SessionMetricsServer
+from SessionStatus import SessionStatus
+from SessionThreadWorker import SessionThreadWorker
+from TheSkyX import TheSkyX
+from tracelog import *
+
+
+class HeadlessSession(QObject):
+    INDENTATION_DEPTH = 3  # Same as the GUI console
+    SIGNAL_CHECK_INTERVAL = 500  # Milliseconds; lets python handle ctrl-C while Qt's event loop runs
+
+    # file_path is where the plan is saved; None to leave the plan file alone (e.g. for a simulation)
+    def __init__(self, data_model: DataModel, file_path: str,
+                 save_after_each_frame: bool = True,
+                 log_file_path: str = None,
+                 clock: SessionClock = None,
+                 server: TheSkyX = None,
+                 metrics_port: int = 0,  # 0 for no metrics endpoint
+                 metrics_address: str = "localhost",
+                 reconnect_seconds: float = 0,  # 0 to end the session if the connection is lost
+                 retry_policy: FrameRetryPolicy = None):  # What to do when a frame fails; None for the default
+        QObject.__init__(self)
+        self._data_model: DataModel = data_model
+        self._file_path: str = file_path
+        self._clock: SessionClock = clock if clock is not None else RealClock()
+        self._server: TheSkyX = server
+        self._save_after_each_frame: bool = save_after_each_frame
+        self._metrics_port: int = metrics_port
+        self._metrics_address: str = metrics_address
+        self._reconnect_seconds: float = reconnect_seconds
+        self._retry_policy: FrameRetryPolicy = retry_policy
+        self._log_file = None if log_file_path is None else open(log_file_path, "a")
+        self._session_framesets: [FrameSet] = []
+        self._thread_controller: SessionController = None
+        self._worker_object: SessionThreadWorker = None
+        self._qthread: QThread = None
+        self._interrupted: bool = False
+        self._row_index_reported: int = SessionStatus.NO_ROW
+
+    # Run the session to completion (or cancellation).  Returns a success flag: false if there was nothing
+    # to do, or if the session failed or was interrupted.
+    @tracelog
+    def run(self) -> bool:
+        """Run the acquisition session and wait for it to finish"""
+        self._session_framesets = self._data_model.get_incomplete_framesets()
+        if len(self._session_framesets) == 0:
+            self.console_line("No incomplete frame sets in the plan, nothing to do", 1)
+            return False
+
+        self._thread_controller = SessionController()
+        self._worker_object = SessionThreadWorker(self._session_framesets,
+                                                  self._data_model.get_session_time_info(self._clock),
+                                                  self._thread_controller,
+                                                  self._data_model.get_session_temperature_info(),
+                                                  self._data_model.get_send_wake_on_lan_before_starting(),
+                                                  self._data_model.get_send_wol_seconds_before(),
+                                                  self._data_model.getWolBroadcastAddress(),
+                                                  self._data_model.getWolMacAddress(),
+                                                  self._data_model.get_net_address(),
+                                                  int(self._data_model.get_port_number()),
+                                                  self._data_model.get_disconnect_when_done(),
+                                                  clock=self._clock,
+                                                  server=self._server,
+                                                  reconnect_seconds=self._reconnect_seconds,
+                                                  retry_policy=self._retry_policy)
+        self._worker_object.consoleLine.connect(self.console_line)
+        self._worker_object.displayCameraPath.connect(self.display_camera_path)
+        self._worker_object.frameAcquired.connect(self.frame_acquired)
+        metrics_server = self.start_metrics_server()
+
+        self._qthread = QThread()
+        self._worker_object.moveToThread(self._qthread)
+        self._qthread.started.connect(self._worker_object.run_session)
+        self._worker_object.finished.connect(self._qthread.quit)
+        self._qthread.finished.connect(QCoreApplication.instance().quit)
+
+        # Ctrl-C cancels the session the way the Cancel button does, so the camera is
+        # left in a sensible state.  The timer gives python a chance to run the handler,
+        # and is also when we check the session status for a change of frame set.
+        previous_handler = signal.signal(signal.SIGINT, self.interrupt_received)
+        signal_timer = QTimer()
+        signal_timer.timeout.connect(self.check_session_status)
+        signal_timer.start(HeadlessSession.SIGNAL_CHECK_INTERVAL)
+
+        self._qthread.start()
+        QCoreApplication.instance().exec_()
+
+        signal_timer.stop()
+        signal.signal(signal.SIGINT, previous_handler)
+        if metrics_server is not None:
+            metrics_server.stop()
+        self.save_plan()
+        self.save_timing_report()
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        return self._worker_object.completed_normally() and not self._interrupted
+
+    # Serve the session's metrics, if a port was given.  Return the server, None if none (or it failed to start)
+    @tracelog
+    def start_metrics_server(self) -> SessionMetricsServer:
+        """Start the metrics endpoint for the session"""
+        if self._metrics_port == 0:
+            return None
+        try:
+            metrics_server = SessionMetricsServer(self._thread_controller, self._session_framesets,
+                                                  self._metrics_address, self._metrics_port)
+        except OSError as error:
+            self.console_line(f"Unable to serve metrics on port {self._metrics_port}: {error}", 1)
+            return None
+        metrics_server.start()
+        self.console_line(f"Serving metrics at http://{self._metrics_address}:{metrics_server.get_port()}"
+                          + SessionMetricsServer.METRICS_PATH, 1)
+        return metrics_server
+
+    def interrupt_received(self, _signal_number, _frame):
+        """Cancel the session in response to ctrl-C"""
+        if not self._interrupted:
+            self._interrupted = True
+            self.console_line("Interrupted, cancelling session", 1)
+            self._thread_controller.cancel_thread()
+
+    # Print a console line from the worker, in the same format as the GUI's console
+    def console_line(self, message: str, level: int):
+        """Print a line of session progress"""
+        indent_string = " " * HeadlessSession.INDENTATION_DEPTH * (level - 1) if level > 1 else ""
+        line = self._clock.now().strftime("%H:%M:%S ") + " " + indent_string + message
+        print(line, flush=True)
+        if self._log_file is not None:
+            self._log_file.write(line + "\n")
+            self._log_file.flush()
+
+    def check_session_status(self):
+        """Note when the session starts work on a different frame set"""
+        row_index = self._thread_controller.get_status().row_index
+        if row_index != self._row_index_reported:
+            self._row_index_reported = row_index
+            if row_index != SessionStatus.NO_ROW:
+                self.console_line(f"Frame set {row_index + 1} of {len(self._session_framesets)}: "
+                                  + str(self._session_framesets[row_index]), 2)
+
+    def display_camera_path(self, path: str):
+        """Report where the camera is saving frames"""
+        self.console_line(f"Camera saving frames in {path}", 2)
+
+    # A frame has been acquired: count it, and save the plan so the counts survive a crash or power loss
+    def frame_acquired(self, frame_set: FrameSet, row_index: int):
+        """Receive signal that a frame has been acquired.  Update number complete"""
+        frame_set.set_number_complete(frame_set.get_number_complete() + 1)
+        if self._save_after_each_frame:
+            save_started = perf_counter()
+            self.save_plan()
+            self._thread_controller.add_save_seconds(row_index, perf_counter() - save_started)
+
+    @tracelog
+    def save_plan(self):
+        """Write the plan, with its completed counts, back to the plan file"""
+        if self._file_path is None:
+            return
+        try:
+            with open(self._file_path, "w") as saving_file:
+                saving_file.write(self._data_model.serialize_to_json())
+        except OSError as error:
+            self.console_line(f"Unable to save plan file \"{self._file_path}\": {error}", 1)
+
+    # Write the session's per-frame timing and dead time totals beside the plan file
+    @tracelog
+    def save_timing_report(self):
+        """Save the session timing report, if there is a plan file and any frames were taken"""
+        timing_report = self._thread_controller.get_timing_report()
+        if self._file_path is None or len(timing_report.frames) == 0:
+            return
+        (success, message) = timing_report.save_beside(self._file_path)
+        if success:
+            self.console_line(f"Session timing report: {message}", 1)
+        else:
+            self.console_line(f"Unable to write session timing report: {message}", 1)
@@ -0,0 +1,56 @@
+# A connection opened by ImpairedTransport.  Sends go straight through; each reply is delayed, may be
+# cut off by a dropped connection, and may be handed over a few bytes at a time.
+# A delay longer than the connection's timeout times out the way a socket would: the reader waits the
+# timeout and gets socket.timeout, and the rest of the delay is still to come on the next read.
+import socket
+
+from tracelog import *
+
+
+class ImpairedConnection:
+
+    def __init__(self, transport, connection):
+        self._transport = transport  # The ImpairedTransport, which decides what goes wrong
+        self._connection = connection
+        self._pending: bytes = b""  # Received but not yet returned, when reads are being split
+        self._reply_started: bool = False
+        self._timeout_seconds: float = None
+        self._delay_remaining: float = 0.0  # Of the current reply's delay
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def settimeout(self, timeout_seconds: float):
+        self._timeout_seconds = timeout_seconds
+        self._connection.settimeout(timeout_seconds)
+
+    def sendall(self, data: bytes):
+        self._reply_started = False
+        self._connection.sendall(data)
+
+    def recv(self, buffer_size: int) -> bytes:
+        if not self._reply_started:
+            self._reply_started = True
+            self._delay_remaining = self._transport.sample_latency()
+            if self._transport.drop_now():
+                self._transport.sleep(self._delay_remaining)
+                self.close()
+                raise ConnectionResetError("Connection dropped (simulated)")
+        if self._delay_remaining > 0:
+            if self._timeout_seconds is not None and self._delay_remaining > self._timeout_seconds:
+                self._transport.sleep(self._timeout_seconds)
+                self._delay_remaining -= self._timeout_seconds
+                raise socket.timeout("timed out")
+            self._transport.sleep(self._delay_remaining)
+            self._delay_remaining = 0.0
+        if len(self._pending) == 0:
+            self._pending = self._connection.recv(buffer_size)
+        size = self._transport.read_size(len(self._pending), buffer_size)
+        (data, self._pending) = (self._pending[:size], self._pending[size:])
+        return data
+
+    def close(self):
+        self._connection.close()
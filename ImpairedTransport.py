@@ -0,0 +1,92 @@
+# A TheSkyX transport that makes another transport's link worse, reproducibly (given a seed):
+#   - replies are delayed by a latency drawn from a distribution: "normal" (latency, jitter as the
+#     standard deviation), "uniform" (latency plus or minus jitter) or "exponential" (latency plus a
+#     long tail with mean jitter);
+#   - a fraction of connections are refused, and a fraction dropped before the reply arrives;
+#   - a fraction of replies are returned in several short reads, as happens over a slow link.
+# Delays are slept on the given clock, so on a VirtualClock they add to a simulated session's time
+# without slowing it.
+import random
+import threading
+
+from ImpairedConnection import ImpairedConnection
+from RealClock import RealClock
+from SessionClock import SessionClock
+from SocketTransport import SocketTransport
+from TheSkyXTransport import TheSkyXTransport
+from tracelog import *
+
+
+class ImpairedTransport(TheSkyXTransport):
+    LATENCY_DISTRIBUTIONS = ("normal", "uniform", "exponential")
+
+    def __init__(self, inner: TheSkyXTransport = None,
+                 clock: SessionClock = None,
+                 latency_seconds: float = 0.0,
+                 jitter_seconds: float = 0.0,
+                 latency_distribution: str = "normal",
+                 refuse_rate: float = 0.0,
+                 drop_rate: float = 0.0,
+                 partial_read_rate: float = 0.0,
+                 seed: int = None):
+        assert latency_distribution in ImpairedTransport.LATENCY_DISTRIBUTIONS
+        self._inner: TheSkyXTransport = inner if inner is not None else SocketTransport()
+        self._clock: SessionClock = clock if clock is not None else RealClock()
+        self._latency_seconds: float = latency_seconds
+        self._jitter_seconds: float = jitter_seconds
+        self._latency_distribution: str = latency_distribution
+        self._refuse_rate: float = refuse_rate
+        self._drop_rate: float = drop_rate
+        self._partial_read_rate: float = partial_read_rate
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._refused: int = 0
+        self._dropped: int = 0
+
+    def get_refused(self) -> int:
+        return self._refused
+
+    def get_dropped(self) -> int:
+        return self._dropped
+
+    @tracelog
+    def open_connection(self, address: (str, int), timeout_seconds: float = None) -> ImpairedConnection:
+        """Open a connection through the inner transport, unless this one is to be refused"""
+        with self._random_lock:
+            refuse = self._random.random() < self._refuse_rate
+        if refuse:
+            self._refused += 1
+            raise ConnectionRefusedError("Connection refused (simulated)")
+        return ImpairedConnection(self, self._inner.open_connection(address, timeout_seconds))
+
+    def sample_latency(self) -> float:
+        """Draw a reply delay from the latency distribution"""
+        with self._random_lock:
+            if self._latency_distribution == "uniform":
+                latency = self._random.uniform(self._latency_seconds - self._jitter_seconds,
+                                               self._latency_seconds + self._jitter_seconds)
+            elif self._latency_distribution == "exponential":
+                latency = self._latency_seconds + (self._random.expovariate(1 / self._jitter_seconds)
+                                                   if self._jitter_seconds > 0 else 0.0)
+            else:
+                latency = self._random.gauss(self._latency_seconds, self._jitter_seconds)
+        return max(latency, 0.0)
+
+    def sleep(self, seconds: float):
+        self._clock.sleep(seconds)
+
+    def drop_now(self) -> bool:
+        """Decide whether to drop the connection instead of delivering its reply"""
+        with self._random_lock:
+            drop = self._random.random() < self._drop_rate
+        if drop:
+            self._dropped += 1
+        return drop
+
+    # How many of the available bytes a read returns: all of them, or for a partial read a random part
+    def read_size(self, available: int, buffer_size: int) -> int:
+        size = min(available, buffer_size)
+        with self._random_lock:
+            if size > 1 and self._random.random() < self._partial_read_rate:
+                size = self._random.randint(1, size - 1)
+        return size
@@ -1,33 +1,40 @@
+import ipaddress
 import json
-from datetime import date, time
-from time import strftime
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time
+from time import strftime, perf_counter
 from typing import List
 
 from PyQt5.QtGui import QFont
 
 from MultiOsUtil import MultiOsUtil
 from tracelog import *
-from PyQt5 import uic, QtWidgets, QtGui
-from PyQt5.QtCore import QMutex, QItemSelection, QModelIndex, QItemSelectionModel, QTime, QThread, QTimer, \
-    QSettings, QDate, QEvent, QObject
+from PyQt5 import QtWidgets, QtGui
+from PyQt5.QtCore import QItemSelection, QModelIndex, QItemSelectionModel, QTime, QThread, QTimer, \
+    QDate, QEvent, QObject, QStandardPaths
 from PyQt5.QtWidgets import QMainWindow, QDialog, QMessageBox, QHeaderView, QFileDialog, QWidget, QLabel, QCheckBox, \
-    QRadioButton, QLineEdit, QPushButton, QDateEdit, QTimeEdit, QListWidgetItem
+    QRadioButton, QLineEdit, QPushButton, QDateEdit, QTimeEdit
 
-from AddFrameSetDialog import AddFrameSetDialog
-from BulkEntryDialog import BulkEntryDialog
+from ConsoleListModel import ConsoleListModel
 from DataModel import DataModel
 from DataModelDecoder import DataModelDecoder
+from DiscoveredServer import DiscoveredServer
 from EndDate import EndDate
 from EndTime import EndTime
+from FrameRetryPolicy import FrameRetryPolicy
 from FrameSet import FrameSet
 from FrameSetPlanTableModel import FrameSetPlanTableModel
 from FrameSetSessionTableModel import FrameSetSessionTableModel
 from RmNetUtils import RmNetUtils
+from ServerDiscovery import ServerDiscovery
 from SessionController import SessionController
+from SessionMetricsServer import SessionMetricsServer
+from SessionStatus import SessionStatus
+from SettingsCache import SettingsCache
 from SessionThreadWorker import SessionThreadWorker
 from StartDate import StartDate
 from StartTime import StartTime
-from TheSkyX import TheSkyX
 from Validators import Validators
 
 
@@ -36,20 +43,33 @@ class MainWindow(QMainWindow):
     SAVED_FILE_EXTENSION = ".ewho2"
     RUN_SESSION_TAB_INDEX = 4
     INDENTATION_DEPTH = 3
-    COOLER_POWER_UPDATE_INTERVAL = 20  # Update displayed cooler power this often
+    SESSION_STATUS_UPDATE_INTERVAL = 250  # Milliseconds between redraws of the session status
+    SESSION_LOG_DIRECTORY = "session-logs"  # In the application data directory
+    TEST_CONNECTION_TIMEOUT = 5  # Seconds the Test button waits for the server to accept a connection
+    DISCOVERY_CHECK_INTERVAL = 100  # Milliseconds between checks for the end of a server discovery scan
 
     def __init__(self):
         """Initialize MainWindow class"""
         QMainWindow.__init__(self)
         self.installEventFilter(self)
-        self.ui = uic.loadUi(MultiOsUtil.path_for_file_in_program_directory("MainWindow.ui"))
+        self.ui = MultiOsUtil.load_ui_form("MainWindow.ui", QMainWindow)
         self._controls_connected = False
         self._file_path = ""
         self._is_dirty = False
-        self._cooler_timer = None
         self._session_framesets: [FrameSet] = []
         self._thread_controller: SessionController = None
-        self._mutex: QMutex = None
+        self._status_timer: QTimer = None
+        self._metrics_server: SessionMetricsServer = None
+        self._status_version_shown: int = -1
+        self._status_row_shown: int = SessionStatus.NO_ROW
+        self._discovery_scan: Future = None  # Server discovery running in the background, if any
+        self._discovery_timer: QTimer = None
+        self._discovered_servers: [DiscoveredServer] = []
+
+        # Session console shows the lines from a bounded list model
+        self._console_model = ConsoleListModel()
+        self.ui.consoleList.setModel(self._console_model)
+        self._console_model.linesAppended.connect(self.ui.consoleList.scrollToBottom)
 
         # noinspection PyTypeChecker
         self._session_table_model: FrameSetSessionTableModel = None
@@ -64,24 +84,19 @@ class MainWindow(QMainWindow):
         self.ui.mainTabView.setCurrentIndex(0)
 
         # If we have a saved window size in the preferences, set the size to that
-        settings = QSettings()
+        settings = SettingsCache.instance()
         if settings.contains(MultiOsUtil.LAST_WINDOW_SIZE_SETTING):
             last_size = settings.value(MultiOsUtil.LAST_WINDOW_SIZE_SETTING)
             self.ui.resize(last_size)
 
-        # Ensure there is a standard window font size established
-        if not settings.contains(MultiOsUtil.STANDARD_FONT_SIZE_SETTING):
-            settings.setValue(MultiOsUtil.STANDARD_FONT_SIZE_SETTING,
-                              MultiOsUtil.STANDARD_FONT_SIZE)
-
-        # Frame plan table headers and console table headers should auto-resize if font size changes
-        self.ui.framesPlanTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        self.ui.sessionTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Table columns are sized from the fonts (see fit_table_columns), not by measuring every row,
+        # which would be slow for a large plan
+        self.ui.framesPlanTable.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.ui.sessionTable.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
 
         # Set font sizes of all fontable elements to the saved font size
-        standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
         MultiOsUtil.set_font_sizes(parent=self.ui,
-                                   standard_size=standard_font_size,
+                                   standard_size=settings.get_standard_font_size(),
                                    title_prefix=MultiOsUtil.MAIN_TITLE_LABEL_PREFIX,
                                    title_increment=MultiOsUtil.MAIN_TITLE_FONT_SIZE_INCREMENT,
                                    subtitle_prefix=MultiOsUtil.SUBTITLE_LABEL_PREFIX,
@@ -89,12 +104,14 @@ class MainWindow(QMainWindow):
                                    )
 
         # "Log everything" checkbox is set from preferences, defaults to "off"
-        if settings.contains(TRACE_LOG_SETTING):
-            trace_enabled = bool(settings.value(TRACE_LOG_SETTING))
-        else:
-            settings.setValue(TRACE_LOG_SETTING, False)
-            trace_enabled = False
-        self.ui.writeTraceInfo.setChecked(trace_enabled)
+        self.ui.writeTraceInfo.setChecked(settings.get_trace_log())
+
+        # Preferences for all sessions, below it
+        self.ui.consoleCapacity.setText(str(settings.get_console_capacity()))
+        self.ui.metricsPort.setText(str(settings.get_metrics_port()))
+        self.ui.reconnectSeconds.setText(str(settings.get_reconnect_seconds()))
+        self.ui.frameRetryPolicy.setPlaceholderText(FrameRetryPolicy.DEFAULT_TEXT)
+        self.ui.frameRetryPolicy.setText(settings.get_frame_retry_policy())
 
     def set_is_dirty(self, dirty: bool):
         """Record whether the open document has unsaved changes"""
@@ -178,6 +195,7 @@ class MainWindow(QMainWindow):
         # Framesets
         self._plan_table_model = FrameSetPlanTableModel(the_model)
         self.ui.framesPlanTable.setModel(self._plan_table_model)
+        self.fit_table_columns()
 
         # Autosave
         self.ui.autoSaveAfterEach.setChecked(the_model.get_auto_save_after_each_frame())
@@ -208,6 +226,8 @@ class MainWindow(QMainWindow):
             self._controls_connected = True
             self.ui.testConnectionButton.clicked.connect(self.test_connection_button_clicked)
             self.ui.sendWolNowButton.clicked.connect(self.send_wol_now_button_clicked)
+            self.ui.discoverServersButton.clicked.connect(self.discover_servers_button_clicked)
+            self.ui.discoveredServers.activated.connect(self.discovered_server_chosen)
             self.ui.locName.editingFinished.connect(self.loc_name_edit_finished)
 
             # start date buttons
@@ -339,6 +359,12 @@ class MainWindow(QMainWindow):
             # Checkbox for tracing
             self.ui.writeTraceInfo.clicked.connect(self.write_trace_info_clicked)
 
+            # Preferences for all sessions
+            self.ui.consoleCapacity.editingFinished.connect(self.console_capacity_finished)
+            self.ui.metricsPort.editingFinished.connect(self.metrics_port_finished)
+            self.ui.reconnectSeconds.editingFinished.connect(self.reconnect_seconds_finished)
+            self.ui.frameRetryPolicy.editingFinished.connect(self.frame_retry_policy_finished)
+
             # Tab view
             # See when tabs are changed so we can do special init as needed
             # (at presently only applies to "run session" tab.  There is no way to
@@ -417,6 +443,10 @@ class MainWindow(QMainWindow):
         server_port_given = self.model.get_port_number().strip() != ""
         self.ui.testConnectionButton.setEnabled(server_addr_given and server_port_given)
 
+        # Discover Servers if port given and a scan isn't already running; choose from what it found
+        self.ui.discoverServersButton.setEnabled(server_port_given and self._discovery_scan is None)
+        self.ui.discoveredServers.setEnabled(len(self._discovered_servers) > 0)
+
         # "+" and "Bulk Add" buttons enabled if zero or one lines are selected
         # (Zero so we add to end, 1 to insert before it)
         frame_plan_selected_rows = self.frame_plan_selected_rows()
@@ -455,7 +485,8 @@ class MainWindow(QMainWindow):
         self.server_address_finished()
         self.server_port_finished()
         if self.ui.testConnectionButton.isEnabled():
-            success, message = RmNetUtils.test_connection(self.model.get_net_address(), self.model.get_port_number())
+            success, message = RmNetUtils.test_connection(self.model.get_net_address(), self.model.get_port_number(),
+                                                          MainWindow.TEST_CONNECTION_TIMEOUT)
             if success:
                 self.ui.testConnectionMessage.setText("Connection Successful")
             else:
@@ -478,6 +509,65 @@ class MainWindow(QMainWindow):
             else:
                 self.ui.testWOLMessage.setText(message)
 
+    # The scan of the network takes a couple of seconds, so it runs in the background; a timer checks for
+    # the end of it and fills in the list of servers found
+    @tracelog
+    def discover_servers_button_clicked(self, _):
+        """Scan the local network for TheSkyX servers"""
+        self.server_port_finished()
+        if not self.ui.discoverServersButton.isEnabled():
+            return
+        subnet = self.discovery_subnet()
+        if subnet is None:
+            self.ui.testConnectionMessage.setText("Unable to determine the local network to scan")
+            return
+        discovery = ServerDiscovery(int(self.model.get_port_number()))
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._discovery_scan = executor.submit(discovery.scan, subnet)
+        executor.shutdown(wait=False)
+        self.ui.testConnectionMessage.setText(f"Scanning {subnet} ...")
+        self._discovery_timer = QTimer()
+        self._discovery_timer.timeout.connect(self.check_discovery_scan)
+        self._discovery_timer.start(MainWindow.DISCOVERY_CHECK_INTERVAL)
+        self.enable_controls()
+
+    # The subnet to scan: the /24 of the server address if it is an IP address, otherwise this computer's
+    def discovery_subnet(self) -> str:
+        """Choose the subnet to scan for servers"""
+        try:
+            return str(ipaddress.ip_network(f"{self.model.get_net_address().strip()}/24", strict=False))
+        except ValueError:
+            return ServerDiscovery.local_subnet()
+
+    # tracelog
+    def check_discovery_scan(self):
+        """If the server discovery scan has finished, list the servers it found"""
+        if self._discovery_scan is None or not self._discovery_scan.done():
+            return
+        self._discovery_timer.stop()
+        self._discovery_timer = None
+        (found, message) = self._discovery_scan.result()
+        self._discovery_scan = None
+        self._discovered_servers = found
+        self.ui.discoveredServers.clear()
+        for server in found:
+            self.ui.discoveredServers.addItem(str(server))
+        if message != "":
+            self.ui.testConnectionMessage.setText(message)
+        else:
+            theskyx_count = sum(1 for server in found if server.is_theskyx)
+            self.ui.testConnectionMessage.setText(f"Found {theskyx_count} TheSkyX server(s)"
+                                                  + ("" if len(found) == theskyx_count
+                                                     else f", {len(found) - theskyx_count} other host(s)"))
+        self.enable_controls()
+
+    @tracelog
+    def discovered_server_chosen(self, index: int):
+        """Use the address of the server chosen from those discovered"""
+        if 0 <= index < len(self._discovered_servers):
+            self.ui.serverAddress.setText(self._discovered_servers[index].address)
+            self.server_address_finished()
+
     @tracelog
     def frames_plan_table_selection_changed(self, _1, _2):
         """Respond to user selecting a row in the frames plan table"""
@@ -943,6 +1033,7 @@ class MainWindow(QMainWindow):
     def add_frame_button_clicked(self, _):
         """Respond to 'add frame' button by opening new frame dialog"""
         # print("addFrameButtonClicked entered")
+        from AddFrameSetDialog import AddFrameSetDialog  # Dialog modules are loaded on first use
         dialog: AddFrameSetDialog = AddFrameSetDialog()
         dialog.setupUI(new_set=True)
         result: QDialog.DialogCode = dialog.ui.exec_()
@@ -978,6 +1069,7 @@ class MainWindow(QMainWindow):
         # print(f"  Editing: {frame_editing}")
 
         # Open the add/edit dialog with this frame set filled in t the fields
+        from AddFrameSetDialog import AddFrameSetDialog
         dialog: AddFrameSetDialog = AddFrameSetDialog()
         dialog.setupUI(new_set=False, frame_set=frame_editing)
         result: QDialog.DialogCode = dialog.ui.exec_()
@@ -985,7 +1077,7 @@ class MainWindow(QMainWindow):
         if result == QDialog.Accepted:
             # The edit dialog contains a new frame set with the edits
             # replace the one we edited with this new one
-            self.model.set_frame_set(rows_selected[0], dialog.getFrameSet())
+            self._plan_table_model.replaceFrameSet(dialog.getFrameSet(), rows_selected[0])
             self.set_is_dirty(True)
             # print(f"   Process edited FrameSet {rows_selected[0]}: {str(dialog.getFrameSet())}")
         self.enable_controls()
@@ -1010,9 +1102,8 @@ class MainWindow(QMainWindow):
         """delete the selected row in the frame plan table"""
         # print("deleteFrameButtonClicked entered")
         rows_selected: [int] = self.frame_plan_selected_rows()
-        rows_selected.sort(reverse=True)
-        for row_index in rows_selected:
-            self._plan_table_model.deleteRow(row_index)
+        if len(rows_selected) > 0:
+            self._plan_table_model.deleteRows(rows_selected)
             self.set_is_dirty(True)
         self.enable_controls()
         # print("deleteFrameButtonClicked exits")
@@ -1025,6 +1116,7 @@ class MainWindow(QMainWindow):
     def bulk_add_button_clicked(self, _):
         """Respond to 'bulk add' button by opening dialog to specify multiple frames"""
         rows_selected = self.frame_plan_selected_rows()
+        from BulkEntryDialog import BulkEntryDialog
         dialog: BulkEntryDialog = BulkEntryDialog()
         dialog.set_up_ui()
         result: QDialog.DialogCode = dialog.ui.exec_()
@@ -1034,17 +1126,12 @@ class MainWindow(QMainWindow):
                                                                           dialog.getNumDarkFrames(),
                                                                           dialog.getDarkBinnings(),
                                                                           dialog.getDarkExposures())
-            insertion_point: int = None if len(rows_selected) == 0 else rows_selected[0]
-            for frame_set in framesets_to_add:
+            # Insert before the first selected row, or add to the end if nothing is selected,
+            # all in one batch so the table is only re-laid-out once
+            insertion_point: int = None if len(rows_selected) == 0 else min(rows_selected)
+            if len(framesets_to_add) > 0:
+                self._plan_table_model.insertFrameSets(framesets_to_add, insertion_point)
                 self.set_is_dirty(True)
-                if insertion_point is None:
-                    # print("       Nothing selected, add to end.")
-                    self._plan_table_model.addFrameSet(frame_set)
-                else:
-                    # print(f"       Insert before row {insertion_point}")
-                    self._plan_table_model.insertFrameSet(frame_set, insertion_point)
-                    # Move insertion point down one because the set just got larger
-                    insertion_point += 1
         dialog.close()
         self.enable_controls()
 
@@ -1065,6 +1152,7 @@ class MainWindow(QMainWindow):
         if dialog_result == QMessageBox.Reset:
             # print("Reset is confirmed")
             self.model.reset_completed_counts()
+            self._plan_table_model.all_rows_changed()
             # Force a new save so the file isn't accidentally overwritten
             self._file_path = ""
             self.ui.setWindowTitle(MainWindow.UNSAVED_WINDOW_TITLE)
@@ -1082,15 +1170,11 @@ class MainWindow(QMainWindow):
         assert (len(rows_selected) > 0)
         assert (rows_selected[0] != 0)
 
-        for row_index in rows_selected:
-            # To move a row up, we delete it from its current position and insert it one higher
-            frame_set_being_moved: FrameSet = self.model.get_frame_set(row_index)
-            self._plan_table_model.deleteRow(row_index)
-            self._plan_table_model.insertFrameSet(frame_set_being_moved, row_index - 1)
-            self.set_is_dirty(True)
+        # Each selected row moves up past the row above it, all as one change to the table
+        new_selection = self._plan_table_model.moveFrameSets(rows_selected, -1)
+        self.set_is_dirty(True)
 
         # Re-do the selection so the rows just moved remain selected
-        new_selection = map(lambda x: x - 1, rows_selected)
         self.frame_plan_select_rows(new_selection)
         self.enable_controls()
 
@@ -1106,30 +1190,12 @@ class MainWindow(QMainWindow):
         assert (len(rows_selected) > 0)  # Can't be here unless something is selected
         assert (rows_selected[0] != len(self.model.get_saved_frame_sets()) - 1)  # Bottom row not allowed
 
-        for row_index in rows_selected:
-            # To move a row down, we delete it from its current position and insert it one lower
-            #   e.g let's move row 2 down
-            #   before:
-            #       0:  a
-            #       1:  b
-            #       2:  c
-            #       3:  d
-            #   Delete row 2
-            #       0:  a
-            #       1:  b
-            #       2:  d
-            #   Insert row 3
-            #       0:  a
-            #       1:  b
-            #       2:  d
-            #       3:  c
-            frame_set_being_moved: FrameSet = self.model.get_frame_set(row_index)
-            self._plan_table_model.deleteRow(row_index)
-            self._plan_table_model.insertFrameSet(frame_set_being_moved, row_index + 1)
-            self.set_is_dirty(True)
+        # Each selected row moves down past the row below it, all as one change to the table
+        #   e.g. moving rows 1 and 2 down:   a b c d  ->  a d b c
+        new_selection = self._plan_table_model.moveFrameSets(rows_selected, +1)
+        self.set_is_dirty(True)
 
         # Re-do the selection so the rows just moved remain selected
-        new_selection = map(lambda x: x + 1, rows_selected)
         self.frame_plan_select_rows(new_selection)
         self.enable_controls()
 
@@ -1147,14 +1213,24 @@ class MainWindow(QMainWindow):
     def populate_session_framesets_table(self):
         """Fill in the table that will show progress of the acquisition process"""
         # print("populateSessionFramesetsTable")
-        # Have table columns resize to fit data
         horizontal_header: QHeaderView = self.ui.sessionTable.horizontalHeader()
-        horizontal_header.setSectionResizeMode(QHeaderView.ResizeToContents)
         horizontal_header.setStretchLastSection(True)
         # Get framesets to display and set up the table data source
         self._session_framesets = self.model.get_incomplete_framesets()
         self._session_table_model = FrameSetSessionTableModel(self._session_framesets)
         self.ui.sessionTable.setModel(self._session_table_model)
+        self.fit_table_columns()
+
+    # Set the table column widths to fit the current font size
+    @tracelog
+    def fit_table_columns(self):
+        """Size the plan and session table columns from their models' fonts"""
+        for (table, table_model) in ((self.ui.framesPlanTable, self._plan_table_model),
+                                     (self.ui.sessionTable, self._session_table_model)):
+            if table_model is not None:
+                horizontal_header: QHeaderView = table.horizontalHeader()
+                for (column, width) in enumerate(table_model.column_widths()):
+                    horizontal_header.resizeSection(column, width)
 
     # Disable all the controls except the Cancel button so the session runs without complicated changes
 
@@ -1187,11 +1263,15 @@ class MainWindow(QMainWindow):
         if proceed:
             # Controller object to communicate running/cancel  status to worker
             self._thread_controller = SessionController()
-            self._mutex = QMutex()
             # Create worker object to do the work of the session
 
             session_time_info = self.model.get_session_time_info()
             session_temperature_info = self.model.get_session_temperature_info()
+            settings = SettingsCache.instance()
+            (retry_policy, message) = FrameRetryPolicy.parse(settings.get_frame_retry_policy()
+                                                             or FrameRetryPolicy.DEFAULT_TEXT)
+            if retry_policy is None:
+                self.add_line_to_console_frame(f"Ignoring frame_retry_policy preference: {message}", 1)
             self._worker_object = SessionThreadWorker(self._session_framesets, session_time_info,
                                                       self._thread_controller,
                                                       session_temperature_info,
@@ -1200,15 +1280,17 @@ class MainWindow(QMainWindow):
                                                       self.model.getWolBroadcastAddress(),
                                                       self.model.getWolMacAddress(),
                                                       self.model.get_net_address(), int(self.model.get_port_number()),
-                                                      self.model.get_disconnect_when_done())
+                                                      self.model.get_disconnect_when_done(),
+                                                      reconnect_seconds=settings.get_reconnect_seconds(),
+                                                      retry_policy=retry_policy)
             self._worker_object.consoleLine.connect(self.add_line_to_console_frame)
-            self._worker_object.startRowIndex.connect(self.session_started_row_index)
-            self._worker_object.startProgressBar.connect(self.start_session_progress_bar)
-            self._worker_object.updateProgressBar.connect(self.update_session_progress_bar)
             self._worker_object.displayCameraPath.connect(self.display_camera_path)
             self._worker_object.frameAcquired.connect(self.frame_acquired)
             self._worker_object.coolerStarted.connect(self.cooler_started)
             self._worker_object.coolerStopped.connect(self.cooler_stopped)
+            self.start_session_log_file()
+            self.start_status_timer()
+            self.start_metrics_server()
 
             # Create thread and attach worker object to it
             self._qthread = QThread()
@@ -1234,51 +1316,37 @@ class MainWindow(QMainWindow):
     def thread_finished(self):
         """Receive signal that acquisition thread is finished, and clean up"""
         # print("threadFinished")
+        self.stop_status_timer()
+        self.stop_metrics_server()
+        self.save_session_timing_report()
+        self.ui.progressBar.setMaximum(1)  # A maximum of 0 (busy) would keep the bar animating
         self.ui.progressBar.setValue(0)
         self.cooler_stopped()
+        self._console_model.stop_log_file()
         self._qthread = None
         self._worker_object = None
         self._thread_controller = None
         self.derestrict_session_buttons()
 
     # WOrker thread has told us the camera cooler has started.
-    # This allows us to set up a timer to display the cooler power
+    # The worker reads the cooler power every so often and publishes it in the session status;
+    # it is displayed (by show_session_status) once the first reading arrives.
     @tracelog
     def cooler_started(self):
-        """Receive signal that camera cooling has started. Set timer to update power display"""
+        """Receive signal that camera cooling has started. Show the power display"""
         # print("cooler_started")
-        # Get our own instance of the server for talking to TheSkyX
-        self._cooling_server = TheSkyX(self.model.get_net_address(), int(self.model.get_port_number()))
-
-        # Set up a timer to update the cooling power display occasionally
-        timer = QTimer()
-        self._cooler_timer = timer
-        timer.timeout.connect(self.cooler_timer_fired)
-        # timer.start(5 * 1000)
-        timer.start(MainWindow.COOLER_POWER_UPDATE_INTERVAL * 1000)
-
-    @tracelog
-    def cooler_timer_fired(self):
-        """Periodic timer to update the cooler power display"""
-        # print("cooler_timer_fired")
-        (success, cooler_power, message) = self._cooling_server.get_cooler_power()
-        if success:
-            self.ui.coolerPowerLabel.setVisible(True)
-            self.ui.coolerPowerValue.setVisible(True)
-            self.ui.coolerPowerValue.setText(f"{cooler_power}%")
+        self.ui.coolerPowerLabel.setVisible(True)
+        self.ui.coolerPowerValue.setVisible(True)
+        self.ui.coolerPowerValue.setText("")
 
     # WOrker thread has told us the camera cooler has stopped.
-    # This allows us to stop the cooler power timer and remove that display item
+    # This allows us to remove that display item
     @tracelog
     def cooler_stopped(self):
-        """Receive signal that camera cooling has sotpped, stop power timer"""
+        """Receive signal that camera cooling has sotpped, hide the power display"""
         # print("cooler_stopped")
-        if self._cooler_timer is not None:
-            self._cooler_timer.stop()
-            self._cooler_timer = None
         self.ui.coolerPowerLabel.setVisible(False)
         self.ui.coolerPowerValue.setVisible(False)
-        self._cooling_server = None
 
     # The worker thread reports that a frame has been successfully acquired.
     # If the option is on, do a save after the acquisition
@@ -1288,42 +1356,139 @@ class MainWindow(QMainWindow):
         """Receive signal that a frame has been acquired. Update number complete"""
         # print(f"frame_acquired.  Frame Set: {frame_set}")
         frame_set.set_number_complete(frame_set.get_number_complete() + 1)
-        # Tell the session table model about this change so the on-screen table can update
+        # Tell the table models about this change so the on-screen tables can update
         self._session_table_model.table_row_changed(row_index)
+        self._plan_table_model.frame_set_changed(frame_set)
         if self.model.get_auto_save_after_each_frame():
+            save_started = perf_counter()
             self.save_menu_triggered(None)
+            if self._thread_controller is not None:
+                self._thread_controller.add_save_seconds(row_index, perf_counter() - save_started)
 
     @tracelog
     def add_line_to_console_frame(self, message: str, level: int):
         """Receive signal requesting a line be placed in the console frame"""
         # print(f"addLineToConsoleFrame({message})")
-        self._mutex.lock()
         time_formatted = strftime("%H:%M:%S ")
         indent_string = ""
         if level > 1:
             indentation_block = " " * MainWindow.INDENTATION_DEPTH
             indent_string = indentation_block * (level - 1)
 
-        # Create the text line to go in the console
-        list_item: QListWidgetItem = QListWidgetItem(time_formatted + " " + indent_string + message)
-
-        # Set its font size according to the settings
-        item_font: QFont = list_item.font()
-        settings = QSettings()
-        item_font.setPointSize(settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING))
-        list_item.setFont(item_font)
+        # Add to bottom of console.  The console model adds lines in batches and
+        # scrolls to the bottom once per batch.
+        self._console_model.add_line(time_formatted + " " + indent_string + message)
+
+    # Start a new log file, in the application's data directory, that receives all the console
+    # lines of this session.  (The console itself only keeps the most recent lines.)
+    @tracelog
+    def start_session_log_file(self):
+        """Start copying console lines to a log file for this session"""
+        log_directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation),
+                                     MainWindow.SESSION_LOG_DIRECTORY)
+        log_path = os.path.join(log_directory, datetime.now().strftime("session-%Y-%m-%d-%H%M%S.log"))
+        try:
+            os.makedirs(log_directory, exist_ok=True)
+            (success, message) = self._console_model.start_log_file(log_path)
+        except OSError as error:
+            (success, message) = (False, str(error))
+        if success:
+            self.add_line_to_console_frame(f"Session log: {log_path}", 1)
+        else:
+            self.add_line_to_console_frame(f"Unable to write session log {log_path}: {message}", 1)
+
+    # If a metrics port is set in the preferences, serve the session's progress there for monitoring
+    @tracelog
+    def start_metrics_server(self):
+        """Start the session metrics endpoint, if one is wanted"""
+        metrics_port = SettingsCache.instance().get_metrics_port()
+        if metrics_port == 0:
+            return
+        try:
+            self._metrics_server = SessionMetricsServer(self._thread_controller, self._session_framesets,
+                                                        port=metrics_port)
+        except OSError as error:
+            self.add_line_to_console_frame(f"Unable to serve metrics on port {metrics_port}: {error}", 1)
+            return
+        self._metrics_server.start()
+        self.add_line_to_console_frame(f"Serving metrics at http://localhost:{metrics_port}"
+                                       + SessionMetricsServer.METRICS_PATH, 1)
+
+    @tracelog
+    def stop_metrics_server(self):
+        """Stop the session metrics endpoint"""
+        if self._metrics_server is not None:
+            self._metrics_server.stop()
+            self._metrics_server = None
+
+    # Write the session's timing report (see SessionTimingReport) beside the plan file, or in the
+    # session log directory if the plan hasn't been saved.
+    @tracelog
+    def save_session_timing_report(self):
+        """Save the per-frame timing and dead time totals of the session just ended"""
+        if self._thread_controller is None:
+            return  # The session never started (e.g. the save dialog was cancelled)
+        timing_report = self._thread_controller.get_timing_report()
+        if len(timing_report.frames) == 0:
+            return
+        if self._file_path != "":
+            plan_path = self._file_path
+        else:
+            plan_path = os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppLocalDataLocation),
+                                     MainWindow.SESSION_LOG_DIRECTORY, "session")
+        (success, message) = timing_report.save_beside(plan_path)
+        if success:
+            self.add_line_to_console_frame(f"Session timing report: {message}", 1)
+        else:
+            self.add_line_to_console_frame(f"Unable to write session timing report: {message}", 1)
 
-        # Add to bottom of console and scroll to it
-        self.ui.consoleList.addItem(list_item)
-        self.ui.consoleList.scrollToItem(list_item)
-        self._mutex.unlock()
+    # The worker publishes its progress in the controller's session status rather than signalling
+    # each change.  While the session runs, a timer redraws the latest status a few times a second.
+    @tracelog
+    def start_status_timer(self):
+        """Start the timer that redraws the session status while the session runs"""
+        self._status_version_shown = -1
+        self._status_row_shown = SessionStatus.NO_ROW
+        self._status_timer = QTimer()
+        self._status_timer.timeout.connect(self.show_session_status)
+        self._status_timer.start(MainWindow.SESSION_STATUS_UPDATE_INTERVAL)
 
     @tracelog
-    def session_started_row_index(self, row_index: int):
-        """Receive signal that a new row has started, highlight that row"""
-        # print(f"session_started_row_index({row_index})")
-        # Select the row in the table corresponding to this index, so it highlights
-        self._mutex.lock()
+    def stop_status_timer(self):
+        """Stop redrawing the session status, drawing it a final time"""
+        if self._status_timer is not None:
+            self._status_timer.stop()
+            self._status_timer = None
+            self.show_session_status()
+
+    # tracelog
+    def show_session_status(self):
+        """Draw the latest session status: progress bar, working row, phase line"""
+        if self._thread_controller is None:
+            return
+        status = self._thread_controller.get_status()
+        if status.version == self._status_version_shown:
+            return
+        self._status_version_shown = status.version
+        self.ui.progressBar.setMaximum(status.progress_maximum)
+        self.ui.progressBar.setValue(min(status.progress_value, status.progress_maximum))
+        self.ui.sessionStatus.setText(status.summary_text())
+        if status.cooler_power is not None:
+            self.ui.coolerPowerValue.setText(f"{status.cooler_power}%")
+        if status.row_index != self._status_row_shown:
+            self._status_row_shown = status.row_index
+            self.highlight_session_row(status.row_index)
+
+    # Select the row in the table corresponding to this index, so it highlights
+    @tracelog
+    def highlight_session_row(self, row_index: int):
+        """Highlight the row of the frame set being worked on"""
+        # print(f"highlight_session_row({row_index})")
+        selection_model: QItemSelectionModel = self.ui.sessionTable.selectionModel()
+        selection_model.clearSelection()
+        if row_index == SessionStatus.NO_ROW:
+            return
+        self._session_table_model.fetch_through(row_index)
         selection: QItemSelection = QItemSelection()
         model_index_top_left: QModelIndex = self._session_table_model.createIndex(row_index, 0)
         model_index_bottom_right: QModelIndex = \
@@ -1331,31 +1496,9 @@ class MainWindow(QMainWindow):
                                                   FrameSet.NUMBER_OF_DISPLAY_FIELDS - 1)
         selection.select(model_index_top_left, model_index_bottom_right)
         # Set the selection to that  row
-        selection_model: QItemSelectionModel = self.ui.sessionTable.selectionModel()
-        selection_model.clearSelection()
         selection_model.select(selection, QItemSelectionModel.Select)
         # Scroll to ensure the selected row is in view
         self.ui.sessionTable.scrollTo(model_index_top_left)
-        self._mutex.unlock()
-
-    # self._worker_object.startProgressBar.connect(self.start_session_progress_bar)
-    # tracelog
-    def start_session_progress_bar(self, bar_maximum: int):
-        """Receive signal to turn on and start the progress bar"""
-        # print(f"start_session_progress_bar({bar_maximum})")
-        self._mutex.lock()
-        self.ui.progressBar.setMaximum(bar_maximum)
-        self.ui.progressBar.setValue(0)
-        self._mutex.unlock()
-
-    # self._worker_object.updateProgressBar.connect(self.update_session_progress_bar)
-    # tracelog
-    def update_session_progress_bar(self, new_value: int):
-        """Receive signal to update the progress bar"""
-        # print(f"update_session_progress_bar({new_value})")
-        self._mutex.lock()
-        self.ui.progressBar.setValue(new_value)
-        self._mutex.unlock()
 
     # Restore the controls that were disabled during the session
     @tracelog
@@ -1399,8 +1542,7 @@ class MainWindow(QMainWindow):
             self.set_is_dirty(False)
 
             #  Remember this path in preferences so we come here next time
-            settings = QSettings()
-            settings.setValue("last_opened_path", file_name)
+            SettingsCache.instance().set_value("last_opened_path", file_name)
 
     # We're about to start a session that has "autosave after each frame" selected.
     # There needs to be a save file established.  If there isn't, use a dialog to ask
@@ -1453,7 +1595,7 @@ class MainWindow(QMainWindow):
         """Open menu selected - load a saved file"""
         # print("openMenuTriggered")
         #  Get last path from preferences to start the open dialog there
-        settings = QSettings()
+        settings = SettingsCache.instance()
         last_opened_path = settings.value("last_opened_path")
         if last_opened_path is None:
             last_opened_path = ""
@@ -1478,7 +1620,7 @@ class MainWindow(QMainWindow):
             self._file_path = file_name
 
             #  Remember this path in preferences so we come here next time
-            settings.setValue("last_opened_path", file_name)
+            settings.set_value("last_opened_path", file_name)
 
     @tracelog
     def new_menu_triggered(self, _):
@@ -1617,9 +1759,7 @@ class MainWindow(QMainWindow):
     @tracelog
     def display_camera_path(self, autosave_path: str):
         """Receive signal giving server's path to auto save files, display it in session window"""
-        self._mutex.lock()
         self.ui.cameraPath.setText(autosave_path)
-        self._mutex.unlock()
 
     # Catch window resizing so we can record the changed size
 
@@ -1628,8 +1768,7 @@ class MainWindow(QMainWindow):
             window_size = event.size()
             # height = event.size().height()
             # width = event.size().width()
-            settings = QSettings()
-            settings.setValue(MultiOsUtil.LAST_WINDOW_SIZE_SETTING, window_size)
+            SettingsCache.instance().set_value(MultiOsUtil.LAST_WINDOW_SIZE_SETTING, window_size)
         return False  # Didn't handle event
 
     # Menu to enlarge font size (by one point) in the window
@@ -1644,31 +1783,74 @@ class MainWindow(QMainWindow):
 
     @tracelog
     def increment_font_size(self, parent: QObject, increment: int):
-        settings = QSettings()
-        old_standard_font_size = settings.value(MultiOsUtil.STANDARD_FONT_SIZE_SETTING)
-        new_standard_font_size = old_standard_font_size + increment
-        settings.setValue(MultiOsUtil.STANDARD_FONT_SIZE_SETTING, new_standard_font_size)
+        settings = SettingsCache.instance()
+        new_standard_font_size = settings.get_standard_font_size() + increment
+        settings.set_standard_font_size(new_standard_font_size)
         MultiOsUtil.set_font_sizes(parent=parent,
                                    standard_size = new_standard_font_size,
                                    title_prefix = MultiOsUtil.MAIN_TITLE_LABEL_PREFIX,
                                    title_increment=MultiOsUtil.MAIN_TITLE_FONT_SIZE_INCREMENT,
                                    subtitle_prefix=MultiOsUtil.SUBTITLE_LABEL_PREFIX,
                                    subtitle_increment=MultiOsUtil.SUBTITLE_FONT_SIZE_INCREMENT)
+        self.fit_table_columns()
 
     @tracelog
     def font_size_reset(self, _):
-        settings = QSettings()
-        settings.setValue(MultiOsUtil.STANDARD_FONT_SIZE_SETTING, MultiOsUtil.STANDARD_FONT_SIZE)
+        SettingsCache.instance().set_standard_font_size(MultiOsUtil.STANDARD_FONT_SIZE)
         MultiOsUtil.set_font_sizes(parent=self.ui,
                                    standard_size=MultiOsUtil.STANDARD_FONT_SIZE,
                                    title_prefix=MultiOsUtil.MAIN_TITLE_LABEL_PREFIX,
                                    title_increment=MultiOsUtil.MAIN_TITLE_FONT_SIZE_INCREMENT,
                                    subtitle_prefix=MultiOsUtil.SUBTITLE_LABEL_PREFIX,
                                    subtitle_increment=MultiOsUtil.SUBTITLE_FONT_SIZE_INCREMENT)
+        self.fit_table_columns()
 
     # Set the flag that tracelog uses to dump call/exit info
     def write_trace_info_clicked(self):
-        settings = QSettings()
-        settings.setValue(TRACE_LOG_SETTING, self.ui.writeTraceInfo.isChecked())
+        SettingsCache.instance().set_trace_log(self.ui.writeTraceInfo.isChecked())
+
+    # Preferences apply to all plans, so they are saved in the settings, not the open document
+
+    @tracelog
+    def console_capacity_finished(self):
+        """Validate and record new value entered in console capacity field"""
+        proposed_value: str = self.ui.consoleCapacity.text()
+        converted_value: int = Validators.valid_int_in_range(proposed_value, 100, 1000000)
+        if converted_value is not None:
+            SettingsCache.instance().set_console_capacity(converted_value)
+        else:
+            self.ui.consoleCapacity.setText("INVALID")
+
+    @tracelog
+    def metrics_port_finished(self):
+        """Validate and record new value entered in metrics port field (used from the next session)"""
+        proposed_value: str = self.ui.metricsPort.text()
+        converted_value: int = Validators.valid_int_in_range(proposed_value, 0, 65535)
+        if converted_value is not None:
+            SettingsCache.instance().set_metrics_port(converted_value)
+        else:
+            self.ui.metricsPort.setText("INVALID")
+
+    @tracelog
+    def reconnect_seconds_finished(self):
+        """Validate and record new value entered in reconnect seconds field (used from the next session)"""
+        proposed_value: str = self.ui.reconnectSeconds.text()
+        converted_value: int = Validators.valid_int_in_range(proposed_value, 0, 24 * 60 * 60)
+        if converted_value is not None:
+            SettingsCache.instance().set_reconnect_seconds(converted_value)
+        else:
+            self.ui.reconnectSeconds.setText("INVALID")
+
+    # The policy is long, so an invalid one is left in the field to be corrected, with the reason beside it
+    @tracelog
+    def frame_retry_policy_finished(self):
+        """Validate and record new frame retry policy (used from the next session); empty for the defaults"""
+        proposed_value: str = self.ui.frameRetryPolicy.text().strip()
+        (retry_policy, message) = FrameRetryPolicy.parse(proposed_value)
+        if retry_policy is not None:
+            SettingsCache.instance().set_frame_retry_policy(proposed_value)
+            self.ui.frameRetryPolicyMessage.setText("")
+        else:
+            self.ui.frameRetryPolicyMessage.setText(message)
 
     # TODO Change to "red field" validation notice, as in Flats program
\ No newline at end of file
@@ -0,0 +1,907 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'MainWindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(794, 581)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(794, 581))
+        MainWindow.setMaximumSize(QtCore.QSize(1600, 1200))
+        MainWindow.setAnimated(False)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout_8 = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        self.mainTabView = QtWidgets.QTabWidget(self.centralwidget)
+        self.mainTabView.setToolTip("")
+        self.mainTabView.setObjectName("mainTabView")
+        self.startEndTab = QtWidgets.QWidget()
+        self.startEndTab.setObjectName("startEndTab")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.startEndTab)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.MainTitle_1 = QtWidgets.QLabel(self.startEndTab)
+        self.MainTitle_1.setMinimumSize(QtCore.QSize(0, 32))
+        self.MainTitle_1.setMaximumSize(QtCore.QSize(16777215, 32))
+        self.MainTitle_1.setObjectName("MainTitle_1")
+        self.gridLayout_3.addWidget(self.MainTitle_1, 0, 0, 1, 3, QtCore.Qt.AlignHCenter)
+        spacerItem = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem, 4, 1, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_3.addItem(spacerItem1, 2, 1, 1, 1)
+        self.gridLayout = QtWidgets.QGridLayout()
+        self.gridLayout.setObjectName("gridLayout")
+        self.Subtitle_1 = QtWidgets.QLabel(self.startEndTab)
+        self.Subtitle_1.setObjectName("Subtitle_1")
+        self.gridLayout.addWidget(self.Subtitle_1, 0, 0, 1, 2)
+        self.label_6 = QtWidgets.QLabel(self.startEndTab)
+        self.label_6.setObjectName("label_6")
+        self.gridLayout.addWidget(self.label_6, 1, 0, 1, 1)
+        self.startTimeAstronomical = QtWidgets.QRadioButton(self.startEndTab)
+        self.startTimeAstronomical.setStatusTip("")
+        self.startTimeAstronomical.setObjectName("startTimeAstronomical")
+        self.startTime = QtWidgets.QButtonGroup(MainWindow)
+        self.startTime.setObjectName("startTime")
+        self.startTime.addButton(self.startTimeAstronomical)
+        self.gridLayout.addWidget(self.startTimeAstronomical, 8, 1, 1, 1)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.startTimeGiven = QtWidgets.QRadioButton(self.startEndTab)
+        self.startTimeGiven.setStatusTip("")
+        self.startTimeGiven.setObjectName("startTimeGiven")
+        self.startTime.addButton(self.startTimeGiven)
+        self.horizontalLayout_3.addWidget(self.startTimeGiven)
+        self.startTimeEdit = QtWidgets.QTimeEdit(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.startTimeEdit.sizePolicy().hasHeightForWidth())
+        self.startTimeEdit.setSizePolicy(sizePolicy)
+        self.startTimeEdit.setMinimumSize(QtCore.QSize(113, 21))
+        self.startTimeEdit.setStatusTip("")
+        self.startTimeEdit.setObjectName("startTimeEdit")
+        self.horizontalLayout_3.addWidget(self.startTimeEdit)
+        self.gridLayout.addLayout(self.horizontalLayout_3, 9, 1, 1, 1)
+        self.label_7 = QtWidgets.QLabel(self.startEndTab)
+        self.label_7.setObjectName("label_7")
+        self.gridLayout.addWidget(self.label_7, 4, 0, 1, 1)
+        self.startDateNow = QtWidgets.QRadioButton(self.startEndTab)
+        self.startDateNow.setObjectName("startDateNow")
+        self.startDay = QtWidgets.QButtonGroup(MainWindow)
+        self.startDay.setObjectName("startDay")
+        self.startDay.addButton(self.startDateNow)
+        self.gridLayout.addWidget(self.startDateNow, 1, 1, 1, 1)
+        self.startTimeNautical = QtWidgets.QRadioButton(self.startEndTab)
+        self.startTimeNautical.setStatusTip("")
+        self.startTimeNautical.setObjectName("startTimeNautical")
+        self.startTime.addButton(self.startTimeNautical)
+        self.gridLayout.addWidget(self.startTimeNautical, 7, 1, 1, 1)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.startDateGiven = QtWidgets.QRadioButton(self.startEndTab)
+        self.startDateGiven.setObjectName("startDateGiven")
+        self.startDay.addButton(self.startDateGiven)
+        self.horizontalLayout_2.addWidget(self.startDateGiven)
+        self.startDateEdit = QtWidgets.QDateEdit(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.startDateEdit.sizePolicy().hasHeightForWidth())
+        self.startDateEdit.setSizePolicy(sizePolicy)
+        self.startDateEdit.setMinimumSize(QtCore.QSize(92, 21))
+        self.startDateEdit.setStatusTip("")
+        self.startDateEdit.setObjectName("startDateEdit")
+        self.horizontalLayout_2.addWidget(self.startDateEdit)
+        self.gridLayout.addLayout(self.horizontalLayout_2, 3, 1, 1, 1)
+        self.startDateToday = QtWidgets.QRadioButton(self.startEndTab)
+        self.startDateToday.setObjectName("startDateToday")
+        self.startDay.addButton(self.startDateToday)
+        self.gridLayout.addWidget(self.startDateToday, 2, 1, 1, 1)
+        self.calculatedStartTime = QtWidgets.QLabel(self.startEndTab)
+        self.calculatedStartTime.setText("")
+        self.calculatedStartTime.setObjectName("calculatedStartTime")
+        self.gridLayout.addWidget(self.calculatedStartTime, 9, 0, 1, 1)
+        self.startTimeCivil = QtWidgets.QRadioButton(self.startEndTab)
+        self.startTimeCivil.setStatusTip("")
+        self.startTimeCivil.setObjectName("startTimeCivil")
+        self.startTime.addButton(self.startTimeCivil)
+        self.gridLayout.addWidget(self.startTimeCivil, 6, 1, 1, 1)
+        self.startTimeSunset = QtWidgets.QRadioButton(self.startEndTab)
+        self.startTimeSunset.setStatusTip("")
+        self.startTimeSunset.setObjectName("startTimeSunset")
+        self.startTime.addButton(self.startTimeSunset)
+        self.gridLayout.addWidget(self.startTimeSunset, 4, 1, 1, 1)
+        self.gridLayout_3.addLayout(self.gridLayout, 2, 0, 1, 1)
+        self.gridLayout_2 = QtWidgets.QGridLayout()
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.label_10 = QtWidgets.QLabel(self.startEndTab)
+        self.label_10.setObjectName("label_10")
+        self.gridLayout_2.addWidget(self.label_10, 1, 0, 1, 1)
+        self.endTimeNautical = QtWidgets.QRadioButton(self.startEndTab)
+        self.endTimeNautical.setObjectName("endTimeNautical")
+        self.endTimeButtonGroup = QtWidgets.QButtonGroup(MainWindow)
+        self.endTimeButtonGroup.setObjectName("endTimeButtonGroup")
+        self.endTimeButtonGroup.addButton(self.endTimeNautical)
+        self.gridLayout_2.addWidget(self.endTimeNautical, 6, 1, 1, 1)
+        self.horizontalLayout_5 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_5.setObjectName("horizontalLayout_5")
+        self.endTimeGiven = QtWidgets.QRadioButton(self.startEndTab)
+        self.endTimeGiven.setObjectName("endTimeGiven")
+        self.endTimeButtonGroup.addButton(self.endTimeGiven)
+        self.horizontalLayout_5.addWidget(self.endTimeGiven)
+        self.endTimeEdit = QtWidgets.QTimeEdit(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.endTimeEdit.sizePolicy().hasHeightForWidth())
+        self.endTimeEdit.setSizePolicy(sizePolicy)
+        self.endTimeEdit.setMinimumSize(QtCore.QSize(92, 21))
+        self.endTimeEdit.setObjectName("endTimeEdit")
+        self.horizontalLayout_5.addWidget(self.endTimeEdit)
+        self.gridLayout_2.addLayout(self.horizontalLayout_5, 8, 1, 1, 1)
+        self.endTimeAstronomical = QtWidgets.QRadioButton(self.startEndTab)
+        self.endTimeAstronomical.setObjectName("endTimeAstronomical")
+        self.endTimeButtonGroup.addButton(self.endTimeAstronomical)
+        self.gridLayout_2.addWidget(self.endTimeAstronomical, 7, 1, 1, 1)
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        self.endDateGiven = QtWidgets.QRadioButton(self.startEndTab)
+        self.endDateGiven.setObjectName("endDateGiven")
+        self.endDateButtonGroup = QtWidgets.QButtonGroup(MainWindow)
+        self.endDateButtonGroup.setObjectName("endDateButtonGroup")
+        self.endDateButtonGroup.addButton(self.endDateGiven)
+        self.horizontalLayout_4.addWidget(self.endDateGiven)
+        self.endDateEdit = QtWidgets.QDateEdit(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.endDateEdit.sizePolicy().hasHeightForWidth())
+        self.endDateEdit.setSizePolicy(sizePolicy)
+        self.endDateEdit.setMinimumSize(QtCore.QSize(92, 21))
+        self.endDateEdit.setObjectName("endDateEdit")
+        self.horizontalLayout_4.addWidget(self.endDateEdit)
+        self.gridLayout_2.addLayout(self.horizontalLayout_4, 3, 1, 1, 1)
+        self.endDateTodayTomorrow = QtWidgets.QRadioButton(self.startEndTab)
+        self.endDateTodayTomorrow.setObjectName("endDateTodayTomorrow")
+        self.endDateButtonGroup.addButton(self.endDateTodayTomorrow)
+        self.gridLayout_2.addWidget(self.endDateTodayTomorrow, 2, 1, 1, 1)
+        self.endDateWhenDone = QtWidgets.QRadioButton(self.startEndTab)
+        self.endDateWhenDone.setObjectName("endDateWhenDone")
+        self.endDateButtonGroup.addButton(self.endDateWhenDone)
+        self.gridLayout_2.addWidget(self.endDateWhenDone, 1, 1, 1, 1)
+        self.Subtitle_2 = QtWidgets.QLabel(self.startEndTab)
+        self.Subtitle_2.setObjectName("Subtitle_2")
+        self.gridLayout_2.addWidget(self.Subtitle_2, 0, 0, 1, 2)
+        self.endTimeCivil = QtWidgets.QRadioButton(self.startEndTab)
+        self.endTimeCivil.setObjectName("endTimeCivil")
+        self.endTimeButtonGroup.addButton(self.endTimeCivil)
+        self.gridLayout_2.addWidget(self.endTimeCivil, 5, 1, 1, 1)
+        self.calculatedEndTime = QtWidgets.QLabel(self.startEndTab)
+        self.calculatedEndTime.setText("")
+        self.calculatedEndTime.setObjectName("calculatedEndTime")
+        self.gridLayout_2.addWidget(self.calculatedEndTime, 8, 0, 1, 1)
+        self.endTimeSunrise = QtWidgets.QRadioButton(self.startEndTab)
+        self.endTimeSunrise.setObjectName("endTimeSunrise")
+        self.endTimeButtonGroup.addButton(self.endTimeSunrise)
+        self.gridLayout_2.addWidget(self.endTimeSunrise, 4, 1, 1, 1)
+        self.label_11 = QtWidgets.QLabel(self.startEndTab)
+        self.label_11.setObjectName("label_11")
+        self.gridLayout_2.addWidget(self.label_11, 4, 0, 1, 1)
+        self.gridLayout_3.addLayout(self.gridLayout_2, 2, 2, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(20, 8, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout_3.addItem(spacerItem2, 3, 0, 1, 1)
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.Subtitle_3 = QtWidgets.QLabel(self.startEndTab)
+        self.Subtitle_3.setMinimumSize(QtCore.QSize(0, 28))
+        self.Subtitle_3.setMaximumSize(QtCore.QSize(16777215, 28))
+        self.Subtitle_3.setObjectName("Subtitle_3")
+        self.verticalLayout_2.addWidget(self.Subtitle_3)
+        self.formLayout = QtWidgets.QFormLayout()
+        self.formLayout.setVerticalSpacing(6)
+        self.formLayout.setObjectName("formLayout")
+        self.label_13 = QtWidgets.QLabel(self.startEndTab)
+        self.label_13.setObjectName("label_13")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label_13)
+        self.locName = QtWidgets.QLineEdit(self.startEndTab)
+        self.locName.setObjectName("locName")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.locName)
+        self.label_14 = QtWidgets.QLabel(self.startEndTab)
+        self.label_14.setObjectName("label_14")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_14)
+        self.timeZone = QtWidgets.QLineEdit(self.startEndTab)
+        self.timeZone.setStatusTip("")
+        self.timeZone.setWhatsThis("")
+        self.timeZone.setAccessibleDescription("")
+        self.timeZone.setObjectName("timeZone")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.timeZone)
+        self.label_15 = QtWidgets.QLabel(self.startEndTab)
+        self.label_15.setObjectName("label_15")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.label_15)
+        self.latitude = QtWidgets.QLineEdit(self.startEndTab)
+        self.latitude.setObjectName("latitude")
+        self.formLayout.setWidget(2, QtWidgets.QFormLayout.FieldRole, self.latitude)
+        self.label_16 = QtWidgets.QLabel(self.startEndTab)
+        self.label_16.setObjectName("label_16")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.LabelRole, self.label_16)
+        self.longitude = QtWidgets.QLineEdit(self.startEndTab)
+        self.longitude.setObjectName("longitude")
+        self.formLayout.setWidget(3, QtWidgets.QFormLayout.FieldRole, self.longitude)
+        self.verticalLayout_2.addLayout(self.formLayout)
+        self.gridLayout_3.addLayout(self.verticalLayout_2, 4, 0, 1, 1)
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout()
+        self.verticalLayout_3.setSizeConstraint(QtWidgets.QLayout.SetFixedSize)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.Subtitle_4 = QtWidgets.QLabel(self.startEndTab)
+        self.Subtitle_4.setMinimumSize(QtCore.QSize(0, 28))
+        self.Subtitle_4.setMaximumSize(QtCore.QSize(16777215, 28))
+        self.Subtitle_4.setObjectName("Subtitle_4")
+        self.verticalLayout_3.addWidget(self.Subtitle_4)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.warmCCDWhenDone = QtWidgets.QCheckBox(self.startEndTab)
+        self.warmCCDWhenDone.setObjectName("warmCCDWhenDone")
+        self.horizontalLayout.addWidget(self.warmCCDWhenDone)
+        self.warmCCDSeconds = QtWidgets.QLineEdit(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.MinimumExpanding, QtWidgets.QSizePolicy.MinimumExpanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.warmCCDSeconds.sizePolicy().hasHeightForWidth())
+        self.warmCCDSeconds.setSizePolicy(sizePolicy)
+        self.warmCCDSeconds.setObjectName("warmCCDSeconds")
+        self.horizontalLayout.addWidget(self.warmCCDSeconds)
+        self.label_18 = QtWidgets.QLabel(self.startEndTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_18.sizePolicy().hasHeightForWidth())
+        self.label_18.setSizePolicy(sizePolicy)
+        self.label_18.setObjectName("label_18")
+        self.horizontalLayout.addWidget(self.label_18)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        self.disconnectWhenDone = QtWidgets.QCheckBox(self.startEndTab)
+        self.disconnectWhenDone.setObjectName("disconnectWhenDone")
+        self.verticalLayout_3.addWidget(self.disconnectWhenDone)
+        spacerItem3 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem3)
+        self.gridLayout_3.addLayout(self.verticalLayout_3, 4, 2, 1, 1)
+        spacerItem4 = QtWidgets.QSpacerItem(20, 30, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.gridLayout_3.addItem(spacerItem4, 1, 0, 1, 2)
+        self.mainTabView.addTab(self.startEndTab, "")
+        self.temperatureTab = QtWidgets.QWidget()
+        self.temperatureTab.setObjectName("temperatureTab")
+        self.gridLayout_10 = QtWidgets.QGridLayout(self.temperatureTab)
+        self.gridLayout_10.setObjectName("gridLayout_10")
+        self.frame = QtWidgets.QFrame(self.temperatureTab)
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.gridLayout_9 = QtWidgets.QGridLayout(self.frame)
+        self.gridLayout_9.setObjectName("gridLayout_9")
+        self.gridLayout_4 = QtWidgets.QGridLayout()
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.MainTitle_tab1 = QtWidgets.QLabel(self.frame)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.MainTitle_tab1.sizePolicy().hasHeightForWidth())
+        self.MainTitle_tab1.setSizePolicy(sizePolicy)
+        self.MainTitle_tab1.setMinimumSize(QtCore.QSize(0, 49))
+        self.MainTitle_tab1.setMaximumSize(QtCore.QSize(16777215, 50))
+        self.MainTitle_tab1.setObjectName("MainTitle_tab1")
+        self.gridLayout_4.addWidget(self.MainTitle_tab1, 0, 0, 1, 2, QtCore.Qt.AlignHCenter)
+        self.label_19 = QtWidgets.QLabel(self.frame)
+        self.label_19.setObjectName("label_19")
+        self.gridLayout_4.addWidget(self.label_19, 2, 0, 1, 1)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        self.targetTemperature = QtWidgets.QLineEdit(self.frame)
+        self.targetTemperature.setMinimumSize(QtCore.QSize(60, 0))
+        self.targetTemperature.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.targetTemperature.setObjectName("targetTemperature")
+        self.horizontalLayout_6.addWidget(self.targetTemperature)
+        self.label_24 = QtWidgets.QLabel(self.frame)
+        self.label_24.setObjectName("label_24")
+        self.horizontalLayout_6.addWidget(self.label_24)
+        self.gridLayout_4.addLayout(self.horizontalLayout_6, 2, 1, 1, 1)
+        self.label_23 = QtWidgets.QLabel(self.frame)
+        self.label_23.setObjectName("label_23")
+        self.gridLayout_4.addWidget(self.label_23, 3, 0, 1, 1)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        self.temperatureTolerance = QtWidgets.QLineEdit(self.frame)
+        self.temperatureTolerance.setMinimumSize(QtCore.QSize(60, 0))
+        self.temperatureTolerance.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.temperatureTolerance.setObjectName("temperatureTolerance")
+        self.horizontalLayout_7.addWidget(self.temperatureTolerance)
+        self.label_25 = QtWidgets.QLabel(self.frame)
+        self.label_25.setObjectName("label_25")
+        self.horizontalLayout_7.addWidget(self.label_25)
+        self.gridLayout_4.addLayout(self.horizontalLayout_7, 3, 1, 1, 1)
+        self.label_2 = QtWidgets.QLabel(self.frame)
+        self.label_2.setObjectName("label_2")
+        self.gridLayout_4.addWidget(self.label_2, 4, 0, 1, 1)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        self.coolingCheckInterval = QtWidgets.QLineEdit(self.frame)
+        self.coolingCheckInterval.setMinimumSize(QtCore.QSize(60, 0))
+        self.coolingCheckInterval.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.coolingCheckInterval.setObjectName("coolingCheckInterval")
+        self.horizontalLayout_8.addWidget(self.coolingCheckInterval)
+        self.label_26 = QtWidgets.QLabel(self.frame)
+        self.label_26.setObjectName("label_26")
+        self.horizontalLayout_8.addWidget(self.label_26)
+        self.gridLayout_4.addLayout(self.horizontalLayout_8, 4, 1, 1, 1)
+        self.label_22 = QtWidgets.QLabel(self.frame)
+        self.label_22.setObjectName("label_22")
+        self.gridLayout_4.addWidget(self.label_22, 5, 0, 1, 1)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        self.coolingMaxTryTime = QtWidgets.QLineEdit(self.frame)
+        self.coolingMaxTryTime.setMinimumSize(QtCore.QSize(60, 0))
+        self.coolingMaxTryTime.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.coolingMaxTryTime.setObjectName("coolingMaxTryTime")
+        self.horizontalLayout_9.addWidget(self.coolingMaxTryTime)
+        self.label_27 = QtWidgets.QLabel(self.frame)
+        self.label_27.setObjectName("label_27")
+        self.horizontalLayout_9.addWidget(self.label_27)
+        self.gridLayout_4.addLayout(self.horizontalLayout_9, 5, 1, 1, 1)
+        self.label_21 = QtWidgets.QLabel(self.frame)
+        self.label_21.setObjectName("label_21")
+        self.gridLayout_4.addWidget(self.label_21, 6, 0, 1, 1)
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.coolingMaxRetryCount = QtWidgets.QLineEdit(self.frame)
+        self.coolingMaxRetryCount.setMinimumSize(QtCore.QSize(60, 0))
+        self.coolingMaxRetryCount.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.coolingMaxRetryCount.setObjectName("coolingMaxRetryCount")
+        self.horizontalLayout_13.addWidget(self.coolingMaxRetryCount)
+        self.label_28 = QtWidgets.QLabel(self.frame)
+        self.label_28.setObjectName("label_28")
+        self.horizontalLayout_13.addWidget(self.label_28)
+        self.gridLayout_4.addLayout(self.horizontalLayout_13, 6, 1, 1, 1)
+        self.label_20 = QtWidgets.QLabel(self.frame)
+        self.label_20.setObjectName("label_20")
+        self.gridLayout_4.addWidget(self.label_20, 7, 0, 1, 1)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.coolingRetryDelay = QtWidgets.QLineEdit(self.frame)
+        self.coolingRetryDelay.setMinimumSize(QtCore.QSize(60, 0))
+        self.coolingRetryDelay.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.coolingRetryDelay.setObjectName("coolingRetryDelay")
+        self.horizontalLayout_11.addWidget(self.coolingRetryDelay)
+        self.label_29 = QtWidgets.QLabel(self.frame)
+        self.label_29.setObjectName("label_29")
+        self.horizontalLayout_11.addWidget(self.label_29)
+        self.gridLayout_4.addLayout(self.horizontalLayout_11, 7, 1, 1, 1)
+        self.abortIfTempRises = QtWidgets.QCheckBox(self.frame)
+        self.abortIfTempRises.setObjectName("abortIfTempRises")
+        self.gridLayout_4.addWidget(self.abortIfTempRises, 8, 0, 1, 1)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        self.tempRiseAbortThreshold = QtWidgets.QLineEdit(self.frame)
+        self.tempRiseAbortThreshold.setMinimumSize(QtCore.QSize(60, 0))
+        self.tempRiseAbortThreshold.setMaximumSize(QtCore.QSize(60, 16777215))
+        self.tempRiseAbortThreshold.setObjectName("tempRiseAbortThreshold")
+        self.horizontalLayout_10.addWidget(self.tempRiseAbortThreshold)
+        self.label_32 = QtWidgets.QLabel(self.frame)
+        self.label_32.setObjectName("label_32")
+        self.horizontalLayout_10.addWidget(self.label_32)
+        self.gridLayout_4.addLayout(self.horizontalLayout_10, 8, 1, 1, 1)
+        self.ccdIsRegulated = QtWidgets.QCheckBox(self.frame)
+        self.ccdIsRegulated.setObjectName("ccdIsRegulated")
+        self.gridLayout_4.addWidget(self.ccdIsRegulated, 1, 0, 1, 1)
+        self.gridLayout_9.addLayout(self.gridLayout_4, 0, 0, 1, 1)
+        self.gridLayout_10.addWidget(self.frame, 0, 0, 1, 1)
+        self.mainTabView.addTab(self.temperatureTab, "")
+        self.skyXServerTab = QtWidgets.QWidget()
+        self.skyXServerTab.setObjectName("skyXServerTab")
+        self.gridLayout_11 = QtWidgets.QGridLayout(self.skyXServerTab)
+        self.gridLayout_11.setObjectName("gridLayout_11")
+        self.gridLayout_5 = QtWidgets.QGridLayout()
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        spacerItem5 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.gridLayout_5.addItem(spacerItem5, 1, 0, 1, 1)
+        self.label_35 = QtWidgets.QLabel(self.skyXServerTab)
+        self.label_35.setObjectName("label_35")
+        self.gridLayout_5.addWidget(self.label_35, 4, 3, 1, 1)
+        self.testConnectionMessage = QtWidgets.QLabel(self.skyXServerTab)
+        self.testConnectionMessage.setText("")
+        self.testConnectionMessage.setObjectName("testConnectionMessage")
+        self.gridLayout_5.addWidget(self.testConnectionMessage, 7, 1, 1, 1)
+        self.label_37 = QtWidgets.QLabel(self.skyXServerTab)
+        self.label_37.setObjectName("label_37")
+        self.gridLayout_5.addWidget(self.label_37, 6, 3, 1, 1)
+        self.label_36 = QtWidgets.QLabel(self.skyXServerTab)
+        self.label_36.setObjectName("label_36")
+        self.gridLayout_5.addWidget(self.label_36, 5, 3, 1, 1)
+        self.wolMacAddress = QtWidgets.QLineEdit(self.skyXServerTab)
+        self.wolMacAddress.setObjectName("wolMacAddress")
+        self.gridLayout_5.addWidget(self.wolMacAddress, 5, 4, 1, 1)
+        spacerItem6 = QtWidgets.QSpacerItem(30, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_5.addItem(spacerItem6, 5, 2, 1, 1)
+        self.wolBroadcastAddress = QtWidgets.QLineEdit(self.skyXServerTab)
+        self.wolBroadcastAddress.setObjectName("wolBroadcastAddress")
+        self.gridLayout_5.addWidget(self.wolBroadcastAddress, 6, 4, 1, 1)
+        self.sendWolNowButton = QtWidgets.QPushButton(self.skyXServerTab)
+        self.sendWolNowButton.setObjectName("sendWolNowButton")
+        self.gridLayout_5.addWidget(self.sendWolNowButton, 7, 3, 1, 1, QtCore.Qt.AlignVCenter)
+        self.sendWOLSecondsBefore = QtWidgets.QLineEdit(self.skyXServerTab)
+        self.sendWOLSecondsBefore.setObjectName("sendWOLSecondsBefore")
+        self.gridLayout_5.addWidget(self.sendWOLSecondsBefore, 4, 4, 1, 1)
+        self.testConnectionButton = QtWidgets.QPushButton(self.skyXServerTab)
+        self.testConnectionButton.setObjectName("testConnectionButton")
+        self.gridLayout_5.addWidget(self.testConnectionButton, 7, 0, 1, 1, QtCore.Qt.AlignVCenter)
+        self.serverAddress = QtWidgets.QLineEdit(self.skyXServerTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.serverAddress.sizePolicy().hasHeightForWidth())
+        self.serverAddress.setSizePolicy(sizePolicy)
+        self.serverAddress.setMinimumSize(QtCore.QSize(200, 0))
+        self.serverAddress.setMaximumSize(QtCore.QSize(200, 16777215))
+        self.serverAddress.setObjectName("serverAddress")
+        self.gridLayout_5.addWidget(self.serverAddress, 4, 1, 1, 1)
+        self.MainTitle_tab2 = QtWidgets.QLabel(self.skyXServerTab)
+        self.MainTitle_tab2.setObjectName("MainTitle_tab2")
+        self.gridLayout_5.addWidget(self.MainTitle_tab2, 0, 0, 1, 5, QtCore.Qt.AlignHCenter)
+        self.Subtitle_tab3a = QtWidgets.QLabel(self.skyXServerTab)
+        self.Subtitle_tab3a.setObjectName("Subtitle_tab3a")
+        self.gridLayout_5.addWidget(self.Subtitle_tab3a, 2, 0, 1, 2)
+        self.sendWOLBeforeStarting = QtWidgets.QCheckBox(self.skyXServerTab)
+        self.sendWOLBeforeStarting.setObjectName("sendWOLBeforeStarting")
+        self.gridLayout_5.addWidget(self.sendWOLBeforeStarting, 3, 3, 1, 2)
+        self.serverPort = QtWidgets.QLineEdit(self.skyXServerTab)
+        self.serverPort.setObjectName("serverPort")
+        self.gridLayout_5.addWidget(self.serverPort, 5, 1, 1, 1)
+        self.label_34 = QtWidgets.QLabel(self.skyXServerTab)
+        self.label_34.setObjectName("label_34")
+        self.gridLayout_5.addWidget(self.label_34, 5, 0, 1, 1)
+        self.testWOLMessage = QtWidgets.QLabel(self.skyXServerTab)
+        self.testWOLMessage.setText("")
+        self.testWOLMessage.setObjectName("testWOLMessage")
+        self.gridLayout_5.addWidget(self.testWOLMessage, 7, 4, 1, 1)
+        self.label_33 = QtWidgets.QLabel(self.skyXServerTab)
+        self.label_33.setObjectName("label_33")
+        self.gridLayout_5.addWidget(self.label_33, 4, 0, 1, 1)
+        self.discoverServersButton = QtWidgets.QPushButton(self.skyXServerTab)
+        self.discoverServersButton.setObjectName("discoverServersButton")
+        self.gridLayout_5.addWidget(self.discoverServersButton, 8, 0, 1, 1, QtCore.Qt.AlignVCenter)
+        self.discoveredServers = QtWidgets.QComboBox(self.skyXServerTab)
+        self.discoveredServers.setMinimumSize(QtCore.QSize(200, 0))
+        self.discoveredServers.setObjectName("discoveredServers")
+        self.gridLayout_5.addWidget(self.discoveredServers, 8, 1, 1, 1)
+        spacerItem7 = QtWidgets.QSpacerItem(20, 221, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Fixed)
+        self.gridLayout_5.addItem(spacerItem7, 9, 1, 1, 1)
+        self.Subtitle_tab3b = QtWidgets.QLabel(self.skyXServerTab)
+        self.Subtitle_tab3b.setObjectName("Subtitle_tab3b")
+        self.gridLayout_5.addWidget(self.Subtitle_tab3b, 2, 3, 1, 2)
+        self.gridLayout_11.addLayout(self.gridLayout_5, 0, 0, 1, 1)
+        self.mainTabView.addTab(self.skyXServerTab, "")
+        self.framesPlanTab = QtWidgets.QWidget()
+        self.framesPlanTab.setObjectName("framesPlanTab")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.framesPlanTab)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.bulkAddButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.bulkAddButton.setAutoRepeat(False)
+        self.bulkAddButton.setAutoRepeatDelay(3000)
+        self.bulkAddButton.setObjectName("bulkAddButton")
+        self.gridLayout_6.addWidget(self.bulkAddButton, 2, 4, 1, 1)
+        spacerItem8 = QtWidgets.QSpacerItem(150, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_6.addItem(spacerItem8, 2, 2, 1, 1)
+        self.frameDownButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.frameDownButton.setObjectName("frameDownButton")
+        self.gridLayout_6.addWidget(self.frameDownButton, 2, 9, 1, 1)
+        self.editFrameButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.editFrameButton.setObjectName("editFrameButton")
+        self.gridLayout_6.addWidget(self.editFrameButton, 2, 3, 1, 1)
+        self.autoSaveAfterEach = QtWidgets.QCheckBox(self.framesPlanTab)
+        self.autoSaveAfterEach.setObjectName("autoSaveAfterEach")
+        self.gridLayout_6.addWidget(self.autoSaveAfterEach, 3, 0, 1, 3)
+        self.framesPlanTable = QtWidgets.QTableView(self.framesPlanTab)
+        self.framesPlanTable.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.framesPlanTable.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.framesPlanTable.setWordWrap(False)
+        self.framesPlanTable.setCornerButtonEnabled(False)
+        self.framesPlanTable.setObjectName("framesPlanTable")
+        self.framesPlanTable.horizontalHeader().setCascadingSectionResizes(True)
+        self.framesPlanTable.horizontalHeader().setDefaultSectionSize(300)
+        self.framesPlanTable.horizontalHeader().setMinimumSectionSize(24)
+        self.framesPlanTable.verticalHeader().setVisible(False)
+        self.framesPlanTable.verticalHeader().setHighlightSections(False)
+        self.framesPlanTable.verticalHeader().setStretchLastSection(False)
+        self.gridLayout_6.addWidget(self.framesPlanTable, 1, 0, 1, 10)
+        self.resetCompleted = QtWidgets.QPushButton(self.framesPlanTab)
+        self.resetCompleted.setObjectName("resetCompleted")
+        self.gridLayout_6.addWidget(self.resetCompleted, 2, 6, 1, 1)
+        self.frameUpButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.frameUpButton.setObjectName("frameUpButton")
+        self.gridLayout_6.addWidget(self.frameUpButton, 2, 8, 1, 1)
+        self.deleteFrameButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.deleteFrameButton.setObjectName("deleteFrameButton")
+        self.gridLayout_6.addWidget(self.deleteFrameButton, 2, 1, 1, 1)
+        self.MainTitle_tab3 = QtWidgets.QLabel(self.framesPlanTab)
+        self.MainTitle_tab3.setObjectName("MainTitle_tab3")
+        self.gridLayout_6.addWidget(self.MainTitle_tab3, 0, 0, 1, 10, QtCore.Qt.AlignHCenter)
+        self.addFrameButton = QtWidgets.QPushButton(self.framesPlanTab)
+        self.addFrameButton.setObjectName("addFrameButton")
+        self.gridLayout_6.addWidget(self.addFrameButton, 2, 0, 1, 1)
+        spacerItem9 = QtWidgets.QSpacerItem(149, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_6.addItem(spacerItem9, 2, 7, 1, 1)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_6.addItem(spacerItem10, 2, 5, 1, 1)
+        self.mainTabView.addTab(self.framesPlanTab, "")
+        self.runSessionTab = QtWidgets.QWidget()
+        self.runSessionTab.setObjectName("runSessionTab")
+        self.gridLayout_12 = QtWidgets.QGridLayout(self.runSessionTab)
+        self.gridLayout_12.setObjectName("gridLayout_12")
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        self.label_3 = QtWidgets.QLabel(self.runSessionTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_3.sizePolicy().hasHeightForWidth())
+        self.label_3.setSizePolicy(sizePolicy)
+        self.label_3.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.label_3.setObjectName("label_3")
+        self.horizontalLayout_12.addWidget(self.label_3)
+        self.cameraPath = QtWidgets.QLabel(self.runSessionTab)
+        self.cameraPath.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignTop)
+        self.cameraPath.setWordWrap(True)
+        self.cameraPath.setObjectName("cameraPath")
+        self.horizontalLayout_12.addWidget(self.cameraPath)
+        self.gridLayout_12.addLayout(self.horizontalLayout_12, 0, 0, 1, 1)
+        self.gridLayout_7 = QtWidgets.QGridLayout()
+        self.gridLayout_7.setContentsMargins(-1, -1, 6, -1)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.coolerPowerLayout = QtWidgets.QHBoxLayout()
+        self.coolerPowerLayout.setObjectName("coolerPowerLayout")
+        self.coolerPowerLabel = QtWidgets.QLabel(self.runSessionTab)
+        self.coolerPowerLabel.setObjectName("coolerPowerLabel")
+        self.coolerPowerLayout.addWidget(self.coolerPowerLabel, 0, QtCore.Qt.AlignRight)
+        self.coolerPowerValue = QtWidgets.QLabel(self.runSessionTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.coolerPowerValue.sizePolicy().hasHeightForWidth())
+        self.coolerPowerValue.setSizePolicy(sizePolicy)
+        self.coolerPowerValue.setObjectName("coolerPowerValue")
+        self.coolerPowerLayout.addWidget(self.coolerPowerValue)
+        self.gridLayout_7.addLayout(self.coolerPowerLayout, 3, 5, 1, 1)
+        self.Subtitle_tab4a = QtWidgets.QLabel(self.runSessionTab)
+        self.Subtitle_tab4a.setObjectName("Subtitle_tab4a")
+        self.gridLayout_7.addWidget(self.Subtitle_tab4a, 0, 0, 1, 4)
+        spacerItem11 = QtWidgets.QSpacerItem(160, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_7.addItem(spacerItem11, 3, 1, 1, 1)
+        self.cancelSessionButton = QtWidgets.QPushButton(self.runSessionTab)
+        self.cancelSessionButton.setEnabled(False)
+        self.cancelSessionButton.setObjectName("cancelSessionButton")
+        self.gridLayout_7.addWidget(self.cancelSessionButton, 3, 3, 1, 1)
+        self.consoleList = QtWidgets.QListView(self.runSessionTab)
+        self.consoleList.setUniformItemSizes(True)
+        self.consoleList.setObjectName("consoleList")
+        self.gridLayout_7.addWidget(self.consoleList, 1, 0, 1, 4)
+        self.Subtitle_tab4b = QtWidgets.QLabel(self.runSessionTab)
+        self.Subtitle_tab4b.setObjectName("Subtitle_tab4b")
+        self.gridLayout_7.addWidget(self.Subtitle_tab4b, 0, 5, 1, 1)
+        self.progressBar = QtWidgets.QProgressBar(self.runSessionTab)
+        self.progressBar.setMinimumSize(QtCore.QSize(0, 0))
+        self.progressBar.setMaximumSize(QtCore.QSize(16777215, 13))
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setTextVisible(False)
+        self.progressBar.setObjectName("progressBar")
+        self.gridLayout_7.addWidget(self.progressBar, 2, 0, 1, 6)
+        self.sessionTable = QtWidgets.QTableView(self.runSessionTab)
+        self.sessionTable.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.sessionTable.setTabKeyNavigation(False)
+        self.sessionTable.setProperty("showDropIndicator", False)
+        self.sessionTable.setDragDropOverwriteMode(False)
+        self.sessionTable.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.sessionTable.setWordWrap(False)
+        self.sessionTable.setCornerButtonEnabled(False)
+        self.sessionTable.setObjectName("sessionTable")
+        self.sessionTable.horizontalHeader().setDefaultSectionSize(40)
+        self.sessionTable.horizontalHeader().setHighlightSections(False)
+        self.sessionTable.horizontalHeader().setMinimumSectionSize(40)
+        self.sessionTable.verticalHeader().setVisible(False)
+        self.sessionTable.verticalHeader().setHighlightSections(False)
+        self.gridLayout_7.addWidget(self.sessionTable, 1, 5, 1, 1)
+        self.sessionStatus = QtWidgets.QLabel(self.runSessionTab)
+        self.sessionStatus.setText("")
+        self.sessionStatus.setObjectName("sessionStatus")
+        self.gridLayout_7.addWidget(self.sessionStatus, 3, 4, 1, 1)
+        self.beginSessionButton = QtWidgets.QPushButton(self.runSessionTab)
+        self.beginSessionButton.setObjectName("beginSessionButton")
+        self.gridLayout_7.addWidget(self.beginSessionButton, 3, 0, 1, 1)
+        self.writeTraceInfo = QtWidgets.QCheckBox(self.runSessionTab)
+        self.writeTraceInfo.setObjectName("writeTraceInfo")
+        self.gridLayout_7.addWidget(self.writeTraceInfo, 4, 0, 1, 6)
+        self.preferencesLayout = QtWidgets.QGridLayout()
+        self.preferencesLayout.setObjectName("preferencesLayout")
+        self.consoleCapacityLabel = QtWidgets.QLabel(self.runSessionTab)
+        self.consoleCapacityLabel.setObjectName("consoleCapacityLabel")
+        self.preferencesLayout.addWidget(self.consoleCapacityLabel, 0, 0, 1, 1)
+        self.consoleCapacity = QtWidgets.QLineEdit(self.runSessionTab)
+        self.consoleCapacity.setMinimumSize(QtCore.QSize(100, 0))
+        self.consoleCapacity.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.consoleCapacity.setObjectName("consoleCapacity")
+        self.preferencesLayout.addWidget(self.consoleCapacity, 0, 1, 1, 1)
+        self.metricsPortLabel = QtWidgets.QLabel(self.runSessionTab)
+        self.metricsPortLabel.setObjectName("metricsPortLabel")
+        self.preferencesLayout.addWidget(self.metricsPortLabel, 1, 0, 1, 1)
+        self.metricsPort = QtWidgets.QLineEdit(self.runSessionTab)
+        self.metricsPort.setMinimumSize(QtCore.QSize(100, 0))
+        self.metricsPort.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.metricsPort.setObjectName("metricsPort")
+        self.preferencesLayout.addWidget(self.metricsPort, 1, 1, 1, 1)
+        self.reconnectSecondsLabel = QtWidgets.QLabel(self.runSessionTab)
+        self.reconnectSecondsLabel.setObjectName("reconnectSecondsLabel")
+        self.preferencesLayout.addWidget(self.reconnectSecondsLabel, 2, 0, 1, 1)
+        self.reconnectSeconds = QtWidgets.QLineEdit(self.runSessionTab)
+        self.reconnectSeconds.setMinimumSize(QtCore.QSize(100, 0))
+        self.reconnectSeconds.setMaximumSize(QtCore.QSize(100, 16777215))
+        self.reconnectSeconds.setObjectName("reconnectSeconds")
+        self.preferencesLayout.addWidget(self.reconnectSeconds, 2, 1, 1, 1)
+        self.frameRetryPolicyLabel = QtWidgets.QLabel(self.runSessionTab)
+        self.frameRetryPolicyLabel.setObjectName("frameRetryPolicyLabel")
+        self.preferencesLayout.addWidget(self.frameRetryPolicyLabel, 3, 0, 1, 1)
+        self.frameRetryPolicy = QtWidgets.QLineEdit(self.runSessionTab)
+        self.frameRetryPolicy.setMinimumSize(QtCore.QSize(400, 0))
+        self.frameRetryPolicy.setMaximumSize(QtCore.QSize(400, 16777215))
+        self.frameRetryPolicy.setObjectName("frameRetryPolicy")
+        self.preferencesLayout.addWidget(self.frameRetryPolicy, 3, 1, 1, 1)
+        self.frameRetryPolicyMessage = QtWidgets.QLabel(self.runSessionTab)
+        self.frameRetryPolicyMessage.setText("")
+        self.frameRetryPolicyMessage.setWordWrap(True)
+        self.frameRetryPolicyMessage.setObjectName("frameRetryPolicyMessage")
+        self.preferencesLayout.addWidget(self.frameRetryPolicyMessage, 3, 2, 1, 1)
+        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.preferencesLayout.addItem(spacerItem12, 0, 3, 1, 1)
+        self.gridLayout_7.addLayout(self.preferencesLayout, 5, 0, 1, 6)
+        self.gridLayout_12.addLayout(self.gridLayout_7, 1, 0, 1, 1)
+        self.mainTabView.addTab(self.runSessionTab, "")
+        self.gridLayout_8.addWidget(self.mainTabView, 0, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 794, 22))
+        self.menubar.setNativeMenuBar(True)
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuFont = QtWidgets.QMenu(self.menubar)
+        self.menuFont.setObjectName("menuFont")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menuSaveAs = QtWidgets.QAction(MainWindow)
+        self.menuSaveAs.setObjectName("menuSaveAs")
+        self.menuSave = QtWidgets.QAction(MainWindow)
+        self.menuSave.setShortcutContext(QtCore.Qt.ApplicationShortcut)
+        self.menuSave.setObjectName("menuSave")
+        self.menuClose = QtWidgets.QAction(MainWindow)
+        self.menuClose.setObjectName("menuClose")
+        self.menuNew = QtWidgets.QAction(MainWindow)
+        self.menuNew.setObjectName("menuNew")
+        self.menuOpen = QtWidgets.QAction(MainWindow)
+        self.menuOpen.setObjectName("menuOpen")
+        self.actionFontLarger = QtWidgets.QAction(MainWindow)
+        self.actionFontLarger.setObjectName("actionFontLarger")
+        self.actionFontSmaller = QtWidgets.QAction(MainWindow)
+        self.actionFontSmaller.setObjectName("actionFontSmaller")
+        self.actionFontReset = QtWidgets.QAction(MainWindow)
+        self.actionFontReset.setObjectName("actionFontReset")
+        self.menuFile.addAction(self.menuNew)
+        self.menuFile.addAction(self.menuOpen)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.menuSaveAs)
+        self.menuFile.addAction(self.menuSave)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.menuClose)
+        self.menuFont.addAction(self.actionFontLarger)
+        self.menuFont.addAction(self.actionFontSmaller)
+        self.menuFont.addAction(self.actionFontReset)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuFont.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.mainTabView.setCurrentIndex(4)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "titleFromDesigner"))
+        self.MainTitle_1.setText(_translate("MainWindow", "Session Start and End"))
+        self.Subtitle_1.setText(_translate("MainWindow", "Session Start"))
+        self.label_6.setText(_translate("MainWindow", "Day"))
+        self.startTimeAstronomical.setToolTip(_translate("MainWindow", "Start at Astronomical Dusk on the specified day"))
+        self.startTimeAstronomical.setText(_translate("MainWindow", "Astronomical Dusk"))
+        self.startTimeGiven.setToolTip(_translate("MainWindow", "Start at the specified time on the specified day"))
+        self.startTimeGiven.setText(_translate("MainWindow", "Time:"))
+        self.startTimeEdit.setToolTip(_translate("MainWindow", "Time to start if \"Time:\" chosen"))
+        self.label_7.setText(_translate("MainWindow", "Time"))
+        self.startDateNow.setToolTip(_translate("MainWindow", "Start as soon as \"begin session\" is clicked"))
+        self.startDateNow.setText(_translate("MainWindow", "Now"))
+        self.startTimeNautical.setToolTip(_translate("MainWindow", "Start at Nautical Dusk on the specified day"))
+        self.startTimeNautical.setText(_translate("MainWindow", "Nautical Dusk"))
+        self.startDateGiven.setToolTip(_translate("MainWindow", "Start on this given date, at a time specified below."))
+        self.startDateGiven.setText(_translate("MainWindow", "Date:"))
+        self.startDateEdit.setToolTip(_translate("MainWindow", "Date to start run, if set to \"Date:\""))
+        self.startDateToday.setToolTip(_translate("MainWindow", "Start today, at a time specified below."))
+        self.startDateToday.setText(_translate("MainWindow", "Today"))
+        self.startTimeCivil.setToolTip(_translate("MainWindow", "Start at Civil Dusk on the specified day"))
+        self.startTimeCivil.setText(_translate("MainWindow", "Civil Dusk"))
+        self.startTimeSunset.setToolTip(_translate("MainWindow", "Start at Sunset on the specified day"))
+        self.startTimeSunset.setText(_translate("MainWindow", "Sunset"))
+        self.label_10.setText(_translate("MainWindow", "Day"))
+        self.endTimeNautical.setToolTip(_translate("MainWindow", "End the session at Nautical Dawn on the specified date"))
+        self.endTimeNautical.setText(_translate("MainWindow", "Nautical Dawn"))
+        self.endTimeGiven.setToolTip(_translate("MainWindow", "End the session at the given time on the specified date"))
+        self.endTimeGiven.setText(_translate("MainWindow", "Time:"))
+        self.endTimeEdit.setToolTip(_translate("MainWindow", "Time to end session if \"Time:\" option selected"))
+        self.endTimeAstronomical.setToolTip(_translate("MainWindow", "End the session at Astronomical Dawn on the specified date"))
+        self.endTimeAstronomical.setText(_translate("MainWindow", "Astronomical Dawn"))
+        self.endDateGiven.setToolTip(_translate("MainWindow", "End the session on the specified date"))
+        self.endDateGiven.setText(_translate("MainWindow", "Date:"))
+        self.endDateEdit.setToolTip(_translate("MainWindow", "The date to end session, if \"Date:\" option chosen"))
+        self.endDateTodayTomorrow.setToolTip(_translate("MainWindow", "End session today at the time given below (or tomorrow if that time today has already passed)"))
+        self.endDateTodayTomorrow.setText(_translate("MainWindow", "Today / Tomorrow"))
+        self.endDateWhenDone.setToolTip(_translate("MainWindow", "End session when all frames are done, regardless of the time"))
+        self.endDateWhenDone.setText(_translate("MainWindow", "When Done"))
+        self.Subtitle_2.setText(_translate("MainWindow", "Session End"))
+        self.endTimeCivil.setToolTip(_translate("MainWindow", "End the session at Civil Dawn on the specified date"))
+        self.endTimeCivil.setText(_translate("MainWindow", "Civil Dawn"))
+        self.endTimeSunrise.setToolTip(_translate("MainWindow", "End the session at sunrise on the specified date"))
+        self.endTimeSunrise.setText(_translate("MainWindow", "Sunrise"))
+        self.label_11.setText(_translate("MainWindow", "Time"))
+        self.Subtitle_3.setText(_translate("MainWindow", "Location (for Dusk/Dawn Calculation)"))
+        self.label_13.setText(_translate("MainWindow", "Name"))
+        self.locName.setToolTip(_translate("MainWindow", "Name of this location (arbitrary and optional)"))
+        self.label_14.setText(_translate("MainWindow", "Time Zone"))
+        self.timeZone.setToolTip(_translate("MainWindow", "Location\'s offset in hours from UTC.  -5 for EST, etc"))
+        self.label_15.setText(_translate("MainWindow", "Latitude"))
+        self.latitude.setToolTip(_translate("MainWindow", "Location\'s latitude, in degrees "))
+        self.label_16.setText(_translate("MainWindow", "Longitude"))
+        self.longitude.setToolTip(_translate("MainWindow", "Location\'s longitude, in degrees .  West longitude is a negative number."))
+        self.Subtitle_4.setText(_translate("MainWindow", "When Done"))
+        self.warmCCDWhenDone.setToolTip(_translate("MainWindow", "At end of session, turn off cooling and allow CCD to warm up for a while before disconnecting camera"))
+        self.warmCCDWhenDone.setText(_translate("MainWindow", "Warm up CCD for"))
+        self.warmCCDSeconds.setToolTip(_translate("MainWindow", "Number of seconds to allow CCD to warm up before disconnecting"))
+        self.label_18.setText(_translate("MainWindow", "seconds"))
+        self.disconnectWhenDone.setToolTip(_translate("MainWindow", "Disconnect camera when done (after warmup)"))
+        self.disconnectWhenDone.setText(_translate("MainWindow", "Disconnect Camera (after warmup)"))
+        self.mainTabView.setTabText(self.mainTabView.indexOf(self.startEndTab), _translate("MainWindow", "Start/End"))
+        self.mainTabView.setTabToolTip(self.mainTabView.indexOf(self.startEndTab), _translate("MainWindow", "Information on when the collection run starts and ends"))
+        self.MainTitle_tab1.setText(_translate("MainWindow", "Camera Temperature Settings"))
+        self.label_19.setText(_translate("MainWindow", "Target Temperature:"))
+        self.targetTemperature.setToolTip(_translate("MainWindow", "Target temperature to which to cool the CCD"))
+        self.label_24.setText(_translate("MainWindow", "° C"))
+        self.label_23.setText(_translate("MainWindow", "Within +/-:"))
+        self.temperatureTolerance.setToolTip(_translate("MainWindow", "CCD is ready when within this much of target temperature"))
+        self.label_25.setText(_translate("MainWindow", "° C"))
+        self.label_2.setText(_translate("MainWindow", "Cooling Check Interval:"))
+        self.coolingCheckInterval.setToolTip(_translate("MainWindow", "While cooling, sample the CCD temperature at intervals of this many seconds"))
+        self.label_26.setText(_translate("MainWindow", "seconds"))
+        self.label_22.setText(_translate("MainWindow", "Max Time to Try Cooling:"))
+        self.coolingMaxTryTime.setToolTip(_translate("MainWindow", "Allow attempt to cool to target temperature to go on to a maximum of this long (in seconds)"))
+        self.label_27.setText(_translate("MainWindow", "seconds"))
+        self.label_21.setText(_translate("MainWindow", "Cooling Retry Count:"))
+        self.coolingMaxRetryCount.setToolTip(_translate("MainWindow", "If target temperature couldn\'t be reached, try again this many times. (Maybe it will succeed as ambient drops)"))
+        self.label_28.setText(_translate("MainWindow", "times"))
+        self.label_20.setText(_translate("MainWindow", "Cooling Retry Delay:"))
+        self.coolingRetryDelay.setToolTip(_translate("MainWindow", "Wait this long (seconds) between cooling retries"))
+        self.label_29.setText(_translate("MainWindow", "seconds"))
+        self.abortIfTempRises.setToolTip(_translate("MainWindow", "During acquisiiton, abort session if CCD temperature rises  (rising ambient may overwhelm the cooler)"))
+        self.abortIfTempRises.setText(_translate("MainWindow", "Abort if temp rises:"))
+        self.tempRiseAbortThreshold.setToolTip(_translate("MainWindow", "Amount of rise above target temperature that causes session to abort"))
+        self.label_32.setText(_translate("MainWindow", "° C"))
+        self.ccdIsRegulated.setToolTip(_translate("MainWindow", "The camera has temperature-regulated cooling"))
+        self.ccdIsRegulated.setText(_translate("MainWindow", "CCD is temperature-regulated"))
+        self.mainTabView.setTabText(self.mainTabView.indexOf(self.temperatureTab), _translate("MainWindow", "Temperature"))
+        self.mainTabView.setTabToolTip(self.mainTabView.indexOf(self.temperatureTab), _translate("MainWindow", "Information about temperature regulation of the CCD"))
+        self.label_35.setText(_translate("MainWindow", "Seconds before start:"))
+        self.label_37.setText(_translate("MainWindow", "Broadcast address:"))
+        self.label_36.setText(_translate("MainWindow", "MAC address:"))
+        self.wolMacAddress.setToolTip(_translate("MainWindow", "MAC address of the server to be woken"))
+        self.wolBroadcastAddress.setToolTip(_translate("MainWindow", "Broadcast address to broadcast WOL across your lan.  Should be your sublan address with 255 at end."))
+        self.sendWolNowButton.setToolTip(_translate("MainWindow", "Send WOL packet now, to test if server accepts & responds."))
+        self.sendWolNowButton.setText(_translate("MainWindow", "SendWOL Now"))
+        self.sendWOLSecondsBefore.setToolTip(_translate("MainWindow", "Send the WOL this many seconds in advance of start (give server time to boot and stabilize)"))
+        self.testConnectionButton.setToolTip(_translate("MainWindow", "Test if connection to the server is working (server must be running)"))
+        self.testConnectionButton.setText(_translate("MainWindow", "Test Connection"))
+        self.serverAddress.setToolTip(_translate("MainWindow", "Address of the server running TheSkyX and your camera"))
+        self.MainTitle_tab2.setText(_translate("MainWindow", "Network Settings"))
+        self.Subtitle_tab3a.setText(_translate("MainWindow", "Server Address"))
+        self.sendWOLBeforeStarting.setToolTip(_translate("MainWindow", "Send Wake On Lan packet before starting session"))
+        self.sendWOLBeforeStarting.setText(_translate("MainWindow", "Send Wake on LAN packet before starting."))
+        self.serverPort.setToolTip(_translate("MainWindow", "Port number of TheSkyX TCP listener on the server"))
+        self.label_34.setText(_translate("MainWindow", "Port number:"))
+        self.label_33.setText(_translate("MainWindow", "IP Address or host name:"))
+        self.discoverServersButton.setToolTip(_translate("MainWindow", "Scan the local network for computers running TheSkyX (the subnet of the address above, or this computer\'s)"))
+        self.discoverServersButton.setText(_translate("MainWindow", "Discover Servers"))
+        self.discoveredServers.setToolTip(_translate("MainWindow", "Servers found, quickest TheSkyX first.  Choose one to use its address."))
+        self.Subtitle_tab3b.setText(_translate("MainWindow", "Wake on LAN"))
+        self.mainTabView.setTabText(self.mainTabView.indexOf(self.skyXServerTab), _translate("MainWindow", "SkyX Server"))
+        self.mainTabView.setTabToolTip(self.mainTabView.indexOf(self.skyXServerTab), _translate("MainWindow", "Information about where TheSkyX is running on your network"))
+        self.bulkAddButton.setToolTip(_translate("MainWindow", "Rapidly add a large number of frame sets in a pattern"))
+        self.bulkAddButton.setText(_translate("MainWindow", "Bulk Add"))
+        self.frameDownButton.setToolTip(_translate("MainWindow", "Move the selected frame set(s) down one row"))
+        self.frameDownButton.setText(_translate("MainWindow", "Down"))
+        self.editFrameButton.setToolTip(_translate("MainWindow", "Edit the details of the selected frame set"))
+        self.editFrameButton.setText(_translate("MainWindow", "Edit"))
+        self.autoSaveAfterEach.setToolTip(_translate("MainWindow", "Save the plan to disk after each frame is acquired (so progress record survives power failures)"))
+        self.autoSaveAfterEach.setText(_translate("MainWindow", "Auto-save after each completed frame"))
+        self.framesPlanTable.setToolTip(_translate("MainWindow", "List of frame sets that are being gathered in these sessions"))
+        self.resetCompleted.setText(_translate("MainWindow", "Reset Completed"))
+        self.frameUpButton.setToolTip(_translate("MainWindow", "Move the selected frame set(s) up one row"))
+        self.frameUpButton.setText(_translate("MainWindow", "Up"))
+        self.deleteFrameButton.setToolTip(_translate("MainWindow", "Remove selected frame set from the plan"))
+        self.deleteFrameButton.setText(_translate("MainWindow", "-"))
+        self.MainTitle_tab3.setText(_translate("MainWindow", "Frame Sets to be Acquired"))
+        self.addFrameButton.setToolTip(_translate("MainWindow", "Add a new frame set to the list"))
+        self.addFrameButton.setText(_translate("MainWindow", "+"))
+        self.mainTabView.setTabText(self.mainTabView.indexOf(self.framesPlanTab), _translate("MainWindow", "Frames Plan"))
+        self.mainTabView.setTabToolTip(self.mainTabView.indexOf(self.framesPlanTab), _translate("MainWindow", "The list of frames to be acquired (possibly over several sessions)"))
+        self.label_3.setText(_translate("MainWindow", "Camera Autosave Path:"))
+        self.cameraPath.setToolTip(_translate("MainWindow", "Fyi, the path where TheSkyX is saving acquired images"))
+        self.cameraPath.setText(_translate("MainWindow", "<html><head/><body><p><span style=\" font-style:italic;\">(Displayed when connected)</span></p></body></html>"))
+        self.coolerPowerLabel.setText(_translate("MainWindow", "Cooler Power:"))
+        self.coolerPowerValue.setText(_translate("MainWindow", "100%"))
+        self.Subtitle_tab4a.setText(_translate("MainWindow", "Console Log:"))
+        self.cancelSessionButton.setToolTip(_translate("MainWindow", "Cancel the running acquisition process"))
+        self.cancelSessionButton.setText(_translate("MainWindow", "Cancel Session"))
+        self.consoleList.setToolTip(_translate("MainWindow", "Messages from the acquisition process"))
+        self.Subtitle_tab4b.setText(_translate("MainWindow", "Images Being Acquired:"))
+        self.progressBar.setToolTip(_translate("MainWindow", "Shows progress of any long-running operation"))
+        self.sessionTable.setToolTip(_translate("MainWindow", "List of frame sets being acquired (omits any that are already complete)"))
+        self.sessionStatus.setToolTip(_translate("MainWindow", "What the acquisition process is doing, and when it should finish"))
+        self.beginSessionButton.setToolTip(_translate("MainWindow", "Start the acquisition process"))
+        self.beginSessionButton.setText(_translate("MainWindow", "Begin Session"))
+        self.writeTraceInfo.setText(_translate("MainWindow", "Write a huge quantity of trace information to the system console"))
+        self.consoleCapacityLabel.setText(_translate("MainWindow", "Console lines kept:"))
+        self.consoleCapacity.setToolTip(_translate("MainWindow", "Most recent lines shown in the session console (all lines are written to the session log file)"))
+        self.metricsPortLabel.setText(_translate("MainWindow", "Metrics port:"))
+        self.metricsPort.setToolTip(_translate("MainWindow", "Port on which a running session serves metrics for monitoring (0 for none)"))
+        self.reconnectSecondsLabel.setText(_translate("MainWindow", "Reconnect seconds:"))
+        self.reconnectSeconds.setToolTip(_translate("MainWindow", "If the connection to TheSkyX is lost during a session, keep trying this long (0 to end the session instead)"))
+        self.frameRetryPolicyLabel.setText(_translate("MainWindow", "Frame retry policy:"))
+        self.frameRetryPolicy.setToolTip(_translate("MainWindow", "What to do when a frame fails, e.g. start=retry:2:skip,camera=retry:2:skip,timeout=abort (empty for the defaults)"))
+        self.mainTabView.setTabText(self.mainTabView.indexOf(self.runSessionTab), _translate("MainWindow", "Run Session"))
+        self.mainTabView.setTabToolTip(self.mainTabView.indexOf(self.runSessionTab), _translate("MainWindow", "Control, status, and console of the running acquisition session"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuFont.setTitle(_translate("MainWindow", "Font"))
+        self.menuSaveAs.setText(_translate("MainWindow", "Save As…"))
+        self.menuSaveAs.setShortcut(_translate("MainWindow", "Ctrl+Shift+S"))
+        self.menuSave.setText(_translate("MainWindow", "Save"))
+        self.menuSave.setShortcut(_translate("MainWindow", "Ctrl+S"))
+        self.menuClose.setText(_translate("MainWindow", "Close"))
+        self.menuNew.setText(_translate("MainWindow", "New"))
+        self.menuNew.setShortcut(_translate("MainWindow", "Ctrl+N"))
+        self.menuOpen.setText(_translate("MainWindow", "Open"))
+        self.menuOpen.setShortcut(_translate("MainWindow", "Ctrl+O"))
+        self.actionFontLarger.setText(_translate("MainWindow", "Larger"))
+        self.actionFontLarger.setShortcut(_translate("MainWindow", "Ctrl+="))
+        self.actionFontSmaller.setText(_translate("MainWindow", "Smaller"))
+        self.actionFontSmaller.setShortcut(_translate("MainWindow", "Ctrl+-"))
+        self.actionFontReset.setText(_translate("MainWindow", "Reset"))
+        self.actionFontReset.setShortcut(_translate("MainWindow", "Ctrl+/"))
+
+
+# Written by compile_ui_forms.py, used by MultiOsUtil.load_ui_form
+FORM_CLASS_NAME = "Ui_MainWindow"
+UI_SOURCE_SHA1 = "29ac408103f2ef2cd04f3e17b9928a2cab4f4853"
@@ -0,0 +1,80 @@
+# A TheSkyX transport that times every connection it opens (for TheSkyXProbe), and can keep connections
+# open to be used again by later commands instead of connecting for each one.
+# Reused connections come from a pool, so each of several threads sending commands at once has its own.
+# A connection goes back in the pool when its command is done, unless the command failed (part of a reply
+# may still be on the way) or, when next wanted, the server is found to have closed it.
+import threading
+import time
+
+from ReusableConnection import ReusableConnection
+from SocketTransport import SocketTransport
+from TheSkyXTransport import TheSkyXTransport
+from tracelog import *
+
+
+class MeasuredTransport(TheSkyXTransport):
+
+    def __init__(self, inner: TheSkyXTransport = None, reuse_connections: bool = False):
+        self._inner: TheSkyXTransport = inner if inner is not None else SocketTransport()
+        self._reuse_connections: bool = reuse_connections
+        self._lock = threading.Lock()
+        self._idle: {(str, int): [ReusableConnection]} = {}  # Pooled connections, by address
+        self._connect_seconds: [float] = []  # Time taken by each connection opened
+        self._connections_reused: int = 0
+
+    def get_connect_seconds(self) -> [float]:
+        with self._lock:
+            return list(self._connect_seconds)
+
+    def get_connections_opened(self) -> int:
+        with self._lock:
+            return len(self._connect_seconds)
+
+    def get_connections_reused(self) -> int:
+        with self._lock:
+            return self._connections_reused
+
+    @tracelog
+    def open_connection(self, address: (str, int), timeout_seconds: float = None):
+        """Take an idle connection to the address from the pool, or open and time a new one"""
+        if self._reuse_connections:
+            connection = self.take_idle_connection(address)
+            if connection is not None:
+                connection.settimeout(timeout_seconds)
+                return connection
+        connect_started = time.perf_counter()
+        connection = self._inner.open_connection(address, timeout_seconds)
+        with self._lock:
+            self._connect_seconds.append(time.perf_counter() - connect_started)
+        if self._reuse_connections:
+            return ReusableConnection(self, connection, address)
+        return connection
+
+    # An idle pooled connection to the address that the server hasn't closed, or None
+    def take_idle_connection(self, address: (str, int)) -> ReusableConnection:
+        """Take a usable connection to the address from the pool"""
+        while True:
+            with self._lock:
+                idle = self._idle.get(address, [])
+                if len(idle) == 0:
+                    return None
+                connection = idle.pop()
+            if connection.still_usable():
+                with self._lock:
+                    self._connections_reused += 1
+                return connection
+            connection.discard()
+
+    # A connection's command is done: keep it for the next command to the same address
+    def release(self, connection: ReusableConnection):
+        with self._lock:
+            self._idle.setdefault(connection.get_address(), []).append(connection)
+
+    @tracelog
+    def close_idle_connections(self):
+        """Close all the connections being kept for reuse"""
+        with self._lock:
+            idle = [connection for connections in self._idle.values() for connection in connections]
+            self._idle = {}
+        for connection in idle:
+            connection.discard()
@@ -1,10 +1,14 @@
 # Utilities to help program run on multiple OS - for now, windows and mac
 # Helps locate resource files, end-running around the problems I've been having
 # with the various native bundle packaging utilities that I can't get working
+import hashlib
+import importlib
 import os
 
 from PyQt5.QtCore import QObject
-from PyQt5.QtWidgets import QLabel, QCheckBox, QRadioButton, QLineEdit, QPushButton, QDateEdit, QTimeEdit
+from PyQt5.QtWidgets import QLabel, QCheckBox, QRadioButton, QLineEdit, QPushButton, QDateEdit, QTimeEdit, QWidget
+
+from SettingsCache import SettingsCache
 
 
 class MultiOsUtil:
@@ -12,8 +16,8 @@ class MultiOsUtil:
     LAST_ADDFRAME_SIZE_SETTING = "last_addframe_dialog_size"
     LAST_BULKADD_SIZE_SETTING = "last_bulkadd_dialog_size"
     LAST_WINDOW_SIZE_SETTING = "last_window_size"
-    STANDARD_FONT_SIZE_SETTING = "standard_font_size"
-    STANDARD_FONT_SIZE = 12
+    STANDARD_FONT_SIZE_SETTING = SettingsCache.STANDARD_FONT_SIZE_SETTING
+    STANDARD_FONT_SIZE = SettingsCache.DEFAULT_STANDARD_FONT_SIZE
     MAIN_TITLE_LABEL_PREFIX = "MainTitle_"
     MAIN_TITLE_FONT_SIZE_INCREMENT = 6
     SUBTITLE_LABEL_PREFIX = "Subtitle_"
@@ -30,6 +34,43 @@ class MultiOsUtil:
         path_to_file = f"{directory_name}/{file_name}"
         return path_to_file
 
+    # Create the window or dialog described by a Qt Designer .ui file.
+    # If there is a precompiled form for it (e.g. MainWindowUi.py for MainWindow.ui, written by
+    # compile_ui_forms.py) and it was compiled from the current .ui file, use that - it is much faster than
+    # parsing the XML.  Otherwise (form missing, or .ui edited since compiling) load the .ui file at run time.
+    # Either way the result is the same: a widget of the given class with the form's controls as attributes.
+
+    @classmethod
+    def load_ui_form(cls, ui_file_name: str, base_class: type) -> QWidget:
+        """Create the widget described by a .ui file, using the precompiled form if it is current"""
+        ui_path = cls.path_for_file_in_program_directory(ui_file_name)
+        form_module_name = cls.compiled_form_module_name(ui_file_name)
+        try:
+            form_module = importlib.import_module(form_module_name)
+        except ImportError:
+            form_module = None
+        if form_module is not None and \
+                (not os.path.exists(ui_path) or form_module.UI_SOURCE_SHA1 == cls.ui_file_sha1(ui_path)):
+            form_class = getattr(form_module, form_module.FORM_CLASS_NAME)
+            widget_class = type(form_module.FORM_CLASS_NAME + "Widget", (base_class, form_class), {})
+            widget = widget_class()
+            widget.setupUi(widget)
+            return widget
+        from PyQt5 import uic
+        return uic.loadUi(ui_path)
+
+    # Name of the python module holding the compiled form for a .ui file:  "MainWindow.ui" -> "MainWindowUi"
+    @staticmethod
+    def compiled_form_module_name(ui_file_name: str) -> str:
+        return os.path.splitext(ui_file_name)[0] + "Ui"
+
+    # Fingerprint of a .ui file, recorded in its compiled form so we can tell if the form is out of date.
+    # (File times aren't reliable for this - checkouts and copies change them.)
+    @staticmethod
+    def ui_file_sha1(ui_path: str) -> str:
+        with open(ui_path, "rb") as ui_file:
+            return hashlib.sha1(ui_file.read()).hexdigest()
+
     # Set all the items in the given UI tree with settable font sizes to
     # the given font size.  Except labels.  Check if their name indicates they
     # are headings and, if so, set larger by given increment.
@@ -44,8 +85,8 @@ class MultiOsUtil:
         """Set font sizes of all UI elements"""
         # print(f"set_font_sizes({parent},{standard_size},{title_prefix},"
         #       f"{title_increment},{subtitle_prefix},{subtitle_increment})")
-        children = parent.children()
-        for child in children:
+        # findChildren searches the whole tree (in Qt, so much faster than recursing in python)
+        for child in parent.findChildren(QWidget):
             # We'll only change the font size of labels and controls,
             # not collections
             desired_font_size = standard_size
@@ -75,6 +116,3 @@ class MultiOsUtil:
                 child_font = child.font()
                 child_font.setPointSize(desired_font_size)
                 child.setFont(child_font)
-            # Recursively handle the children of this item as subtrees of their own
-            cls.set_font_sizes(child, standard_size, title_prefix, title_increment,
-                               subtitle_prefix, subtitle_increment)
@@ -0,0 +1,40 @@
+# The dark windows for a range of nights, as calculated by TwilightTable.
+# All the attributes are numpy arrays of the same length, one entry per night:
+#   dates       datetime64[D]  the local date on whose evening the night starts
+#   starts      datetime64[s]  window start (UTC), NaT if the sun doesn't reach the start horizon
+#   ends        datetime64[s]  window end (UTC), NaT if the sun doesn't reach the end horizon
+#   durations   float64        window length in seconds, NaN where start or end is missing
+from datetime import datetime, timezone
+
+import numpy
+
+
+class NightWindows:
+
+    def __init__(self, dates: numpy.ndarray, starts: numpy.ndarray, ends: numpy.ndarray):
+        self.dates = dates
+        self.starts = starts
+        self.ends = ends
+        self.durations = (ends - starts) / numpy.timedelta64(1, "s")
+
+    def __len__(self):
+        return len(self.dates)
+
+    # Window start and end for one night, as naive datetimes in this computer's local time zone.
+    # (This is the same convention DataModel uses, via ephem.localtime.)  None if not available.
+    def get_local_start(self, index: int) -> datetime:
+        return self.local_datetime(self.starts[index])
+
+    def get_local_end(self, index: int) -> datetime:
+        return self.local_datetime(self.ends[index])
+
+    @staticmethod
+    def local_datetime(utc_value: numpy.datetime64):
+        """Convert a UTC datetime64 to a naive local datetime, or None for NaT"""
+        if numpy.isnat(utc_value):
+            return None
+        seconds = float(utc_value.astype("datetime64[s]").astype(numpy.int64))
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).astimezone().replace(tzinfo=None)
+
+    def __str__(self):
+        return f"NightWindows<{len(self)} nights from {self.dates[0] if len(self) > 0 else '-'}>"
@@ -0,0 +1,19 @@
+# Session clock using the computer's clocks.  Intervals are measured with the monotonic clock
+# so a change to the time of day doesn't stretch or cut short a wait.
+import time
+from datetime import datetime
+
+from SessionClock import SessionClock
+
+
+class RealClock(SessionClock):
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds)
@@ -0,0 +1,92 @@
+# A TheSkyX client that rides out network trouble.  A command that fails for want of a connection (refused,
+# reset or timed out - not an error reported by TheSkyX) is sent again after a pause that doubles each
+# time, up to a limit.  Commands that take an image are not repeated: if only the reply was lost, the camera
+# may already be exposing, so the session finds out what it is doing instead (see
+# SessionThreadWorker.reconnect_to_server).
+# After several failures in a row the "circuit breaker" opens: for a cooling-off period commands fail at
+# once, without trying the network, so a server that is down isn't hammered and the session isn't held up
+# by one timeout after another.  Then one command is let through; if it succeeds the circuit closes again.
+# Pauses are on the given clock, and are cut short if the "cancelled" check says so.
+from RealClock import RealClock
+from SessionClock import SessionClock
+from TheSkyX import TheSkyX
+from TheSkyXTransport import TheSkyXTransport
+from tracelog import *
+
+
+class ResilientTheSkyX(TheSkyX):
+    DEFAULT_RETRIES = 3  # Further tries of a command after its first fails
+    INITIAL_BACKOFF_SECONDS = 1.0  # Pause before the first retry; doubled for each one after
+    MAXIMUM_BACKOFF_SECONDS = 16.0
+    BREAKER_THRESHOLD = 5  # Failed exchanges in a row that open the circuit
+    BREAKER_COOLDOWN_SECONDS = 30.0  # How long the circuit stays open
+    REPEATABLE_COMMANDS = (TheSkyX.QUERY_COMMAND, TheSkyX.SETTING_COMMAND, TheSkyX.CAMERA_CONNECTION_COMMAND)
+    CIRCUIT_OPEN_MESSAGE = "TheSkyX not reachable, waiting before trying again"
+
+    def __init__(self, server_address: str, port_number: int, transport: TheSkyXTransport = None,
+                 cancelled=None,
+                 clock: SessionClock = None,
+                 retries: int = DEFAULT_RETRIES,
+                 breaker_threshold: int = BREAKER_THRESHOLD,
+                 breaker_cooldown_seconds: float = BREAKER_COOLDOWN_SECONDS):
+        TheSkyX.__init__(self, server_address, port_number, transport, cancelled)
+        self._clock: SessionClock = clock if clock is not None else RealClock()
+        self._retries: int = retries
+        self._breaker_threshold: int = breaker_threshold
+        self._breaker_cooldown_seconds: float = breaker_cooldown_seconds
+        self._failures_in_a_row: int = 0
+        self._breaker_closes_at: float = None  # Clock time the open circuit lets a command through; None if closed
+        self._retries_sent: int = 0
+        self._breaker_trips: int = 0
+
+    def get_retries_sent(self) -> int:
+        return self._retries_sent
+
+    def get_breaker_trips(self) -> int:
+        return self._breaker_trips
+
+    # Seconds until the open circuit lets a command through; 0 if it is closed
+    def get_seconds_until_retry(self) -> float:
+        if self._breaker_closes_at is None:
+            return 0.0
+        return max(self._breaker_closes_at - self._clock.monotonic(), 0.0)
+
+    # Send the packet as TheSkyX does, retrying lost connections.  Return a 3-ple: success flag, response,
+    # error message if any
+    @tracelog
+    def send_command_packet(self, command_packet: str, command_kind: str = TheSkyX.QUERY_COMMAND):
+        """Send command packet to server, read response, retrying if the connection fails"""
+        if self.get_seconds_until_retry() > 0:
+            self._connection_lost = True
+            return False, "", ResilientTheSkyX.CIRCUIT_OPEN_MESSAGE
+        retries_left = self._retries if command_kind in ResilientTheSkyX.REPEATABLE_COMMANDS else 0
+        backoff_seconds = ResilientTheSkyX.INITIAL_BACKOFF_SECONDS
+        while True:
+            (success, result, message) = TheSkyX.send_command_packet(self, command_packet, command_kind)
+            if not self.get_connection_lost():
+                self._failures_in_a_row = 0
+                self._breaker_closes_at = None
+                return success, result, message
+            self._failures_in_a_row += 1
+            if self._failures_in_a_row >= self._breaker_threshold:
+                # Too many in a row: open the circuit (again, if this was the one let through)
+                self._breaker_trips += 1
+                self._breaker_closes_at = self._clock.monotonic() + self._breaker_cooldown_seconds
+                return success, result, message
+            if retries_left == 0 or not self.pause(backoff_seconds):
+                return success, result, message
+            retries_left -= 1
+            self._retries_sent += 1
+            backoff_seconds = min(backoff_seconds * 2, ResilientTheSkyX.MAXIMUM_BACKOFF_SECONDS)
+
+    # Sleep between retries, in short slices so cancellation is noticed.  Return False if cancelled
+    def pause(self, seconds: float) -> bool:
+        """Wait before retrying a command, unless cancelled"""
+        slept = 0.0
+        while slept < seconds:
+            if self._cancelled is not None and self._cancelled():
+                return False
+            slice_seconds = min(TheSkyX.RECEIVE_SLICE_SECONDS, seconds - slept)
+            self._clock.sleep(slice_seconds)
+            slept += slice_seconds
+        return self._cancelled is None or not self._cancelled()
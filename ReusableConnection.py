@@ -0,0 +1,58 @@
+# A connection opened by MeasuredTransport to be used for more than one command.  Closing it (as TheSkyX
+# does when its command is done) returns it to the transport's pool; if the command failed, it is closed
+# for real, since a late reply could otherwise be taken as the answer to the next command.
+import socket
+
+from tracelog import *
+
+
+class ReusableConnection:
+
+    def __init__(self, transport, connection, address: (str, int)):
+        self._transport = transport  # The MeasuredTransport, which keeps idle connections
+        self._connection = connection
+        self._address: (str, int) = address
+
+    def get_address(self) -> (str, int):
+        return self._address
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def settimeout(self, timeout_seconds: float):
+        self._connection.settimeout(timeout_seconds)
+
+    def sendall(self, data: bytes):
+        self._connection.sendall(data)
+
+    def recv(self, buffer_size: int) -> bytes:
+        return self._connection.recv(buffer_size)
+
+    # Done with this command: keep the connection for the next
+    def close(self):
+        self._transport.release(self)
+
+    # Close the connection for good
+    def discard(self):
+        self._connection.close()
+
+    # An idle connection can be used again if the server hasn't closed it and sent nothing unasked.
+    # (Only real sockets can be checked; others are assumed usable.)
+    def still_usable(self) -> bool:
+        """Check, without waiting, that the idle connection is still open with nothing waiting to be read"""
+        if not isinstance(self._connection, socket.socket):
+            return True
+        try:
+            self._connection.settimeout(0.0)
+            self._connection.recv(1, socket.MSG_PEEK)
+            return False  # Closed by the server (nothing received), or stray data
+        except BlockingIOError:
+            return True
+        except OSError:
+            return False
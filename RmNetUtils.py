@@ -108,38 +108,45 @@ class RmNetUtils:
         clean_mac_address: str = RmNetUtils.parse_mac_address(proposed_address)
         return clean_mac_address is not None
 
-    # Test whether we can open a socket to a given server.
+    # Test whether we can open a socket to a given server, waiting at most timeout_seconds (if given)
+    # for it to answer.
     # Return a tuple with a success indicator (bool) and a message if unsuccessful
 
     @classmethod
     @tracelog
-    def test_connection(cls, address_string: str, port_number: str) -> [bool, str]:
+    def test_connection(cls, address_string: str, port_number: str,
+                        timeout_seconds: float = None) -> [bool, str]:
         """Open a test connection to given server and return whether it was successful"""
         # print(f"testConnection({address_string},{port_number})")
         success: bool = False
         message: str = "(Uncaught Error)"
+        # Create socket
+        test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        test_socket.settimeout(timeout_seconds)
         try:
-            # Create socket
-            test_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             # Connect to address and port
             test_socket.connect((address_string, int(port_number)))
             # success
             success = True
-            test_socket.close()
         except socket.gaierror:
             # print(f"Server {address_string}:{port_number} unknown or invalid")
             message = "Unknown server"
         except ConnectionRefusedError:
             # print(f"Server {address_string}:{port_number} connection refused")
             message = "Connection refused"
-        except TimeoutError:
+        except (TimeoutError, socket.timeout):
             message = "Connection timed out"
+        except OSError as oe:
+            # E.g. no route to a host that is still asleep
+            message = oe.strerror if oe.strerror is not None else str(oe)
         except Exception as ex:
             print("Unexpected error:", sys.exc_info()[0])
             print(type(ex))
             print(ex.args)
             print(ex)
             raise
+        finally:
+            test_socket.close()
         return [success, message]
 
     @classmethod
@@ -0,0 +1,104 @@
+# Find TheSkyX servers on the local network.  Every address of a subnet (e.g. 192.168.1.0/24) is tried at
+# once, from a pool of threads, for a listener on the TheSkyX port, with a short connection timeout, so a
+# /24 takes a second or two.  Each host that accepts a connection is sent a script that only sets a
+# variable, and the reply timed; a host that answers the way TheSkyX does is reported as TheSkyX.
+# The probe has its own short timeout and doesn't go through TheSkyX (whose commands take turns, and wait
+# much longer for replies), so a host listening on the port that never replies doesn't hold up the others.
+import ipaddress
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from DiscoveredServer import DiscoveredServer
+from TheSkyX import TheSkyX
+from tracelog import *
+
+
+class ServerDiscovery:
+    DEFAULT_PORT = 3040  # TheSkyX's TCP server
+    CONNECT_TIMEOUT_SECONDS = 0.5
+    PROBE_TIMEOUT_SECONDS = 2.0
+    MAXIMUM_WORKERS = 128
+    MAXIMUM_HOSTS = 1024  # A /22; larger subnets would take too long to be useful
+    PROBE_PACKET = "/* Java Script */" \
+        + "/* Socket Start Packet */" \
+        + "var Out;Out=\"pySkyDarks\\n\";" \
+        + "/* Socket End Packet */"
+
+    def __init__(self, port: int = DEFAULT_PORT,
+                 connect_timeout_seconds: float = CONNECT_TIMEOUT_SECONDS,
+                 probe_timeout_seconds: float = PROBE_TIMEOUT_SECONDS):
+        self._port: int = port
+        self._connect_timeout_seconds: float = connect_timeout_seconds
+        self._probe_timeout_seconds: float = probe_timeout_seconds
+
+    # The /24 subnet this computer is on (by the address it would use to reach the internet; no packets
+    # are sent).  None if it can't be determined.
+    @staticmethod
+    def local_subnet() -> str:
+        """Determine the local network's subnet, e.g. 192.168.1.0/24"""
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as udp_socket:
+                udp_socket.connect(("10.255.255.255", 1))
+                local_address = udp_socket.getsockname()[0]
+        except OSError:
+            return None
+        return str(ipaddress.ip_network(f"{local_address}/24", strict=False))
+
+    # Scan the subnet.  Return the servers found, best first (see DiscoveredServer.sort_key), and an
+    # error message if the subnet can't be scanned
+    @tracelog
+    def scan(self, subnet: str) -> ([DiscoveredServer], str):
+        """Find hosts on the subnet listening on the TheSkyX port, and probe them"""
+        try:
+            network = ipaddress.ip_network(subnet.strip(), strict=False)
+        except ValueError as error:
+            return [], str(error)
+        if network.num_addresses > ServerDiscovery.MAXIMUM_HOSTS:
+            return [], f"Subnet {network} is too large to scan (at most {ServerDiscovery.MAXIMUM_HOSTS} addresses)"
+        addresses = [str(address) for address in network.hosts()] if network.num_addresses > 1 \
+            else [str(network.network_address)]
+        with ThreadPoolExecutor(max_workers=min(ServerDiscovery.MAXIMUM_WORKERS, len(addresses))) as executor:
+            found = [server for server in executor.map(self.try_host, addresses) if server is not None]
+        found.sort(key=DiscoveredServer.sort_key)
+        return found, ""
+
+    # Try one address: None if nothing accepts a connection on the port, otherwise what was found
+    def try_host(self, address: str) -> DiscoveredServer:
+        """Connect to the TheSkyX port at an address and, if it is open, probe it"""
+        connect_started = time.perf_counter()
+        try:
+            connection = socket.create_connection((address, self._port), self._connect_timeout_seconds)
+        except OSError:
+            return None
+        server = DiscoveredServer(address, time.perf_counter() - connect_started)
+        with connection:
+            self.probe(connection, server)
+        return server
+
+    # Send the probe script on an open connection and record whether, and how quickly, it was answered
+    def probe(self, connection: socket.socket, server: DiscoveredServer):
+        """Check whether the listener answers like TheSkyX"""
+        received = b""
+        probe_started = time.perf_counter()
+        try:
+            connection.settimeout(self._probe_timeout_seconds)
+            connection.sendall(ServerDiscovery.PROBE_PACKET.encode("utf-8"))
+            while TheSkyX.END_OF_REPLY.search(received) is None:
+                if time.perf_counter() - probe_started > self._probe_timeout_seconds:
+                    raise socket.timeout()
+                data = connection.recv(TheSkyX.MAX_RECEIVE_SIZE)
+                if len(data) == 0:
+                    server.message = "closed without replying"
+                    return
+                received += data
+        except (TimeoutError, socket.timeout):
+            server.message = "no reply"
+            return
+        except OSError as error:
+            server.message = str(error)
+            return
+        server.round_trip_seconds = time.perf_counter() - probe_started
+        server.is_theskyx = received.decode("utf-8", errors="replace").startswith("pySkyDarks")
+        if not server.is_theskyx:
+            server.message = "unexpected reply"
@@ -0,0 +1,267 @@
+# Measure how quickly a session gets through a plan: runs SessionThreadWorker from start to finish against
+# the TheSkyX stand-in server (so the real TheSkyX command code and network round trips are included),
+# with the simulated camera on a virtual clock.  Network round-trip time and download times are set per
+# run, and add to the session's (virtual) time, so a night's session is measured in a few seconds.
+#
+# For each plan it reports frames per hour, the percentage of session time not spent exposing (dead time),
+# overhead per frame (time between frames beyond the exposure), commands sent per frame, and time to the
+# first frame.  Reports are saved as JSON so runs from different versions can be compared.
+#
+# Given network impairments (arguments for ImpairedTransport: jitter, drops, refused connections, partial
+# reads, with a seed), the session's commands go through an ImpairedTransport, to measure throughput and
+# recovery over a poor link.  Each plan starts from the same seed, so runs can be repeated.  Given a
+# reconnect time, the session uses a ResilientTheSkyX and rides out lost connections, as a real one would.
+# Given a camera failure rate, the stand-in fails that fraction of camera operations, to measure what the
+# session's frame retry policy costs and saves.
+#
+# A plan can also be run against a trace recorded from a real TheSkyX session (see TheSkyXReplayServer),
+# to measure the session logic with a real camera's command timing.
+import json
+import platform
+import subprocess
+from datetime import datetime, MAXYEAR
+from time import perf_counter
+
+from BiasFrameSet import BiasFrameSet
+from CameraCoolingInfo import CameraCoolingInfo
+from DarkFrameSet import DarkFrameSet
+from FrameRetryPolicy import FrameRetryPolicy
+from FrameSet import FrameSet
+from ImpairedTransport import ImpairedTransport
+from MultiOsUtil import MultiOsUtil
+from ResilientTheSkyX import ResilientTheSkyX
+from SessionController import SessionController
+from SessionThreadWorker import SessionThreadWorker
+from SessionTimeInfo import SessionTimeInfo
+from SimulatedCamera import SimulatedCamera
+from TheSkyX import TheSkyX
+from TheSkyXReplayServer import TheSkyXReplayServer
+from TheSkyXStandInServer import TheSkyXStandInServer
+from VirtualClock import VirtualClock
+from tracelog import *
+
+
+class SessionBenchmark:
+    REPORT_FORMAT_VERSION = 1
+    # Representative plans: name -> description
+    PLANS = {
+        "bias": "100 bias frames at each of binning 1 and 2",
+        "darks": "16 darks each of 1, 10, 60, 300 and 600 seconds, binning 1",
+        "mixed": "32 bias and 16 darks each of 60 and 300 seconds, at binning 1 and 2",
+        "cooled-darks": "16 darks of 60 seconds, binning 1, after cooling to -10 degrees",
+    }
+    COOLING_TARGET = -10.0
+    # Metrics compared between reports, and whether a higher value is an improvement
+    HIGHER_IS_BETTER = {"frames_per_hour": True, "dead_time_percent": False, "overhead_per_frame_seconds": False,
+                        "commands_per_frame": False, "time_to_first_frame_seconds": False}
+
+    def __init__(self, rtt_seconds: float = 0.0, download_seconds: {int: float} = None,
+                 impairments: {str: object} = None,
+                 reconnect_seconds: float = 0,  # SessionThreadWorker's; 0 to end a session on a lost connection
+                 failure_rate: float = 0.0,  # Fraction of camera operations that fail
+                 retry_policy: FrameRetryPolicy = None):
+        self._rtt_seconds: float = rtt_seconds
+        self._download_seconds: {int: float} = download_seconds if download_seconds is not None \
+            else SimulatedCamera.DOWNLOAD_SECONDS
+        self._impairments: {str: object} = impairments  # ImpairedTransport arguments, None for a clean link
+        self._reconnect_seconds: float = reconnect_seconds
+        self._failure_rate: float = failure_rate
+        self._retry_policy: FrameRetryPolicy = retry_policy if retry_policy is not None else FrameRetryPolicy()
+
+    # The frame sets of one of the representative plans
+    @staticmethod
+    def make_plan(plan_name: str) -> [FrameSet]:
+        """Create the frame sets of the named benchmark plan"""
+        if plan_name == "bias":
+            return [BiasFrameSet(100, binning) for binning in (1, 2)]
+        elif plan_name == "darks":
+            return [DarkFrameSet(16, exposure, 1) for exposure in (1, 10, 60, 300, 600)]
+        elif plan_name == "mixed":
+            return [frame_set
+                    for binning in (1, 2)
+                    for frame_set in [BiasFrameSet(32, binning)]
+                    + [DarkFrameSet(16, exposure, binning) for exposure in (60, 300)]]
+        else:
+            assert plan_name == "cooled-darks"
+            return [DarkFrameSet(16, 60, 1)]
+
+    @staticmethod
+    def make_cooling_info(cooled: bool) -> CameraCoolingInfo:
+        return CameraCoolingInfo(is_regulated=cooled,
+                                 target_temperature=SessionBenchmark.COOLING_TARGET,
+                                 target_tolerance=0.5,
+                                 cooling_check_interval=30,
+                                 max_time_to_try=1800,
+                                 cooling_retry_count=0,
+                                 cooling_retry_delay=0,
+                                 abort_on_temperature_rise=False,
+                                 abort_temperature_threshold=0,
+                                 warm_up_when_done=False,
+                                 warm_up_when_done_time=0)
+
+    # Run a session of one plan and return its measurements
+    @tracelog
+    def run_plan(self, plan_name: str) -> {str: object}:
+        """Run the named plan as a session against the stand-in server and measure it"""
+        clock = VirtualClock()
+        camera = SimulatedCamera(clock, self._download_seconds)
+        server = TheSkyXStandInServer(camera, latency_seconds=self._rtt_seconds, failure_rate=self._failure_rate,
+                                      seed=plan_name)
+        return self.run_session(SessionBenchmark.PLANS[plan_name], self.make_plan(plan_name),
+                                self.make_cooling_info(plan_name.startswith("cooled")), server, clock)
+
+    # Run a session of the given frame sets against a recorded trace, replayed with its recorded timing
+    @tracelog
+    def run_replay(self, exchanges: [{str: object}], frame_sets: [FrameSet],
+                   cooling_info: CameraCoolingInfo) -> {str: object}:
+        """Run frame sets as a session against a replayed trace and measure it"""
+        clock = VirtualClock()
+        server = TheSkyXReplayServer(exchanges, clock)
+        results = self.run_session("Replay of a recorded trace", frame_sets, cooling_info, server, clock)
+        results["packets_not_in_trace"] = server.get_misses()
+        return results
+
+    # Run a session against a server (not yet started) whose delays are on the given virtual clock
+    def run_session(self, description: str, frame_sets: [FrameSet], cooling_info: CameraCoolingInfo,
+                    server: TheSkyXStandInServer, clock: VirtualClock) -> {str: object}:
+        """Run a session of the frame sets and measure it"""
+        server.start()
+        frame_times: [float] = []  # Session time each frame was acquired
+        exposures: [float] = []  # and its exposure
+        controller = SessionController()
+        time_info = SessionTimeInfo(True, clock.now(), True, datetime(MAXYEAR, 12, 31, 23, 59, 59))
+        transport = ImpairedTransport(clock=clock, **self._impairments) if self._impairments is not None else None
+        if self._reconnect_seconds > 0:
+            client = ResilientTheSkyX("localhost", server.get_port(), transport,
+                                      cancelled=controller.thread_cancelled, clock=clock)
+        else:
+            client = TheSkyX("localhost", server.get_port(), transport, cancelled=controller.thread_cancelled)
+        worker = SessionThreadWorker(frame_sets, time_info, controller,
+                                     cooling_info,
+                                     False, 0, "", "",
+                                     "localhost", server.get_port(),
+                                     False,
+                                     clock=clock,
+                                     server=client,
+                                     reconnect_seconds=self._reconnect_seconds,
+                                     retry_policy=self._retry_policy)
+
+        def frame_acquired(frame_set: FrameSet, _row_index: int):
+            frame_times.append(clock.monotonic())
+            exposure = 0.0 if isinstance(frame_set, BiasFrameSet) else frame_set.get_exposure_seconds()
+            exposures.append(float(exposure))
+
+        worker.frameAcquired.connect(frame_acquired)
+        real_started = perf_counter()
+        # Run in this thread; there's no UI to keep responsive
+        worker.run_session()
+        real_seconds = perf_counter() - real_started
+        session_seconds = clock.monotonic()
+        server.stop()
+
+        frames = len(frame_times)
+        results = {"description": description,
+                   "completed_normally": worker.completed_normally(),
+                   "frames": frames,
+                   "session_seconds": round(session_seconds, 3),
+                   "exposure_seconds": sum(exposures),
+                   "commands": server.get_packets_received(),
+                   "real_seconds": round(real_seconds, 3)}
+        if transport is not None:
+            results["connections_refused"] = transport.get_refused()
+            results["connections_dropped"] = transport.get_dropped()
+        timing = controller.get_timing_report()
+        results["frame_retries"] = timing.frame_retries
+        results["frame_sets_skipped"] = timing.frame_sets_skipped
+        if isinstance(client, ResilientTheSkyX):
+            results["command_retries"] = client.get_retries_sent()
+            results["circuit_breaker_trips"] = client.get_breaker_trips()
+        if frames > 0:
+            results["frames_per_hour"] = round(frames / (session_seconds / 3600), 2)
+            results["dead_time_percent"] = round(100 * (session_seconds - sum(exposures)) / session_seconds, 2)
+            results["commands_per_frame"] = round(server.get_packets_received() / frames, 2)
+            results["time_to_first_frame_seconds"] = round(frame_times[0], 3)
+        if frames > 1:
+            # Time between the first and last frames, less the exposures taken in it, per frame
+            between_frames = frame_times[-1] - frame_times[0] - sum(exposures[1:])
+            results["overhead_per_frame_seconds"] = round(between_frames / (frames - 1), 3)
+        return results
+
+    # Run the named plans (all of them if none are named) and return a report
+    @tracelog
+    def run(self, plan_names: [str] = None) -> {str: object}:
+        """Run benchmark plans and collect their results in a report"""
+        if plan_names is None:
+            plan_names = list(SessionBenchmark.PLANS.keys())
+        return self.make_report({plan_name: self.run_plan(plan_name) for plan_name in plan_names})
+
+    # A report of the given results (by plan name), with the program version and settings they came from
+    def make_report(self, results: {str: {str: object}}) -> {str: object}:
+        """Wrap benchmark results in a report"""
+        return {"report_format": SessionBenchmark.REPORT_FORMAT_VERSION,
+                "program_version": self.program_version(),
+                "python_version": platform.python_version(),
+                "platform": platform.platform(),
+                "timestamp": datetime.now().isoformat(timespec="seconds"),
+                "settings": {"rtt_seconds": self._rtt_seconds,
+                             "download_seconds": {str(binning): seconds
+                                                  for (binning, seconds) in self._download_seconds.items()},
+                             "impairments": self._impairments,
+                             "reconnect_seconds": self._reconnect_seconds,
+                             "failure_rate": self._failure_rate,
+                             "retry_policy": self._retry_policy.as_text()},
+                "results": results}
+
+    # The git commit of the program, if it is running from a git checkout, so reports can be matched to versions
+    @staticmethod
+    def program_version() -> str:
+        try:
+            completed = subprocess.run(["git", "describe", "--always", "--dirty"],
+                                       cwd=MultiOsUtil.path_for_file_in_program_directory(""),
+                                       capture_output=True, text=True, timeout=10)
+            if completed.returncode == 0:
+                return completed.stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            pass
+        return "unknown"
+
+    @staticmethod
+    def save_report(report: {str: object}, file_path: str) -> (bool, str):
+        """Write a report to a JSON file.  Return success and an error message"""
+        try:
+            with open(file_path, "w") as report_file:
+                json.dump(report, report_file, indent=2)
+        except OSError as error:
+            return False, str(error)
+        return True, ""
+
+    @staticmethod
+    def load_report(file_path: str) -> ({str: object}, str):
+        """Read a report saved by save_report.  Return it (None if unreadable) and an error message"""
+        try:
+            with open(file_path, "r") as report_file:
+                return json.load(report_file), ""
+        except (OSError, json.JSONDecodeError) as error:
+            return None, str(error)
+
+    # Lines describing how the metrics changed from an earlier report to a later one, e.g.
+    #   "darks  frames_per_hour  5.31 -> 5.12  (-3.6%, worse)"
+    @staticmethod
+    def compare_reports(earlier: {str: object}, later: {str: object}) -> [str]:
+        """Describe the changes in each plan's metrics between two reports"""
+        lines = []
+        for (plan_name, later_results) in later["results"].items():
+            earlier_results = earlier["results"].get(plan_name)
+            if earlier_results is None:
+                continue
+            for (metric, higher_is_better) in SessionBenchmark.HIGHER_IS_BETTER.items():
+                if metric not in earlier_results or metric not in later_results:
+                    continue
+                (before, after) = (earlier_results[metric], later_results[metric])
+                if before == after:
+                    change = "unchanged"
+                else:
+                    percent = f"{100 * (after - before) / before:+.1f}%, " if before != 0 else ""
+                    change = percent + ("better" if (after > before) == higher_is_better else "worse")
+                lines.append(f"{plan_name:14} {metric:28} {before:10} -> {after:10}  ({change})")
+        return lines
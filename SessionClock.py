@@ -0,0 +1,24 @@
+# The source of time for a session.  The session worker asks its clock for the time of day (to compare with
+# the session start and end times) and for elapsed time (to time waits and downloads), and sleeps through it.
+# RealClock uses the computer's clocks; VirtualClock only pretends to sleep, so a whole night's session
+# against a simulated camera runs in seconds.
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class SessionClock(ABC):
+
+    # Time of day, for comparing with session start and end times
+    @abstractmethod
+    def now(self) -> datetime:
+        pass
+
+    # Seconds from an arbitrary starting point, for measuring intervals.  Unaffected by changes to
+    # the time of day (e.g. the computer's clock being corrected, or daylight saving time).
+    @abstractmethod
+    def monotonic(self) -> float:
+        pass
+
+    @abstractmethod
+    def sleep(self, seconds: float):
+        pass
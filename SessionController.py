@@ -1,7 +1,17 @@
 # Class with an instance shared by the main event controller and the session worker
 # Using mutex-lock, basic status such as "cancel the thread" can be set by the main controller
 # and safely read and responded to by the worker.
+# The worker also records what it is doing here (a SessionStatus), and the main controller
+# reads a copy whenever it wants to update the display.
+# Likewise the worker adds the timing of each frame to a SessionTimingReport kept here, and whoever
+# saves the plan after each frame adds the time that took.
+import copy
+
 from PyQt5.QtCore import QMutex
+
+from FrameTiming import FrameTiming
+from SessionStatus import SessionStatus
+from SessionTimingReport import SessionTimingReport
 from tracelog import *
 
 class SessionController:
@@ -9,6 +19,8 @@ class SessionController:
     def __init__(self):
         self._mutex = QMutex()
         self._thread_ok_to_run = True
+        self._status = SessionStatus()
+        self._timing_report = SessionTimingReport()
 
     def cancel_thread(self):
         """Set flag to cancel the controlled thread"""
@@ -26,3 +38,58 @@ class SessionController:
     def thread_cancelled(self):
         """Indicate if the controlled thread is cancelled"""
         return not self.thread_running()
+
+    # Change some fields of the session status, e.g. publish_status(progress_value=20)
+    def publish_status(self, **changes):
+        """Record changes to the session status"""
+        self._mutex.lock()
+        for (name, value) in changes.items():
+            assert hasattr(self._status, name)
+            setattr(self._status, name, value)
+        self._status.version += 1
+        self._mutex.unlock()
+
+    def get_status(self) -> SessionStatus:
+        """Return a copy of the current session status"""
+        self._mutex.lock()
+        result = self._status.copy()
+        self._mutex.unlock()
+        return result
+
+    # Change some fields of the timing report, e.g. update_timing(setup_seconds=120.0)
+    def update_timing(self, **changes):
+        """Record changes to the session timing totals"""
+        self._mutex.lock()
+        for (name, value) in changes.items():
+            assert hasattr(self._timing_report, name)
+            setattr(self._timing_report, name, value)
+        self._mutex.unlock()
+
+    def add_frame_timing(self, timing: FrameTiming):
+        """Add the timing of an acquired frame to the timing report"""
+        self._mutex.lock()
+        self._timing_report.frames.append(timing)
+        self._mutex.unlock()
+
+    def add_save_seconds(self, row_index: int, seconds: float):
+        """Add time spent saving the plan after a frame of the given frame set"""
+        self._mutex.lock()
+        self._timing_report.add_save_seconds(row_index, seconds)
+        self._mutex.unlock()
+
+    # The timing totals (SessionTimingReport.summary) and the last frame's timing (None if no frames yet),
+    # without copying every frame
+    def get_timing_summary(self) -> ({str: object}, FrameTiming):
+        """Return the session timing totals and a copy of the latest frame's timing"""
+        self._mutex.lock()
+        summary = self._timing_report.summary()
+        last_frame = copy.copy(self._timing_report.frames[-1]) if len(self._timing_report.frames) > 0 else None
+        self._mutex.unlock()
+        return summary, last_frame
+
+    def get_timing_report(self) -> SessionTimingReport:
+        """Return a copy of the session timing report"""
+        self._mutex.lock()
+        result = self._timing_report.copy()
+        self._mutex.unlock()
+        return result
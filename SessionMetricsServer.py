@@ -0,0 +1,149 @@
+# Serves the state of a running session over HTTP, in the Prometheus text format, so an unattended
+# session can be graphed and alerted on by a local monitoring system (GET /metrics).
+# Everything served is read from the SessionController's status and timing totals, and from the frame sets'
+# completed counts, when a request arrives: the worker does nothing extra for it, and no commands are sent
+# to TheSkyX (the worker reads the cooler power itself, every so often, for the display).
+# Requests are answered on the server's own threads.
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from BiasFrameSet import BiasFrameSet
+from FrameSet import FrameSet
+from SessionController import SessionController
+from SessionThreadWorker import SessionThreadWorker
+from tracelog import *
+
+
+class SessionMetricsServer:
+    METRICS_PATH = "/metrics"
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+    PREFIX = "pyskydarks_"
+    PHASES = (SessionThreadWorker.PHASE_WAITING, SessionThreadWorker.PHASE_WAKE_ON_LAN,
+              SessionThreadWorker.PHASE_CONNECTING, SessionThreadWorker.PHASE_MEASURING,
+              SessionThreadWorker.PHASE_COOLING, SessionThreadWorker.PHASE_ACQUIRING,
+              SessionThreadWorker.PHASE_WARMING, SessionThreadWorker.PHASE_COMPLETED,
+              SessionThreadWorker.PHASE_FAILED)
+    # Last frame's command latencies: label -> FrameTiming attribute
+    LATENCIES = {"configure": "configure_seconds",
+                 "temperature_check": "temperature_check_seconds",
+                 "start_image": "start_command_seconds",
+                 "completion_poll": "resync_seconds"}
+
+    def __init__(self, controller: SessionController, frame_sets: [FrameSet],
+                 address: str = "localhost",
+                 port: int = 0):  # 0 to use any free port; see get_port
+        self._controller: SessionController = controller
+        self._frame_sets: [FrameSet] = frame_sets
+        self._server_thread: threading.Thread = None
+        metrics_server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != SessionMetricsServer.METRICS_PATH:
+                    self.send_error(404)
+                    return
+                body = metrics_server.metrics_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", SessionMetricsServer.CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format_string, *args):
+                pass  # Scrapes every few seconds would swamp the console
+
+        self._http_server = ThreadingHTTPServer((address, port), RequestHandler)
+        self._http_server.daemon_threads = True
+
+    def get_port(self) -> int:
+        return self._http_server.server_address[1]
+
+    @tracelog
+    def start(self):
+        """Start serving metrics in a background thread"""
+        self._server_thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+        self._server_thread.start()
+
+    @tracelog
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        self._http_server.shutdown()
+        self._http_server.server_close()
+        if self._server_thread is not None:
+            self._server_thread.join()
+            self._server_thread = None
+
+    # The current metrics, in the Prometheus text exposition format
+    def metrics_text(self) -> str:
+        """Describe the session's current state as metrics"""
+        status = self._controller.get_status()
+        (timing, last_frame) = self._controller.get_timing_summary()
+        lines = []
+
+        self.add_metric(lines, "session_phase", "gauge", "1 for the phase the session is in",
+                        [({"phase": phase}, 1 if status.phase == phase else 0)
+                         for phase in SessionMetricsServer.PHASES])
+        self.add_metric(lines, "session_row", "gauge", "Frame set being acquired, from 1; 0 if none",
+                        [({}, status.row_index + 1)])
+        self.add_metric(lines, "frames_planned", "gauge", "Frames wanted in each frame set of the session",
+                        [(self.frame_set_labels(row_index, frame_set), frame_set.get_number_of_frames())
+                         for (row_index, frame_set) in enumerate(self._frame_sets)])
+        self.add_metric(lines, "frames_completed", "gauge", "Frames completed in each frame set of the session",
+                        [(self.frame_set_labels(row_index, frame_set), frame_set.get_number_complete())
+                         for (row_index, frame_set) in enumerate(self._frame_sets)])
+        self.add_metric(lines, "frames_acquired_total", "counter", "Frames acquired in this session",
+                        [({}, timing["frames"])])
+        if status.temperature is not None:
+            self.add_metric(lines, "camera_temperature_celsius", "gauge", "Last camera temperature read",
+                            [({}, status.temperature)])
+        if status.cooler_power is not None:
+            self.add_metric(lines, "cooler_power_percent", "gauge", "Last camera cooler power read",
+                            [({}, status.cooler_power)])
+        if status.eta is not None:
+            self.add_metric(lines, "estimated_completion_timestamp_seconds", "gauge",
+                            "When the session (or, before acquiring, the current phase) should end",
+                            [({}, round(status.eta.timestamp(), 3))])
+        if last_frame is not None:
+            self.add_metric(lines, "command_latency_seconds", "gauge", "Command times for the latest frame",
+                            [({"command": command}, round(getattr(last_frame, attribute), 3))
+                             for (command, attribute) in SessionMetricsServer.LATENCIES.items()])
+        self.add_metric(lines, "acquiring_seconds_total", "counter", "Time spent acquiring frames",
+                        [({}, timing["acquiring_seconds"])])
+        self.add_metric(lines, "exposure_seconds_total", "counter", "Time spent exposing",
+                        [({}, timing["exposure_seconds"])])
+        # Time the causes don't account for ("other") can fall as the causes are totalled, so it is a gauge
+        dead_time_by_cause = dict(timing["dead_time_by_cause"])
+        unattributed_seconds = dead_time_by_cause.pop("other", 0.0)
+        self.add_metric(lines, "dead_time_seconds_total", "counter", "Acquiring time not spent exposing, by cause",
+                        [({"cause": cause}, seconds) for (cause, seconds) in dead_time_by_cause.items()])
+        self.add_metric(lines, "dead_time_unattributed_seconds", "gauge",
+                        "Acquiring time not spent exposing that the causes don't account for",
+                        [({}, unattributed_seconds)])
+        self.add_metric(lines, "frame_retries_total", "counter", "Frames taken again after failing",
+                        [({}, timing["frame_retries"])])
+        self.add_metric(lines, "frame_sets_skipped_total", "counter", "Frame sets skipped after failing frames",
+                        [({}, timing["frame_sets_skipped"])])
+        return "\n".join(lines) + "\n"
+
+    # Add the HELP, TYPE and sample lines of one metric
+    @staticmethod
+    def add_metric(lines: [str], name: str, metric_type: str, help_text: str, samples: [({str: str}, float)]):
+        full_name = SessionMetricsServer.PREFIX + name
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        for (labels, value) in samples:
+            label_text = ",".join(f'{label}="{SessionMetricsServer.escape_label(str(label_value))}"'
+                                  for (label, label_value) in labels.items())
+            lines.append(f"{full_name}{{{label_text}}} {value}" if label_text != "" else f"{full_name} {value}")
+
+    @staticmethod
+    def frame_set_labels(row_index: int, frame_set: FrameSet) -> {str: str}:
+        exposure = 0 if isinstance(frame_set, BiasFrameSet) else frame_set.get_exposure_seconds()
+        return {"row": str(row_index + 1),
+                "type": frame_set.type_name_text(),
+                "exposure": str(exposure),
+                "binning": str(frame_set.get_binning())}
+
+    @staticmethod
+    def escape_label(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
@@ -0,0 +1,39 @@
+# Snapshot of what a running session is doing, for display: the phase (e.g. "Cooling"), the frame set
+# being worked on, progress through the current wait, the estimated finish time, and the last camera
+# temperature and cooler power read.
+# The worker thread updates the snapshot held by the SessionController as often as it likes; the UI takes
+# a copy on a timer tick and draws it.  So the traffic between the threads doesn't depend on how busy
+# the worker is.
+from datetime import datetime
+
+from tracelog import *
+
+
+class SessionStatus:
+    NO_ROW = -1  # Not working on a frame set (waiting, cooling, etc.)
+
+    def __init__(self):
+        self.phase: str = ""
+        self.row_index: int = SessionStatus.NO_ROW
+        self.progress_value: int = 0
+        self.progress_maximum: int = 0
+        self.eta: datetime = None  # When the current phase (or, while acquiring, the session) should end
+        self.temperature: float = None  # Last camera temperature read, None if not known
+        self.cooler_power: float = None  # Last cooler power (percent) read, None if not known or cooler off
+        self.version: int = 0  # Incremented on every change, so the UI can skip redrawing an unchanged status
+
+    def copy(self):
+        """Return an independent copy of this status"""
+        result = SessionStatus()
+        result.__dict__.update(self.__dict__)
+        return result
+
+    # One-line description, e.g. "Cooling, -10.2°, until 21:45"
+    def summary_text(self) -> str:
+        """Describe the status in a short line for display"""
+        parts = [self.phase] if self.phase != "" else []
+        if self.temperature is not None:
+            parts.append(f"{self.temperature:.1f}°")
+        if self.eta is not None:
+            parts.append(self.eta.strftime("until %H:%M"))
+        return ", ".join(parts)
@@ -1,28 +1,51 @@
 from datetime import datetime, timedelta
-from time import sleep
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
 from BiasFrameSet import BiasFrameSet
 from CameraCoolingInfo import CameraCoolingInfo
 from DarkFrameSet import DarkFrameSet
+from FrameRetryPolicy import FrameRetryPolicy
 from FrameSet import FrameSet
+from FrameTiming import FrameTiming
+from RealClock import RealClock
+from ResilientTheSkyX import ResilientTheSkyX
 from RmNetUtils import RmNetUtils
+from SessionClock import SessionClock
 from SessionController import SessionController
+from SessionStatus import SessionStatus
 from SessionTimeInfo import SessionTimeInfo
 from TheSkyX import TheSkyX
 from tracelog import *
 
 class SessionThreadWorker(QObject):
     PROGRESS_UPDATE_INTERVAL = 2  # Update progress bar every this many seconds
+    # Phases shown in the session status
+    PHASE_WAITING = "Waiting to start"
+    PHASE_WAKE_ON_LAN = "Waking server"
+    PHASE_CONNECTING = "Connecting"
+    PHASE_MEASURING = "Measuring download times"
+    PHASE_COOLING = "Cooling"
+    PHASE_ACQUIRING = "Acquiring"
+    PHASE_WARMING = "Warming up"
+    PHASE_COMPLETED = "Completed"
+    PHASE_FAILED = "Cancelled or failed"
     CAMERA_RESYNC_CHECK_INTERVAL = .5  # After camera should be done, check in every this many seconds
     CAMERA_RESYNC_TIMEOUT = 3 * 60  # Time out if camera doesn't resync after this many seconds
+    CAMERA_RESYNC_TIMEOUT_MESSAGE = "Timed out waiting for camera to finish"
+    COOLER_POWER_READ_INTERVAL = 20  # While the cooler is on, read its power at most this often (seconds)
+    RECONNECT_CHECK_INTERVAL = 5  # While reconnecting, try TheSkyX at least this many seconds apart
+    RECONNECT_ATTEMPTS = 3  # Reconnections for any one command before the session gives up
+    # While waiting for a woken server: probe it at growing intervals, and send the wake-on-lan again now and then
+    READY_PROBE_FIRST_INTERVAL = 5
+    READY_PROBE_MAXIMUM_INTERVAL = 60
+    READY_PROBE_CONNECT_TIMEOUT = 3  # Seconds to wait for the TheSkyX port to accept a connection
+    WAKE_ON_LAN_RESEND_INTERVAL = 120
 
+    # Progress (phase, row, progress bar, etc.) isn't signalled; it is published in the controller's
+    # SessionStatus, which the UI reads on its own schedule.
     finished = pyqtSignal()
-    startRowIndex = pyqtSignal(int)
     consoleLine = pyqtSignal(str, int)
-    startProgressBar = pyqtSignal(int)  # Initialize progress bar, for maximum this much
-    updateProgressBar = pyqtSignal(int)  # Update the bar with this value of progress toward maximum
     displayCameraPath = pyqtSignal(str)  # Display given camera autosave path in the UI
     frameAcquired = pyqtSignal(FrameSet, int)  # A frame has been successfully acquired
     coolerStarted = pyqtSignal()  # Tell main UI that we are running the cooler
@@ -39,7 +62,11 @@ class SessionThreadWorker(QObject):
                  wol_mac_address: str,
                  network_address: str,
                  network_port: int,
-                 disconnect_when_done: bool):
+                 disconnect_when_done: bool,
+                 clock: SessionClock = None,  # source of time; the real clocks if not given
+                 server: TheSkyX = None,  # e.g. a simulated server; connect to the network address if not given
+                 reconnect_seconds: float = 0,  # How long to keep trying to reach TheSkyX mid-session; 0 not to
+                 retry_policy: FrameRetryPolicy = None):  # What to do when a frame fails; the default policy if None
         # print(f"SessionThreadWorker init called with timeInfo {time_info}")
         QObject.__init__(self)
         self._frame_set_list: [FrameSet] = frame_set_list
@@ -53,8 +80,19 @@ class SessionThreadWorker(QObject):
         self._network_address: str = network_address
         self._network_port: int = network_port
         self._disconnect_when_done = disconnect_when_done
+        self._clock: SessionClock = clock if clock is not None else RealClock()
+        self._server: TheSkyX = server
+        self._reconnect_seconds: float = reconnect_seconds
+        self._retry_policy: FrameRetryPolicy = retry_policy if retry_policy is not None else FrameRetryPolicy()
 
         self._download_times: {int: float} = {}  # We'll measure times of binnings later
+        self._completed_normally: bool = False
+        self._session_started_at: float = 0.0  # Monotonic time the session began, after any wait to start
+        self._acquiring_started_at: float = 0.0  # Monotonic time frame acquisition began
+        self._cooler_on: bool = False
+        self._cooler_power_read_at: float = None  # Monotonic time of the last cooler power reading
+        self._frame_retries: int = 0  # Frames taken again after failing, in this session
+        self._frame_sets_skipped: int = 0
 
     @tracelog
     def run_session(self):
@@ -65,9 +103,13 @@ class SessionThreadWorker(QObject):
         if self.wait_for_start_time(self._time_info.get_start_now(),
                                     self._time_info.get_start_date_time(),
                                     self._wake_on_lan_before, self._wake_on_lan_lead_seconds):
+            self._session_started_at = self._clock.monotonic()
+            self._controller.update_timing(session_started=self._clock.now())
+            server = self._server if self._server is not None else self.make_server()
             if self.optional_wake_on_lan(self._wake_on_lan_before, self._wake_on_lan_lead_seconds,
-                                         self._wol_broadcast_address, self._wol_mac_address):
-                server = TheSkyX(self._network_address, self._network_port)
+                                         self._wol_broadcast_address, self._wol_mac_address, server):
+                self._controller.publish_status(phase=SessionThreadWorker.PHASE_CONNECTING,
+                                                progress_value=0, progress_maximum=0, eta=None)
                 (success, path, message) = self.get_camera_path(server)
                 if not success:
                     self.console("Unable to connect to TheSkyX server", 1)
@@ -78,14 +120,21 @@ class SessionThreadWorker(QObject):
                         if self.start_cooling_camera(server, self._cooling_info):
                             # Now that the camera cooler is on (if it is cooled), start a timer that
                             # will update the displayed cooler power every so often
-                            started_cooling_at = datetime.now()
+                            started_cooling_at = self._clock.monotonic()
                             if self.measure_download_times(server):
                                 if self.wait_for_cooling(server, self._cooling_info, started_cooling_at):
-                                    if self.acquire_frames(server, self._frame_set_list,
-                                                           self._cooling_info, self._time_info):
+                                    acquired = self.acquire_frames(server, self._frame_set_list,
+                                                                   self._cooling_info, self._time_info)
+                                    self.console_timing_summary()
+                                    if acquired:
                                         if self.warmup_if_requested(server, self._cooling_info):
                                             if self.disconnect_if_requested(server, self._disconnect_when_done):
                                                 normal_completion = True
+        self._completed_normally = normal_completion
+        self._controller.publish_status(phase=SessionThreadWorker.PHASE_COMPLETED if normal_completion
+                                        else SessionThreadWorker.PHASE_FAILED,
+                                        row_index=SessionStatus.NO_ROW,
+                                        progress_value=0, progress_maximum=1, eta=None)  # Empty bar, not busy
         if normal_completion:
             self.console("Session completed normally", 1)
         else:
@@ -93,6 +142,19 @@ class SessionThreadWorker(QObject):
         self.finished.emit()
         # print("run_session Ended")
 
+    # The client for TheSkyX at the network address: one that retries lost connections, if the session
+    # is to ride out network trouble
+    def make_server(self) -> TheSkyX:
+        """Create the TheSkyX client for the session"""
+        if self._reconnect_seconds > 0:
+            return ResilientTheSkyX(self._network_address, self._network_port,
+                                    cancelled=self._controller.thread_cancelled, clock=self._clock)
+        return TheSkyX(self._network_address, self._network_port, cancelled=self._controller.thread_cancelled)
+
+    # Did the last run_session get all the way through, rather than being cancelled or failing?
+    def completed_normally(self) -> bool:
+        return self._completed_normally
+
     # Wait until an appropriate start time.
     #  This might be
     #       - No wait (start now); or
@@ -104,24 +166,27 @@ class SessionThreadWorker(QObject):
         """Wait for the start time calculated from the session start information"""
         # print(f"wait_for_start_time({start_now},{start_time},{wake_on_lan_before},{wake_on_lan_lead_seconds})")
         success = True
-        wait_seconds = self.start_wait_seconds(start_now, start_time, wake_on_lan_before, wake_on_lan_lead_seconds)
+        wait_seconds = self.start_wait_seconds(start_now, start_time, wake_on_lan_before, wake_on_lan_lead_seconds,
+                                               self._clock.now())
         if wait_seconds > 0:
             self.console(f"Waiting {self.casual_interval_format(wait_seconds)}", 1)
+            self._controller.publish_status(phase=SessionThreadWorker.PHASE_WAITING)
             success = self.sleep_with_progress_bar(wait_seconds)
         return success
 
     @staticmethod
     @tracelog
     def start_wait_seconds(start_now: bool, start_time: datetime,
-                           wake_on_lan_before: bool, wake_on_lan_lead_seconds: float) -> float:
+                           wake_on_lan_before: bool, wake_on_lan_lead_seconds: float,
+                           now: datetime) -> float:
         """Calculate the number of seconds to wait before session start"""
         # print(f"start_wait_seconds({start_now},{start_time},{wake_on_lan_before},{wake_on_lan_lead_seconds})")
         # Start with how long to wait
         if start_now:
             wait_time = 0
         else:
-            difference = start_time - datetime.now()
-            wait_time = difference.seconds
+            difference = start_time - now
+            wait_time = difference.total_seconds()
         # print(f"Initial start delay = {wait_time} seconds")
 
         # If wake-on-lan is wanted in advance, reduce wait time by that much to leave time for it
@@ -170,29 +235,63 @@ class SessionThreadWorker(QObject):
 
         return result
 
-    # Sleep the given number of seconds, emitting a signal to let the
+    # Sleep the given number of seconds, publishing progress in the session status to let the
     # main UI window update a progress bar.   Because we want to update the
     # progress bar periodically, we don't just do a sleep for the total number
     # of seconds.  Instead, we sleep in small increments and keep watch on the
     # current time and the time we need to finish the sleep.
     # we normally use this function (rather than the no-progress-bar version) for longer
-    # sleeps such as waiting for the camera to cool.  So the fact that the sleep may exceed
-    # the requested amount by "update_interval" (2 seconds) is not a concern
+    # sleeps such as waiting for the camera to cool.  The last increment is shortened so the
+    # sleep ends on time.
+    # The end of the sleep is published as the status's ETA unless publish_eta is False (e.g. while
+    # acquiring, when the ETA is the end of the whole session).
+    # Given the server, the cooler power is read (every so often) during the sleep.
     @tracelog
-    def sleep_with_progress_bar(self, wait_seconds: float) -> bool:
+    def sleep_with_progress_bar(self, wait_seconds: float, publish_eta: bool = True,
+                                server: TheSkyX = None) -> bool:
         """Sleep given number of seconds, updating parent window progress bar periodically"""
         # print(f"sleep_with_progress_bar({wait_seconds})")
-        self.startProgressBar.emit(int(round(wait_seconds)))
-        # What time is the sleep finished?
-        time_finished = datetime.now() + timedelta(seconds=wait_seconds)
-        accumulated_seconds = 0
-        while (datetime.now() <= time_finished) and self._controller.thread_running():
-            # QThread.sleep(SessionThreadWorker.PROGRESS_UPDATE_INTERVAL)
-            sleep(SessionThreadWorker.PROGRESS_UPDATE_INTERVAL)
-            accumulated_seconds += SessionThreadWorker.PROGRESS_UPDATE_INTERVAL
-            self.updateProgressBar.emit(accumulated_seconds)
+        if publish_eta:
+            self._controller.publish_status(progress_value=0, progress_maximum=int(round(wait_seconds)),
+                                            eta=self._clock.now() + timedelta(seconds=wait_seconds))
+        else:
+            self._controller.publish_status(progress_value=0, progress_maximum=int(round(wait_seconds)))
+        # What time is the sleep finished?  (Measured on the monotonic clock, so unaffected by clock changes)
+        started = self._clock.monotonic()
+        time_finished = started + wait_seconds
+        while (self._clock.monotonic() < time_finished) and self._controller.thread_running():
+            self._clock.sleep(min(SessionThreadWorker.PROGRESS_UPDATE_INTERVAL,
+                                  time_finished - self._clock.monotonic()))
+            self._controller.publish_status(progress_value=int(self._clock.monotonic() - started))
+            if server is not None:
+                self.publish_cooler_power(server)
         return self._controller.thread_running()
 
+    # Read the cooler power for the session status, if the cooler is on and it hasn't been read recently.
+    # (It is only for display, so a failed read is ignored.)
+    @tracelog
+    def publish_cooler_power(self, server: TheSkyX):
+        """Publish the camera's cooler power, at most every COOLER_POWER_READ_INTERVAL seconds"""
+        if not self._cooler_on:
+            return
+        now = self._clock.monotonic()
+        if self._cooler_power_read_at is not None \
+                and now - self._cooler_power_read_at < SessionThreadWorker.COOLER_POWER_READ_INTERVAL:
+            return
+        self._cooler_power_read_at = now
+        (success, cooler_power, _) = server.get_cooler_power()
+        if success:
+            try:
+                self._controller.publish_status(cooler_power=float(cooler_power))
+            except ValueError:
+                pass
+
+    def cooler_turned_off(self):
+        """Note that the cooler is off, so its power isn't read or displayed"""
+        self._cooler_on = False
+        self._controller.publish_status(cooler_power=None)
+        self.coolerStopped.emit()
+
     # Do some console activity as a simulation of a session
     @tracelog
     def session_simulator(self, minutes: float):
@@ -202,8 +301,7 @@ class SessionThreadWorker(QObject):
         self.console(f"session twiddling for {stub_total_sleep_length} seconds", 1)
         accumulated_time = 0
         while accumulated_time < stub_total_sleep_length and self._controller.thread_running():
-            # QThread.sleep(stub_message_interval)
-            sleep(stub_message_interval)
+            self._clock.sleep(stub_message_interval)
             accumulated_time += stub_message_interval
             self.console(f"... {accumulated_time}", 2)
         if self._controller.thread_running():
@@ -222,25 +320,63 @@ class SessionThreadWorker(QObject):
         """Pass a message back to the parent UI for displaying in the console frame"""
         self.consoleLine.emit(message, level)
 
-    # If requested, send wake-on-lan broadcast packet and then wait a given time interval
+    # If requested, send wake-on-lan broadcast packet and then wait until the server is ready, for at most
+    # the given time interval
     # return an all-is-well indicator
 
     @tracelog
     def optional_wake_on_lan(self, wake_requested: bool, wake_wait_time: float,
-                             broadcast_address: str, mac_address: str):
-        """Send WakeOnLan packet to server if requested, and do requested post-send delay"""
+                             broadcast_address: str, mac_address: str, server: TheSkyX):
+        """Send WakeOnLan packet to server if requested, and wait for the server to be ready"""
         # print(f"optional_wake_on_lan({wake_requested},{wake_wait_time},{broadcast_address},{mac_address})")
         success = True
         if wake_requested:
             self.console("Sending Wake-On-Lan", 1)
+            self._controller.publish_status(phase=SessionThreadWorker.PHASE_WAKE_ON_LAN)
             (success, message) = RmNetUtils.send_wake_on_lan(broadcast_address, mac_address)
             if not success:
                 self.console("Wake on LAN error: " + message, 2)
             else:
-                self.console("Wake sent.  Waiting " + self.casual_interval_format(wake_wait_time), 2)
-                success = self.sleep_with_progress_bar(wake_wait_time)
+                self.console("Wake sent.  Waiting up to " + self.casual_interval_format(wake_wait_time)
+                             + " for TheSkyX", 2)
+                success = self.wait_for_server_ready(server, wake_wait_time, broadcast_address, mac_address)
         return success
 
+    # Wait for a server we have woken to be ready: probe the TheSkyX port and, once it accepts connections,
+    # send a harmless command, at growing intervals, until TheSkyX answers.  The wake-on-lan packet is sent
+    # again every so often in case it was lost.  The wait is progress-barred out to max_wait_seconds; if
+    # TheSkyX hasn't answered by then the session carries on anyway, as it would after a fixed wait.
+    # Return False only if the session is cancelled.
+    @tracelog
+    def wait_for_server_ready(self, server: TheSkyX, max_wait_seconds: float,
+                              broadcast_address: str, mac_address: str) -> bool:
+        """Wait until TheSkyX answers, for at most the wake-on-lan lead time"""
+        started = self._clock.monotonic()
+        time_finished = started + max_wait_seconds
+        wake_sent_at = started
+        probe_interval = SessionThreadWorker.READY_PROBE_FIRST_INTERVAL
+        self._controller.publish_status(progress_value=0, progress_maximum=int(round(max_wait_seconds)),
+                                        eta=self._clock.now() + timedelta(seconds=max_wait_seconds))
+        while self._controller.thread_running():
+            (port_open, message) = RmNetUtils.test_connection(self._network_address, str(self._network_port),
+                                                              SessionThreadWorker.READY_PROBE_CONNECT_TIMEOUT)
+            if port_open:
+                (answered, _, message) = server.get_camera_autosave_path()
+                if answered:
+                    self.console(f"TheSkyX answered after {round(self._clock.monotonic() - started)} seconds", 2)
+                    return True
+            now = self._clock.monotonic()
+            if now >= time_finished:
+                self.console(f"TheSkyX not answering ({message}), carrying on", 2)
+                return True
+            if now - wake_sent_at >= SessionThreadWorker.WAKE_ON_LAN_RESEND_INTERVAL:
+                RmNetUtils.send_wake_on_lan(broadcast_address, mac_address)
+                wake_sent_at = now
+            self.sleep_no_progress_bar(min(probe_interval, time_finished - now))
+            self._controller.publish_status(progress_value=int(self._clock.monotonic() - started))
+            probe_interval = min(probe_interval * 2, SessionThreadWorker.READY_PROBE_MAXIMUM_INTERVAL)
+        return False
+
     # Connect to TheSkyX as a connection test and, while we're at it, get and return the camera autosave path
     @staticmethod
     @tracelog
@@ -270,6 +406,7 @@ class SessionThreadWorker(QObject):
             self.console(f"Start cooling camera to target {cooling_info.target_temperature}", 1)
             (success, message) = server.set_camera_cooling(True, cooling_info.target_temperature)
             if success:
+                self._cooler_on = True
                 self.coolerStarted.emit()
             else:
                 self.console("Error starting camera cooling", 2)
@@ -285,6 +422,7 @@ class SessionThreadWorker(QObject):
         """Measure download times of all needed binnings by timing zero-length bias frames"""
         # print("measure_download_times entered")
         self.console("Measuring download times", 1)
+        self._controller.publish_status(phase=SessionThreadWorker.PHASE_MEASURING)
         success = True
         for frame_set in self._frame_set_list:
             if self._controller.thread_cancelled():
@@ -306,12 +444,17 @@ class SessionThreadWorker(QObject):
         """Time an image capture and download"""
         # print(f"time_download({binning})")
         seconds = -1.0
-        time_before: datetime = datetime.now()
+        time_before: float = self._clock.monotonic()
         (success, message) = server.take_bias_frame(binning, auto_save_file=False, asynchronous=False)
+        attempt = 0
+        while not success and self.reconnected_for_retry(server, attempt):
+            # Time it again; the lost connection may have cost any amount of time
+            attempt += 1
+            time_before = self._clock.monotonic()
+            (success, message) = server.take_bias_frame(binning, auto_save_file=False, asynchronous=False)
         if success:
-            time_after: datetime = datetime.now()
-            time_to_download: timedelta = time_after - time_before
-            seconds = time_to_download.seconds
+            time_after: float = self._clock.monotonic()
+            seconds = int(time_after - time_before)
             self.console(f"Binned {binning} x {binning}: {seconds} seconds", 2)
         else:
             self.console(f"Error timing download: {message}", 2)
@@ -328,13 +471,14 @@ class SessionThreadWorker(QObject):
     @tracelog
     def wait_for_cooling(self, server: TheSkyX,
                          cooling_info: CameraCoolingInfo,
-                         time_started: datetime) -> bool:
+                         time_started: float) -> bool:
         """Wait for the camera to reach desired target temperature within a given tolerance"""
         # print(f"wait_for_cooling (started at {time_started})")
         self.console(f"Waiting for camera to cool to {cooling_info.target_temperature} degrees", 1)
         if cooling_info.is_regulated:
+            self._controller.publish_status(phase=SessionThreadWorker.PHASE_COOLING)
             success = False
-            already_waited: float = (datetime.now() - time_started).seconds
+            already_waited: float = self._clock.monotonic() - time_started
             # print(f"   Already waited {already_waited} seconds")
             time_to_wait = max(cooling_info.max_time_to_try - already_waited, 0)
             total_attempts = 1 + cooling_info.cooling_retry_count
@@ -389,7 +533,8 @@ class SessionThreadWorker(QObject):
         """Make one attempt to cool camera to target temperature"""
         # print(f"one_cooling_attempt({target_temperature},{cooling_check_interval},{target_tolerance},{time_to_wait})")
         # Start progress bar for the total of the max duration
-        self.startProgressBar.emit(int(round(time_to_wait)))
+        self._controller.publish_status(progress_value=0, progress_maximum=int(round(time_to_wait)),
+                                        eta=self._clock.now() + timedelta(seconds=time_to_wait))
 
         # Loop until maximum duration reached or success achieved
         success: bool = False
@@ -399,9 +544,11 @@ class SessionThreadWorker(QObject):
             # Camera is cooling, wait a bit before checking temperature.
             self.sleep_no_progress_bar(cooling_check_interval)
             time_waited += cooling_check_interval
-            self.updateProgressBar.emit(int(round(time_waited)))
             (read_temp_successfully, current_camera_temperature, message) = server.get_camera_temperature()
             if read_temp_successfully:
+                self._controller.publish_status(progress_value=int(round(time_waited)),
+                                                temperature=current_camera_temperature)
+                self.publish_cooler_power(server)
                 self.console(f"Camera temperature: {current_camera_temperature}", 2)
                 temperature_difference = abs(current_camera_temperature - target_temperature)
                 if temperature_difference <= target_tolerance:
@@ -417,7 +564,7 @@ class SessionThreadWorker(QObject):
                 break
         return success, error
 
-    # Sleep for the given amount of time.  No progress bar signals emitted.
+    # Sleep for the given amount of time.  No progress published.
     # Sleep in little increments, not one big hunk, and check if this thread
     # has been cancelled between increments.
     @tracelog
@@ -431,7 +578,7 @@ class SessionThreadWorker(QObject):
                 time_to_sleep = SessionThreadWorker.PROGRESS_UPDATE_INTERVAL
             else:
                 time_to_sleep = time_remaining
-            sleep(time_to_sleep)
+            self._clock.sleep(time_to_sleep)
             time_slept += time_to_sleep
 
     @tracelog
@@ -441,7 +588,7 @@ class SessionThreadWorker(QObject):
         if cooling_info.is_regulated:
             (success, message) = server.set_camera_cooling(False, 0)
             if success:
-                self.coolerStopped.emit()
+                self.cooler_turned_off()
             else:
                 self.console("Error stopping camera cooling", 2)
                 self.console(f"Message: {message}", 2)
@@ -470,9 +617,12 @@ class SessionThreadWorker(QObject):
         """Acquire all the required frames until session- or time-based end"""
         # print(f"acquire_frames entered")
         success = False
+        self._controller.publish_status(phase=SessionThreadWorker.PHASE_ACQUIRING)
+        self._acquiring_started_at = self._clock.monotonic()
+        self._controller.update_timing(setup_seconds=self._acquiring_started_at - self._session_started_at)
         # Use a for-loop because we need the row number
         for row_index in range(len(frame_set_list)):
-            self.startRowIndex.emit(row_index)
+            self._controller.publish_status(row_index=row_index)
             frame_set = frame_set_list[row_index]
             # print(f"  Acquiring #{row_index}: {frame_set}")
             if self._controller.thread_cancelled():
@@ -488,6 +638,7 @@ class SessionThreadWorker(QObject):
                 break
             (success, continue_acquisition) = self.acquire_frame_set(server, frame_set, row_index, cooling_info,
                                                                      time_info)
+            self._controller.update_timing(acquiring_seconds=self._clock.monotonic() - self._acquiring_started_at)
             if success:
                 # print("Frame Set acquired successfully")
                 if not continue_acquisition:
@@ -520,7 +671,7 @@ class SessionThreadWorker(QObject):
             # print("  We're doing \"end when done\", so time can never be exceeded.")
             time_exceeded = False
         else:
-            now = datetime.now()
+            now = self._clock.now()
             # print(f"   Now: {now}, end time: {time_info.get_end_date_time()}")
             time_exceeded = now > time_info.get_end_date_time()
 
@@ -537,7 +688,12 @@ class SessionThreadWorker(QObject):
         # print("temperature_has_risen_too_much")
         if cooling_info.is_regulated and cooling_info.abort_on_temperature_rise:
             (success, temperature, error) = server.get_camera_temperature()
+            attempt = 0
+            while not success and self.reconnected_for_retry(server, attempt):
+                attempt += 1
+                (success, temperature, error) = server.get_camera_temperature()
             if success:
+                self._controller.publish_status(temperature=temperature)
                 if (temperature - cooling_info.target_temperature) > cooling_info.abort_temperature_threshold:
                     self.console(
                         f"Camera temp {temperature} exceeds target {cooling_info.target_temperature}"
@@ -562,7 +718,7 @@ class SessionThreadWorker(QObject):
     #       Time to take the next frame would exceed the end time of the session
     #       Session cancelled
     #       CCD temperature has risen too much
-    #       Error
+    #       Error, unless the retry policy says to take the frame again or skip the rest of the set
     @tracelog
     def acquire_frame_set(self, server: TheSkyX,
                           frame_set: FrameSet,
@@ -588,13 +744,23 @@ class SessionThreadWorker(QObject):
         last_part = f", binned {binning} x {binning}"
         self.console(first_part + exposure_part + last_part, 1)
         # Set up camera for these identical frames
+        configure_started = self._clock.monotonic()
         (success, message) = server.set_camera_image(frame_set.camera_image_type_code(),
                                                      binning, exposure_seconds)
+        attempt = 0
+        while not success and self.reconnected_for_retry(server, attempt):
+            attempt += 1
+            (success, message) = server.set_camera_image(frame_set.camera_image_type_code(),
+                                                         binning, exposure_seconds)
+        configure_seconds = self._clock.monotonic() - configure_started
         if success:
             # Loop thru required number of frames
             success = True
             frame_count = 0
-            while (number_needed > 0) and success and continue_acquisition and self._controller.thread_running():
+            retries_this_frame = 0
+            skip_rest_of_set = False
+            while (number_needed > 0) and success and continue_acquisition and not skip_rest_of_set \
+                    and self._controller.thread_running():
                 number_needed -= 1
                 # See if this frame would push beyond the desired end time
                 if self.frame_would_exceed_end_time(frame_set, time_info):
@@ -603,13 +769,41 @@ class SessionThreadWorker(QObject):
                     continue_acquisition = False
                 else:
                     # See if the temperature is OK
+                    check_started = self._clock.monotonic()
                     if self.temperature_has_risen_too_much(server, cooling_info):
                         success = False
                     else:
-                        # Acquire one image
+                        # Acquire one image.  The time to configure the camera is charged to the first frame.
                         frame_count += 1
+                        timing = FrameTiming(row_index, str(frame_set), frame_count, self._clock.now(),
+                                             float(exposure_seconds))
+                        timing.temperature_check_seconds = self._clock.monotonic() - check_started
+                        if frame_count == 1 and retries_this_frame == 0:
+                            timing.configure_seconds = configure_seconds
+                        self._controller.publish_status(eta=self.estimated_session_end(row_index))
                         self.console(f"Acquiring frame {frame_count} of {remember_number_needed}", 2)
-                        success = self.acquire_one_frame(server, frame_set, row_index)
+                        (success, failure_kind) = self.acquire_one_frame(server, frame_set, row_index, timing)
+                        self._controller.update_timing(
+                            acquiring_seconds=self._clock.monotonic() - self._acquiring_started_at)
+                        if success:
+                            retries_this_frame = 0
+                        elif self._controller.thread_running():
+                            action = self._retry_policy.action_for(failure_kind, retries_this_frame)
+                            if action == FrameRetryPolicy.RETRY:
+                                retries_this_frame += 1
+                                self._frame_retries += 1
+                                self._controller.update_timing(frame_retries=self._frame_retries)
+                                self.console(f"Taking the frame again (retry {retries_this_frame} of "
+                                             + f"{self._retry_policy.retries_for(failure_kind)})", 2)
+                                number_needed += 1
+                                frame_count -= 1
+                                success = True
+                            elif action == FrameRetryPolicy.SKIP:
+                                self._frame_sets_skipped += 1
+                                self._controller.update_timing(frame_sets_skipped=self._frame_sets_skipped)
+                                self.console("Skipping the rest of this frame set", 2)
+                                skip_rest_of_set = True
+                                success = True
             if self._controller.thread_cancelled():
                 success = False
         else:
@@ -632,7 +826,7 @@ class SessionThreadWorker(QObject):
             would_exceed = False
         else:
             total_exposure_time = self.calc_total_exposure_time(frame_set)
-            now = datetime.now()
+            now = self._clock.now()
             end_time = now + timedelta(seconds=total_exposure_time)
             if end_time > time_info.get_end_date_time():
                 # print("  This exposure would run past the end time")
@@ -652,59 +846,125 @@ class SessionThreadWorker(QObject):
         # print(f"calc_total_exposure_time returning {total_time}")
         return total_time
 
+    # Estimate when the session will end: when the remaining frames, starting with the given row, have been
+    # acquired, or the session end time if that is sooner.
+    @tracelog
+    def estimated_session_end(self, row_index: int) -> datetime:
+        """Estimate the time the session will finish"""
+        remaining_seconds = 0.0
+        for frame_set in self._frame_set_list[row_index:]:
+            frames_needed = max(frame_set.get_number_of_frames() - frame_set.get_number_complete(), 0)
+            remaining_seconds += frames_needed * self.calc_total_exposure_time(frame_set)
+        finish_time = self._clock.now() + timedelta(seconds=remaining_seconds)
+        if not self._time_info.get_end_when_done():
+            finish_time = min(finish_time, self._time_info.get_end_date_time())
+        return finish_time
+
+    # The frame's timing is filled in and, if it is acquired, added to the session's timing report.
+    # Return success and, if the frame failed, the kind of failure (a FrameRetryPolicy kind, or "" for
+    # failures the policy doesn't cover, such as a lost connection)
     @tracelog
-    def acquire_one_frame(self, server: TheSkyX, frame_set: FrameSet, row_index: int) -> bool:
+    def acquire_one_frame(self, server: TheSkyX, frame_set: FrameSet, row_index: int,
+                          timing: FrameTiming) -> (bool, str):
         """Begin asynchronous acquisition of one frame with given specifications"""
         # print("acquire_one_frame")
         # We want to acquire asynchronously so we can be alert for session cancel
         # Calculate how long image is likely to take
         total_time = self.calc_total_exposure_time(frame_set)
+        timing.predicted_seconds = float(total_time)
         # Start acquisition asynchronously.  Exposure settings are already set
+        start_command_sent = self._clock.monotonic()
         (started_ok, message) = server.start_image_asynchronously()
+        exposure_started = self._clock.monotonic()
+        timing.start_command_seconds = exposure_started - start_command_sent
+        attempt = 0
+        while not started_ok and server.get_connection_lost() and attempt < SessionThreadWorker.RECONNECT_ATTEMPTS:
+            # The start may have reached the camera with only the reply lost.  Once TheSkyX answers
+            # again, carry on with that exposure if it is under way, or start the frame again.
+            attempt += 1
+            (reconnected, in_progress) = self.reconnect_to_server(server, frame_set)
+            if not reconnected:
+                break
+            if in_progress:
+                started_ok = True
+                exposure_started = start_command_sent
+            else:
+                start_command_sent = self._clock.monotonic()
+                (started_ok, message) = server.start_image_asynchronously()
+                exposure_started = self._clock.monotonic()
         if started_ok:
             # Wait until image is probably finished, in small increments checking for cancellation
             # print(f"Exposure {frame_set.get_exposure_seconds()}, total wait time={total_time}")
-            self.sleep_with_progress_bar(total_time)
+            time_left = max(total_time - (self._clock.monotonic() - exposure_started), 0)
+            self.sleep_with_progress_bar(time_left, publish_eta=False, server=server)
             if self._controller.thread_running():
                 # Exposure probably done, or close to it. Now re-sync with camera
-                (resync_ok, message) = self.wait_for_camera_completion(server)
+                (resync_ok, message) = self.wait_for_camera_completion(server, timing, frame_set)
+                timing.actual_seconds = self._clock.monotonic() - exposure_started
                 if resync_ok:
-                    # We have successfully completed an image.  Tell the main thread
+                    # We have successfully completed an image.  Record its timing (before the signal, so
+                    # the handler can add its save time to it) and tell the main thread
                     # print(f"Emiting frameAcquired: {frame_set}")
+                    self._controller.add_frame_timing(timing)
                     self.frameAcquired.emit(frame_set, row_index)
                     success = True
+                    failure_kind = ""
                 else:
                     self.console(f"Error from camera: {message}", 2)
                     success = False
+                    if server.get_connection_lost():
+                        failure_kind = ""
+                    elif message == SessionThreadWorker.CAMERA_RESYNC_TIMEOUT_MESSAGE:
+                        # The camera may still be busy; stop it before the frame is taken again
+                        failure_kind = FrameRetryPolicy.COMPLETION_TIMEOUT
+                        server.abort_image()
+                    else:
+                        failure_kind = FrameRetryPolicy.CAMERA_ERROR
             else:
                 # thread was cancelled while waiting for the exposure to complete.
                 # we'll stop execution, but no message needed
                 success = False
+                failure_kind = ""
         else:
             self.console(f"Unable to start image: {message}", 2)
             success = False
-        return success
+            failure_kind = "" if server.get_connection_lost() else FrameRetryPolicy.START_FAILED
+        return success, failure_kind
 
     # We have an image acquisition underway (started asynchronously) and almost complete
     # Now we wait for the camera to finish and check that imaging was successful
     #                 (resync_ok, message) = self.wait_for_camera_completion(server)
     # We ask the server if the exposure is complete.  If not, wait a brief time and ask again.
     # repeat for a maximum timeout period, then give up
+    # The polling is recorded in the frame's timing, if given: how long it took, how many polls, and the
+    # slack - time from the last poll that found the camera busy (or from now) to the poll that found it done.
+    # If TheSkyX stops answering, the wait carries on once it has been reconnected (see poll_exposure_complete).
     @tracelog
-    def wait_for_camera_completion(self, server) -> (bool, str):
+    def wait_for_camera_completion(self, server, timing: FrameTiming = None,
+                                   frame_set: FrameSet = None) -> (bool, str):
         """Re-sync with image acquisition already begun, waiting for completion"""
         # print("wait_for_camera_completion")
         success = False
         total_time_waiting = 0.0
-        (complete_check_successful, is_complete, message) = server.get_exposure_is_complete()
+        resync_started = self._clock.monotonic()
+        last_seen_busy = resync_started
+        polls = 1
+        (complete_check_successful, is_complete, message) = self.poll_exposure_complete(server, frame_set)
         while self._controller.thread_running() \
                 and complete_check_successful \
                 and not is_complete \
                 and total_time_waiting < SessionThreadWorker.CAMERA_RESYNC_TIMEOUT:
-            sleep(SessionThreadWorker.CAMERA_RESYNC_CHECK_INTERVAL)
+            last_seen_busy = self._clock.monotonic()  # The poll just made found the camera busy
+            self._clock.sleep(SessionThreadWorker.CAMERA_RESYNC_CHECK_INTERVAL)
             total_time_waiting += SessionThreadWorker.CAMERA_RESYNC_CHECK_INTERVAL
             # print(f"  Waited {total_time_waiting} toward timeout of {SessionThreadWorker.CAMERA_RESYNC_TIMEOUT}")
-            (complete_check_successful, is_complete, message) = server.get_exposure_is_complete()
+            polls += 1
+            (complete_check_successful, is_complete, message) = self.poll_exposure_complete(server, frame_set)
+        if timing is not None:
+            resync_ended = self._clock.monotonic()
+            timing.resync_seconds = resync_ended - resync_started
+            timing.resync_polls = polls
+            timing.slack_seconds = resync_ended - last_seen_busy
 
         if not self._controller.thread_running():
             pass
@@ -715,12 +975,77 @@ class SessionThreadWorker(QObject):
         elif total_time_waiting >= SessionThreadWorker.CAMERA_RESYNC_TIMEOUT:
             # We timed out - the camera is not responding for some reason
             success = False
-            message = "Timed out waiting for camera to finish"
+            message = SessionThreadWorker.CAMERA_RESYNC_TIMEOUT_MESSAGE
         else:
             assert is_complete
             success = True
         return success, message
 
+    # Ask the camera whether the exposure is complete.  If TheSkyX can't be reached, reconnect and use the
+    # state found then: an exposure finished while we were cut off is as good as one seen finishing.
+    @tracelog
+    def poll_exposure_complete(self, server: TheSkyX, frame_set: FrameSet = None) -> (bool, bool, str):
+        """Check for exposure completion, riding out a lost connection"""
+        (complete_check_successful, is_complete, message) = server.get_exposure_is_complete()
+        if not complete_check_successful and server.get_connection_lost() and self._reconnect_seconds > 0:
+            (reconnected, in_progress) = self.reconnect_to_server(server, frame_set)
+            if reconnected:
+                return True, not in_progress, ""
+        return complete_check_successful, is_complete, message
+
+    # After a command has failed: whether to send it again, because the connection was lost and TheSkyX
+    # has been reconnected (for at most RECONNECT_ATTEMPTS attempts)
+    def reconnected_for_retry(self, server: TheSkyX, attempt: int) -> bool:
+        """Reconnect to TheSkyX if a command failed for want of a connection"""
+        return server.get_connection_lost() and attempt < SessionThreadWorker.RECONNECT_ATTEMPTS \
+            and self.reconnect_to_server(server)[0]
+
+    # TheSkyX has stopped answering partway through the session.  If the session is to ride out network
+    # trouble, keep trying it for up to the reconnect time and, once it answers, find out what the camera
+    # is doing: whether an exposure is under way, its binning and its temperature.  If the camera is idle
+    # with a different binning than the frame set's (e.g. TheSkyX was restarted), the frame set's settings
+    # are sent again.  Return whether TheSkyX was reached and whether an exposure is in progress.
+    @tracelog
+    def reconnect_to_server(self, server: TheSkyX, frame_set: FrameSet = None) -> (bool, bool):
+        """Wait for TheSkyX to answer again, and resynchronize with the camera"""
+        if self._reconnect_seconds <= 0 or self._controller.thread_cancelled():
+            return False, False
+        self.console("Lost connection to TheSkyX, reconnecting", 2)
+        started = self._clock.monotonic()
+        (answered, is_complete, message) = server.get_exposure_is_complete()
+        while not answered and server.get_connection_lost() and self._controller.thread_running() \
+                and self._clock.monotonic() - started < self._reconnect_seconds:
+            # A resilient client may be refusing to try until its circuit breaker closes
+            wait_seconds = SessionThreadWorker.RECONNECT_CHECK_INTERVAL
+            if isinstance(server, ResilientTheSkyX):
+                wait_seconds = max(wait_seconds, server.get_seconds_until_retry())
+            self.sleep_no_progress_bar(wait_seconds)
+            (answered, is_complete, message) = server.get_exposure_is_complete()
+        if not answered:
+            if self._controller.thread_running():
+                self.console(f"Unable to reconnect to TheSkyX: {message}", 2)
+            return False, False
+
+        in_progress = not is_complete
+        camera_state = "exposure in progress" if in_progress else "camera idle"
+        (binning_read, binning, _) = server.get_camera_binning()
+        if binning_read:
+            camera_state += f", binned {binning} x {binning}"
+            if frame_set is not None and not in_progress and binning != frame_set.get_binning():
+                exposure_seconds = 0 if isinstance(frame_set, BiasFrameSet) else frame_set.get_exposure_seconds()
+                (settings_sent, message) = server.set_camera_image(frame_set.camera_image_type_code(),
+                                                                   frame_set.get_binning(), exposure_seconds)
+                if not settings_sent:
+                    self.console(f"Error setting camera: {message}", 2)
+                    return False, False
+                camera_state += ", frame settings sent again"
+        (temperature_read, temperature, _) = server.get_camera_temperature()
+        if temperature_read:
+            self._controller.publish_status(temperature=temperature)
+            camera_state += f", temperature {temperature}"
+        self.console(f"Reconnected after {round(self._clock.monotonic() - started)} seconds: {camera_state}", 2)
+        return True, in_progress
+
     # We're done.  If the user has requested it we'll turn of the cooler and allow the
     # CCD to warm up for a given time before disconnecting.  Return success if nothing breaks.
 
@@ -731,6 +1056,9 @@ class SessionThreadWorker(QObject):
         if cooling_info.is_regulated and cooling_info.warm_up_when_done:
             (cooling_off_success, message) = server.set_camera_cooling(False, 0)
             if cooling_off_success:
+                self.cooler_turned_off()
+                self._controller.publish_status(phase=SessionThreadWorker.PHASE_WARMING,
+                                                row_index=SessionStatus.NO_ROW)
                 self.console(f"Allowing camera to warm up for {cooling_info.warm_up_when_done_time} seconds", 1)
                 if self.sleep_with_progress_bar(cooling_info.warm_up_when_done_time):
                     success = True
@@ -747,12 +1075,20 @@ class SessionThreadWorker(QObject):
 
         return success
 
+    # Put the session's dead-time totals in the console, if any frames were taken
+    def console_timing_summary(self):
+        """Report where the acquisition time went"""
+        timing_report = self._controller.get_timing_report()
+        if len(timing_report.frames) > 0:
+            for line in timing_report.summary_lines():
+                self.console(line, 2)
+
     # When done, if requested, disconnect camera
     @tracelog
     def disconnect_if_requested(self, server: TheSkyX, disconnect_requested: bool) -> bool:
         """If requested, disconnect camera at end of session"""
         print(f"disconnect_if_requested({disconnect_requested})")
-        success = False
+        success = True
         if disconnect_requested:
             (success, message) = server.disconnect_camera()
             if success:
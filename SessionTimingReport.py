@@ -0,0 +1,120 @@
+# The timing of a session's frames (see FrameTiming), totalled into dead time by cause: time during
+# acquisition that wasn't spent exposing, split into configuring the camera, temperature checks, start
+# commands, downloads, waiting for the camera to report completion, saving the plan, and anything else
+# (console output, status updates, time between frame sets).
+# Also counted are frames taken again after failing, and frame sets skipped, under the retry policy.
+# Written at the end of a session as JSON (the totals and every frame) and CSV (one line per frame).
+import copy
+import csv
+import json
+import os
+from datetime import datetime
+
+from FrameTiming import FrameTiming
+from tracelog import *
+
+
+class SessionTimingReport:
+    REPORT_FORMAT_VERSION = 1
+    FILE_NAME_SUFFIX = "-timing-%Y-%m-%d-%H%M%S"  # Added to the plan's name, with .json and .csv
+
+    def __init__(self):
+        self.session_started: datetime = None
+        self.setup_seconds: float = 0.0  # From the session starting (after any wait) to acquiring frames
+        self.acquiring_seconds: float = 0.0  # From the first frame set to the last frame
+        self.frames: [FrameTiming] = []
+        self.frame_retries: int = 0  # Frames taken again after failing (see FrameRetryPolicy)
+        self.frame_sets_skipped: int = 0  # Frame sets whose remaining frames were skipped after failures
+
+    def copy(self):
+        """Return an independent copy of this report"""
+        return copy.deepcopy(self)
+
+    # Attribute save time to the latest frame of the given frame set
+    def add_save_seconds(self, row_index: int, seconds: float):
+        """Record time spent saving the plan after a frame was acquired"""
+        for frame in reversed(self.frames):
+            if frame.row_index == row_index:
+                frame.save_seconds += seconds
+                return
+
+    def total_exposure_seconds(self) -> float:
+        return sum(frame.exposure_seconds for frame in self.frames)
+
+    def dead_seconds(self) -> float:
+        """Time spent acquiring other than exposing"""
+        return max(self.acquiring_seconds - self.total_exposure_seconds(), 0.0)
+
+    # Dead time by cause, in seconds.  "other" is what the causes don't account for; saving in the GUI
+    # overlaps the next frame, so the causes can add up to more than the dead time, and "other" is then 0.
+    def dead_time_by_cause(self) -> {str: float}:
+        """Total the frames' dead time by cause"""
+        totals: {str: float} = {}
+        for frame in self.frames:
+            for (cause, seconds) in frame.dead_time_by_cause().items():
+                totals[cause] = totals.get(cause, 0.0) + seconds
+        totals["other"] = max(self.dead_seconds() - sum(totals.values()), 0.0)
+        return {cause: round(seconds, 3) for (cause, seconds) in totals.items()}
+
+    def summary(self) -> {str: object}:
+        """Return the session totals"""
+        return {"frames": len(self.frames),
+                "setup_seconds": round(self.setup_seconds, 3),
+                "acquiring_seconds": round(self.acquiring_seconds, 3),
+                "exposure_seconds": round(self.total_exposure_seconds(), 3),
+                "dead_seconds": round(self.dead_seconds(), 3),
+                "dead_time_percent": round(100 * self.dead_seconds() / self.acquiring_seconds, 2)
+                if self.acquiring_seconds > 0 else 0.0,
+                "predicted_seconds": round(sum(frame.predicted_seconds for frame in self.frames), 3),
+                "actual_seconds": round(sum(frame.actual_seconds for frame in self.frames), 3),
+                "slack_seconds": round(sum(frame.slack_seconds for frame in self.frames), 3),
+                "dead_time_by_cause": self.dead_time_by_cause(),
+                "frame_retries": self.frame_retries,
+                "frame_sets_skipped": self.frame_sets_skipped}
+
+    # Lines for the console, e.g. "Dead time 312.0 seconds (8.1%): download 240.0, ..."
+    def summary_lines(self) -> [str]:
+        """Describe the totals in a few lines"""
+        summary = self.summary()
+        causes = ", ".join(f"{cause.replace('_', ' ')} {seconds:.1f}"
+                           for (cause, seconds) in summary["dead_time_by_cause"].items() if seconds > 0)
+        lines = [f"{summary['frames']} frames in {summary['acquiring_seconds']:.1f} seconds, "
+                 f"{summary['exposure_seconds']:.1f} exposing",
+                 f"Dead time {summary['dead_seconds']:.1f} seconds ({summary['dead_time_percent']}%)"
+                 + (f": {causes}" if causes != "" else ""),
+                 f"Predicted {summary['predicted_seconds']:.1f} seconds for exposures and downloads, "
+                 f"took {summary['actual_seconds']:.1f}"]
+        if self.frame_retries > 0 or self.frame_sets_skipped > 0:
+            lines.append(f"{self.frame_retries} frames taken again after failing, "
+                         f"{self.frame_sets_skipped} frame sets skipped")
+        return lines
+
+    # The report files for a plan saved at the given path: the plan's name plus the session's start time
+    def file_paths(self, plan_path: str) -> (str, str):
+        """Return the paths of the JSON and CSV reports to write beside the plan file"""
+        (base, _) = os.path.splitext(plan_path)
+        started = self.session_started if self.session_started is not None else datetime.now()
+        base += started.strftime(SessionTimingReport.FILE_NAME_SUFFIX)
+        return base + ".json", base + ".csv"
+
+    # Write the report beside the plan file.  Return success and the paths written, or an error message
+    @tracelog
+    def save_beside(self, plan_path: str) -> (bool, str):
+        """Write the report as JSON and CSV next to the plan file"""
+        (json_path, csv_path) = self.file_paths(plan_path)
+        report = {"report_format": SessionTimingReport.REPORT_FORMAT_VERSION,
+                  "session_started": self.session_started.isoformat(timespec="seconds")
+                  if self.session_started is not None else None,
+                  "summary": self.summary(),
+                  "frames": [frame.as_row() for frame in self.frames]}
+        try:
+            with open(json_path, "w") as json_file:
+                json.dump(report, json_file, indent=2)
+            with open(csv_path, "w", newline="") as csv_file:
+                writer = csv.DictWriter(csv_file, fieldnames=FrameTiming.FIELD_NAMES)
+                writer.writeheader()
+                for frame in self.frames:
+                    writer.writerow(frame.as_row())
+        except OSError as error:
+            return False, str(error)
+        return True, f"{json_path}, {csv_path}"
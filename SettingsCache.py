@@ -0,0 +1,129 @@
+# Application preferences, held in memory.
+# Constructing a QSettings and reading a value from it is slow enough to matter in code that runs often
+# (table cell drawing, console lines, every tracelog call).  One shared SettingsCache loads the preferences
+# once, and those paths read plain attributes instead.  Changes are written through to QSettings right away,
+# and the settingChanged signal tells anyone interested (e.g. table models showing fonts) what changed.
+#
+# The cache is created when first used, so the application's organization and name (which determine where
+# QSettings are stored) must be set before then.  It is used from the session's worker thread as well as the
+# GUI thread (e.g. by tracelog), so it is created, and its QSettings used, under a lock.
+import threading
+
+from PyQt5.QtCore import QObject, QSettings, pyqtSignal
+
+
+class SettingsCache(QObject):
+    # Keys of the settings held as typed attributes
+    STANDARD_FONT_SIZE_SETTING = "standard_font_size"
+    TRACE_LOG_SETTING = "trace_log_setting"
+    CONSOLE_CAPACITY_SETTING = "console_line_capacity"
+    METRICS_PORT_SETTING = "metrics_port"
+    RECONNECT_SECONDS_SETTING = "reconnect_seconds"
+    FRAME_RETRY_POLICY_SETTING = "frame_retry_policy"
+    DEFAULT_STANDARD_FONT_SIZE = 12
+    DEFAULT_CONSOLE_CAPACITY = 5000  # Lines kept in the session console (all are written to the log file)
+    DEFAULT_METRICS_PORT = 0  # No metrics endpoint
+    DEFAULT_RECONNECT_SECONDS = 300
+
+    settingChanged = pyqtSignal(str)  # The key of the setting that changed
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    # The single, application-wide, cache
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = SettingsCache()
+        return cls._instance
+
+    def __init__(self):
+        QObject.__init__(self)
+        self._settings_lock = threading.Lock()  # QSettings objects aren't to be shared between threads unguarded
+        self._settings = QSettings()
+        # QSettings returns strings for numbers and booleans on some platforms, so read these with types
+        self._standard_font_size: int = self._settings.value(SettingsCache.STANDARD_FONT_SIZE_SETTING,
+                                                             SettingsCache.DEFAULT_STANDARD_FONT_SIZE,
+                                                             type=int)
+        self._trace_log: bool = self._settings.value(SettingsCache.TRACE_LOG_SETTING, False, type=bool)
+        self._console_capacity: int = self._settings.value(SettingsCache.CONSOLE_CAPACITY_SETTING,
+                                                           SettingsCache.DEFAULT_CONSOLE_CAPACITY, type=int)
+        self._metrics_port: int = self._settings.value(SettingsCache.METRICS_PORT_SETTING,
+                                                       SettingsCache.DEFAULT_METRICS_PORT, type=int)
+        self._reconnect_seconds: int = self._settings.value(SettingsCache.RECONNECT_SECONDS_SETTING,
+                                                            SettingsCache.DEFAULT_RECONNECT_SECONDS, type=int)
+        self._frame_retry_policy: str = self._settings.value(SettingsCache.FRAME_RETRY_POLICY_SETTING, "", type=str)
+        self._other_values: {str: object} = {}  # Other settings, cached as they are used
+
+    # Standard font size for the windows and tables
+    def get_standard_font_size(self) -> int:
+        return self._standard_font_size
+
+    def set_standard_font_size(self, value: int):
+        self._standard_font_size = value
+        self.write_through(SettingsCache.STANDARD_FONT_SIZE_SETTING, value)
+
+    # Whether tracelog prints calls and returns
+    def get_trace_log(self) -> bool:
+        return self._trace_log
+
+    def set_trace_log(self, value: bool):
+        self._trace_log = value
+        self.write_through(SettingsCache.TRACE_LOG_SETTING, value)
+
+    # Maximum number of lines shown in the session console
+    def get_console_capacity(self) -> int:
+        return self._console_capacity
+
+    def set_console_capacity(self, value: int):
+        self._console_capacity = value
+        self.write_through(SettingsCache.CONSOLE_CAPACITY_SETTING, value)
+
+    # Local port on which a running session serves metrics (see SessionMetricsServer); 0 for none
+    def get_metrics_port(self) -> int:
+        return self._metrics_port
+
+    def set_metrics_port(self, value: int):
+        self._metrics_port = value
+        self.write_through(SettingsCache.METRICS_PORT_SETTING, value)
+
+    # How long a session keeps trying to reach TheSkyX when the connection is lost partway through;
+    # 0 to end the session instead
+    def get_reconnect_seconds(self) -> int:
+        return self._reconnect_seconds
+
+    def set_reconnect_seconds(self, value: int):
+        self._reconnect_seconds = value
+        self.write_through(SettingsCache.RECONNECT_SECONDS_SETTING, value)
+
+    # What a session does when a frame fails, as FrameRetryPolicy rules (e.g. "start=retry:2:skip");
+    # "" if not set, for the policy's defaults
+    def get_frame_retry_policy(self) -> str:
+        return self._frame_retry_policy
+
+    def set_frame_retry_policy(self, value: str):
+        self._frame_retry_policy = value
+        self.write_through(SettingsCache.FRAME_RETRY_POLICY_SETTING, value)
+
+    # Any other setting, e.g. remembered window sizes or the last file opened.  None if not set.
+    def value(self, key: str):
+        with self._settings_lock:
+            if key not in self._other_values:
+                self._other_values[key] = self._settings.value(key)
+            return self._other_values[key]
+
+    def set_value(self, key: str, value):
+        with self._settings_lock:
+            self._other_values[key] = value
+        self.write_through(key, value)
+
+    def contains(self, key: str) -> bool:
+        return self.value(key) is not None
+
+    def write_through(self, key: str, value):
+        """Record a changed setting in the saved preferences and tell subscribers"""
+        with self._settings_lock:
+            self._settings.setValue(key, value)
+        self.settingChanged.emit(key)
@@ -0,0 +1,134 @@
+# A pretend camera, with the state TheSkyX reports for a real one: connection, cooler, temperature,
+# binning, exposure length, and whether an exposure is in progress.  Time comes from a SessionClock,
+# so with a VirtualClock a night of exposures and cooling passes in moments.
+# The chip temperature moves exponentially toward the cooler's set point (or toward the ambient
+# temperature when the cooler is off).
+import math
+import threading
+
+from SessionClock import SessionClock
+from tracelog import *
+
+
+class SimulatedCamera:
+    AMBIENT_TEMPERATURE = 15.0  # Degrees C
+    COOLING_TIME_CONSTANT = 120.0  # Seconds for the temperature to go 63% of the way to its target
+    MAXIMUM_COOLING = 40.0  # Degrees below ambient at 100% cooler power
+    DOWNLOAD_SECONDS = {1: 8.0, 2: 4.0, 3: 3.0, 4: 2.0}  # Default download time by binning
+    AUTOSAVE_PATH = "/simulated/images"
+    BIAS_FRAME_CODE = 2
+
+    def __init__(self, clock: SessionClock, download_seconds: {int: float} = None):
+        self._clock: SessionClock = clock
+        self._download_seconds: {int: float} = download_seconds if download_seconds is not None \
+            else SimulatedCamera.DOWNLOAD_SECONDS
+        self._lock = threading.Lock()
+        self._connected: bool = False
+        self._cooler_on: bool = False
+        self._set_point: float = 0.0
+        self._temperature: float = SimulatedCamera.AMBIENT_TEMPERATURE
+        self._temperature_time: float = clock.monotonic()
+        self._frame_type_code: int = SimulatedCamera.BIAS_FRAME_CODE
+        self._binning: int = 1
+        self._exposure_seconds: float = 0.0
+        self._exposure_finishes: float = None  # Clock time the exposure in progress is done, None if none
+        self._frames_taken: int = 0
+
+    def get_clock(self) -> SessionClock:
+        return self._clock
+
+    def get_autosave_path(self) -> str:
+        return SimulatedCamera.AUTOSAVE_PATH
+
+    def get_frames_taken(self) -> int:
+        return self._frames_taken
+
+    def set_connected(self, connected: bool):
+        with self._lock:
+            self._connected = connected
+            if not connected:
+                self._exposure_finishes = None
+
+    def is_connected(self) -> bool:
+        return self._connected
+
+    def set_cooling(self, cooler_on: bool, set_point: float):
+        with self._lock:
+            self.update_temperature()
+            self._cooler_on = cooler_on
+            if cooler_on:
+                self._set_point = set_point
+
+    # Target the temperature is moving toward: the set point, unless the cooler can't get that low
+    def temperature_target(self) -> float:
+        if not self._cooler_on:
+            return SimulatedCamera.AMBIENT_TEMPERATURE
+        return max(self._set_point, SimulatedCamera.AMBIENT_TEMPERATURE - SimulatedCamera.MAXIMUM_COOLING)
+
+    def update_temperature(self):
+        """Move the temperature toward its target for the time passed since the last update"""
+        now = self._clock.monotonic()
+        target = self.temperature_target()
+        decay = math.exp(-(now - self._temperature_time) / SimulatedCamera.COOLING_TIME_CONSTANT)
+        self._temperature = target + (self._temperature - target) * decay
+        self._temperature_time = now
+
+    def get_temperature(self) -> float:
+        with self._lock:
+            self.update_temperature()
+            return round(self._temperature, 2)
+
+    # Percentage of full cooling needed to hold the present temperature below ambient
+    def get_cooler_power(self) -> float:
+        with self._lock:
+            if not self._cooler_on:
+                return 0.0
+            self.update_temperature()
+            difference = SimulatedCamera.AMBIENT_TEMPERATURE - self._temperature
+            return round(min(max(difference / SimulatedCamera.MAXIMUM_COOLING, 0.0), 1.0) * 100.0, 1)
+
+    def set_image(self, frame_type_code: int, binning: int, exposure_seconds: float):
+        with self._lock:
+            self._frame_type_code = frame_type_code
+            self._binning = binning
+            self._exposure_seconds = 0.0 if frame_type_code == SimulatedCamera.BIAS_FRAME_CODE \
+                else float(exposure_seconds)
+
+    def get_binning(self) -> int:
+        return self._binning
+
+    def set_binning(self, binning: int):
+        with self._lock:
+            self._binning = binning
+
+    # Seconds the present image settings take, exposure plus download
+    def image_seconds(self) -> float:
+        download = self._download_seconds.get(self._binning, max(self._download_seconds.values()))
+        return self._exposure_seconds + download
+
+    @tracelog
+    def start_exposure(self):
+        """Begin an exposure with the present settings, returning at once"""
+        with self._lock:
+            self._exposure_finishes = self._clock.monotonic() + self.image_seconds()
+
+    @tracelog
+    def take_exposure(self):
+        """Take an exposure with the present settings, returning when it is done"""
+        self.start_exposure()
+        self._clock.sleep(self.image_seconds())
+        self.exposure_is_complete()
+
+    def exposure_is_complete(self) -> bool:
+        with self._lock:
+            if self._exposure_finishes is None:
+                return True
+            if self._clock.monotonic() >= self._exposure_finishes:
+                self._exposure_finishes = None
+                self._frames_taken += 1
+                return True
+            return False
+
+    def abort_exposure(self):
+        with self._lock:
+            self._exposure_finishes = None
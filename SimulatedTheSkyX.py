@@ -0,0 +1,92 @@
+# Stand-in for TheSkyX that runs the commands on a SimulatedCamera in this process, instead of sending
+# them to a server.  With a VirtualClock, a session can be run through from start to finish in seconds
+# with no server, camera or network (see "--simulate" in pySkyDarks3Headless.py).
+from SimulatedCamera import SimulatedCamera
+from TheSkyX import TheSkyX
+from tracelog import *
+
+
+class SimulatedTheSkyX(TheSkyX):
+
+    def __init__(self, camera: SimulatedCamera):
+        TheSkyX.__init__(self, "simulated", 0)
+        self._camera: SimulatedCamera = camera
+
+    def get_camera(self) -> SimulatedCamera:
+        return self._camera
+
+    @tracelog
+    def get_camera_autosave_path(self) -> (bool, str):
+        """Get the autosave file path the camera will use to save image files"""
+        return True, self._camera.get_autosave_path(), ""
+
+    @tracelog
+    def connect_to_camera(self) -> (bool, str):
+        """Tell TheSkyX to connect to the camera"""
+        self._camera.set_connected(True)
+        return True, ""
+
+    @tracelog
+    def disconnect_camera(self) -> (bool, str):
+        """Tell TheSkyX to disconnect from the camera"""
+        self._camera.set_connected(False)
+        return True, ""
+
+    @tracelog
+    def take_bias_frame(self, binning: int,
+                        auto_save_file: bool,
+                        asynchronous: bool) -> (bool, str):
+        """Take a bias frame of given binning"""
+        self._camera.set_image(SimulatedCamera.BIAS_FRAME_CODE, binning, 0)
+        if asynchronous:
+            self._camera.start_exposure()
+        else:
+            self._camera.take_exposure()
+        return True, ""
+
+    @tracelog
+    def set_camera_cooling(self, cooling_on: bool, target_temperature: float) -> (bool, str):
+        """Set camera cooling on or off, with given target temperature"""
+        self._camera.set_cooling(cooling_on, target_temperature)
+        return True, ""
+
+    @tracelog
+    def get_camera_temperature(self) -> (bool, float, str):
+        """Determine the temperature of the camera"""
+        return True, self._camera.get_temperature(), ""
+
+    @tracelog
+    def get_camera_binning(self) -> (bool, int, str):
+        """Determine the binning the camera is set to"""
+        return True, self._camera.get_binning(), ""
+
+    @tracelog
+    def set_camera_image(self,
+                         frame_type_code: int,  # light,bias,dark,flat = 1,2,3,4
+                         binning: int,
+                         exposure_seconds: float) -> (bool, str):
+        """Set acquisition parameters for the camera"""
+        self._camera.set_image(frame_type_code, binning, exposure_seconds)
+        return True, ""
+
+    @tracelog
+    def start_image_asynchronously(self) -> (bool, str):
+        """Start asynchronous acquisition of one image"""
+        self._camera.start_exposure()
+        return True, ""
+
+    @tracelog
+    def get_exposure_is_complete(self) -> (bool, bool, str):
+        """Determine whether camera is still busy with asynchronous image acquisition or is done"""
+        return True, self._camera.exposure_is_complete(), ""
+
+    @tracelog
+    def abort_image(self) -> (bool, str):
+        """Abort image acquisition in progress"""
+        self._camera.abort_exposure()
+        return True, ""
+
+    @tracelog
+    def get_cooler_power(self) -> (bool, float, str):
+        """Ask TheSkyX for the current cooler power consumption in percent"""
+        return True, self._camera.get_cooler_power(), ""
@@ -0,0 +1,10 @@
+# TheSkyX transport over real TCP connections
+import socket
+
+from TheSkyXTransport import TheSkyXTransport
+
+
+class SocketTransport(TheSkyXTransport):
+
+    def open_connection(self, address: (str, int), timeout_seconds: float = None) -> socket.socket:
+        return socket.create_connection(address, timeout=timeout_seconds)
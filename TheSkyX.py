@@ -1,25 +1,76 @@
 # Class to send and receive commands (Javascript commands and text responses) to the
 # server running TheSkyX
+# Connections are opened by a transport (real TCP sockets unless another is given, e.g. an
+# ImpairedTransport to test over a poor network).  A reply may arrive in several pieces; it is read
+# until its "Error = <code>." ending.
+# Every exchange has deadlines, by the kind of command: time to connect, to send, and to receive the reply
+# (e.g. longer for a synchronous image, which replies only after the download).  A server that stops
+# responding costs at most those times, and the wait for a reply is given up as soon as the "cancelled"
+# check (e.g. the session controller's thread_cancelled) says so.
+# Commands take turns: TheSkyX runs one script at a time, so by default every instance shares one mutex.
+# An instance given its own mutex doesn't wait for the others (e.g. to measure the server under load).
+# Camera properties that rarely change while the camera is connected (e.g. the autosave path) are kept once
+# read, each for its own time (CACHED_PROPERTY_SECONDS), so reading them again costs no round trip.
+# Connecting or disconnecting the camera forgets them.
+# After a failed command, get_connection_lost tells whether the failure was in reaching TheSkyX (connection
+# refused, reset or timed out) rather than an error reported by TheSkyX or the camera.
+import re
 import socket
 import sys
+import time
 
 from tracelog import *
 
 from PyQt5.QtCore import QMutex
 
+from SocketTransport import SocketTransport
+from TheSkyXTrace import TheSkyXTrace
+from TheSkyXTransport import TheSkyXTransport
 from Validators import Validators
 
 
 class TheSkyX:
 
     MAX_RECEIVE_SIZE = 1024
+    END_OF_REPLY = re.compile(rb"Error = -?\d+\.\s*$")  # TheSkyX ends every reply with its error code
+    RECEIVE_SLICE_SECONDS = 0.5  # While waiting for a reply, check for cancellation this often
+    # Kinds of command, and their deadlines: (connect, send, receive) seconds
+    QUERY_COMMAND = "query"  # Read a property
+    SETTING_COMMAND = "setting"  # Set properties, or abort
+    START_IMAGE_COMMAND = "start image"  # Start an asynchronous exposure
+    CAMERA_CONNECTION_COMMAND = "camera connection"  # Connect or disconnect the camera
+    SYNCHRONOUS_IMAGE_COMMAND = "synchronous image"  # Take an image, replying when it's downloaded
+    COMMAND_DEADLINES = {QUERY_COMMAND: (10, 10, 20),
+                         SETTING_COMMAND: (10, 10, 30),
+                         START_IMAGE_COMMAND: (10, 10, 60),
+                         CAMERA_CONNECTION_COMMAND: (10, 10, 120),
+                         SYNCHRONOUS_IMAGE_COMMAND: (10, 10, 600)}
+    # ccdsoftCamera properties kept once read, and for how many seconds
+    CACHED_PROPERTY_SECONDS = {"AutoSavePath": 300}
 
     _server_mutex = QMutex()
+    _trace: TheSkyXTrace = None  # If set, every exchange with the server is recorded in it
 
-    def __init__(self, server_address: str, port_number: int):
+    # Record all traffic with TheSkyX (from every instance) in the given trace; None to stop recording
+    @staticmethod
+    def set_trace(trace: TheSkyXTrace):
+        TheSkyX._trace = trace
+
+    def __init__(self, server_address: str, port_number: int, transport: TheSkyXTransport = None,
+                 cancelled=None,  # Function returning True to give up waiting for replies
+                 mutex: QMutex = None):  # Taken for each command; None to take turns with all other instances
         # print(f"TheSkyX/init({server_address},{port_number})")
         self._server_address = server_address
         self._port_number = int(port_number)
+        self._transport: TheSkyXTransport = transport if transport is not None else SocketTransport()
+        self._cancelled = cancelled
+        self._mutex: QMutex = mutex if mutex is not None else TheSkyX._server_mutex
+        self._connection_lost: bool = False  # Did the last command fail for want of a connection?
+        self._property_cache: {str: (float, str)} = {}  # Property name -> (monotonic time it expires, value)
+
+    # Whether the last command failed because TheSkyX couldn't be reached or stopped answering
+    def get_connection_lost(self) -> bool:
+        return self._connection_lost
 
     # Get the autosave-path string from the camera.
     # Return a success flag and the path string, and an error message if needed
@@ -30,23 +81,57 @@ class TheSkyX:
         command_with_return = "var path=ccdsoftCamera.AutoSavePath;" \
                 + "var Out;" \
                 + "Out=path+\"\\n\";"
-        (success, path_result, message) = self.send_command_with_return(command_with_return)
+        (success, path_result, message) = self.send_cached_query("AutoSavePath", command_with_return)
         return success, path_result, message
 
+    # Read any ccdsoftCamera property (e.g. a static fact such as the camera model), kept for the given
+    # number of seconds (by default, its time in CACHED_PROPERTY_SECONDS, or not kept if it has none).
+    # Return a success flag, the property's value as text, and an error message if needed
+    @tracelog
+    def get_camera_property(self, property_name: str, keep_seconds: float = None) -> (bool, str, str):
+        """Read a camera property, from the cache if it was read recently"""
+        command_with_return = f"var value=ccdsoftCamera.{property_name};" \
+                + "var Out;" \
+                + "Out=value+\"\\n\";"
+        return self.send_cached_query(property_name, command_with_return, keep_seconds)
+
+    # Answer a query for a property from the cache if it was read recently enough, otherwise send it and
+    # keep a successful reply.  (Queries keep their own text, so traces recorded earlier still replay.)
+    # Return a 3-ple:  success flag,  response,  error message if any
+    def send_cached_query(self, property_name: str, command: str, keep_seconds: float = None):
+        """Send a property query, or answer it from the property cache"""
+        if keep_seconds is None:
+            keep_seconds = TheSkyX.CACHED_PROPERTY_SECONDS.get(property_name, 0)
+        cached = self._property_cache.get(property_name)
+        if cached is not None and time.monotonic() < cached[0]:
+            return True, cached[1], ""
+        (success, result, message) = self.send_command_with_return(command, TheSkyX.QUERY_COMMAND)
+        # An error from TheSkyX comes back as the reply, e.g. "TypeError: ...|TypeError: .... Error = 1000.";
+        # only a value is kept
+        if success and keep_seconds > 0 and "|" not in result:
+            self._property_cache[property_name] = (time.monotonic() + keep_seconds, result)
+        return success, result, message
+
+    # Forget the camera properties read, so they are read from TheSkyX next time
+    def clear_property_cache(self):
+        self._property_cache = {}
+
     # Tell TheSkyX to connect to the camera
     @tracelog
     def connect_to_camera(self) -> (bool, str):
         """Tell TheSkyX to connect to the camera"""
+        self.clear_property_cache()
         command_line = "ccdsoftCamera.Connect();"
-        (success, message) = self.send_command_no_return(command_line)
+        (success, message) = self.send_command_no_return(command_line, TheSkyX.CAMERA_CONNECTION_COMMAND)
         return success, message
 
     # Tell TheSkyX to disconnect from the camera
     @tracelog
     def disconnect_camera(self) -> (bool, str):
         """Tell TheSkyX to disconnect from the camera"""
+        self.clear_property_cache()
         command_line = "ccdsoftCamera.Disconnect();"
-        (success, message) = self.send_command_no_return(command_line)
+        (success, message) = self.send_command_no_return(command_line, TheSkyX.CAMERA_CONNECTION_COMMAND)
         return success, message
 
     # Tell TheSkyX to take a bias frame at given binning to the camera
@@ -66,7 +151,7 @@ class TheSkyX:
         command += f"ccdsoftCamera.BinY={binning};"
         command += "ccdsoftCamera.ExposureTime=0;"
         command += "var cameraResult = ccdsoftCamera.TakeImage();"
-        (success, returned_value, message) = self.send_command_with_return(command)
+        (success, returned_value, message) = self.send_command_with_return(command, TheSkyX.SYNCHRONOUS_IMAGE_COMMAND)
         if success:
             return_parts = returned_value.split("|")
             assert(len(return_parts) > 0)
@@ -89,7 +174,7 @@ class TheSkyX:
         command_with_return = target_temperature_command \
             + f"ccdsoftCamera.RegulateTemperature={self.js_bool(cooling_on)};" \
             + f"ccdsoftCamera.ShutDownTemperatureRegulationOnDisconnect={self.js_bool(False)};"
-        (success, message) = self.send_command_no_return(command_with_return)
+        (success, message) = self.send_command_no_return(command_with_return, TheSkyX.SETTING_COMMAND)
         return success, message
 
     # Get temperature from camera
@@ -118,7 +203,8 @@ class TheSkyX:
                                 + "var Out;" \
                                 + "Out=temp+\"\\n\";"
         temperature = 0
-        (success, temperature_result, message) = self.send_command_with_return(command_with_return)
+        (success, temperature_result, message) = self.send_command_with_return(command_with_return,
+                                                                               TheSkyX.QUERY_COMMAND)
         if success:
             temperature = Validators.valid_float_in_range(temperature_result, -270, +200)
             if temperature is None:
@@ -127,6 +213,25 @@ class TheSkyX:
                 message = "Invalid Temperature Returned"
         return success, temperature, message
 
+    # Get the camera's binning (horizontal; this program always bins square)
+    # Return a tuple with command success, binning, error message
+    @tracelog
+    def get_camera_binning(self) -> (bool, int, str):
+        """Determine the binning the camera is set to"""
+        command_with_return = "var binning=ccdsoftCamera.BinX;" \
+                                + "var Out;" \
+                                + "Out=binning+\"\\n\";"
+        binning = 0
+        (success, binning_result, message) = self.send_command_with_return(command_with_return,
+                                                                           TheSkyX.QUERY_COMMAND)
+        if success:
+            binning = Validators.valid_int_in_range(binning_result, 1, 16)
+            if binning is None:
+                success = False
+                binning = 0
+                message = "Invalid Binning Returned"
+        return success, binning, message
+
     # Set up the camera parameters for an image (don't actually take the image)
     #  (success, message) = server.set_camera_image(frame_type, binning, exposure_seconds)
     @tracelog
@@ -149,7 +254,7 @@ class TheSkyX:
         else:
             command_with_no_return += f"ccdsoftCamera.ExposureTime = {exposure_seconds};"
 
-        (success, message) = self.send_command_no_return(command_with_no_return)
+        (success, message) = self.send_command_no_return(command_with_no_return, TheSkyX.SETTING_COMMAND)
         return success, message
 
     # Start taking image, asynchronously (i.e. command returns right away, doesn't wait for image)
@@ -162,7 +267,7 @@ class TheSkyX:
                                 + "var Out;" \
                                 + "Out=cameraResult+\"\\n\";"
 
-        (success, result, message) = self.send_command_with_return(command_with_no_return)
+        (success, result, message) = self.send_command_with_return(command_with_no_return, TheSkyX.START_IMAGE_COMMAND)
         # print(f"   Returned result: {result}")
         if success and (result != "0"):
             success = False
@@ -181,7 +286,8 @@ class TheSkyX:
                              + "var Out;" \
                              + "Out=complete+\"\\n\";"
 
-        (command_success, result, message) = self.send_command_with_return(command_with_no_return)
+        (command_success, result, message) = self.send_command_with_return(command_with_no_return,
+                                                                           TheSkyX.QUERY_COMMAND)
         # print(f"   Returned result: {result}")
         if command_success:
             if result == "0":
@@ -207,79 +313,124 @@ class TheSkyX:
         """Abort image acquisition in progress"""
         # print("abort_image")
         command_line = "ccdsoftCamera.Abort();"
-        (success, message) = self.send_command_no_return(command_line)
+        (success, message) = self.send_command_no_return(command_line, TheSkyX.SETTING_COMMAND)
         return success, message
 
     # Send a command to the server and get a returned result value
     # Return a 3-ple:  success flag,  response,  error message if any
     @tracelog
-    def send_command_with_return(self, command: str):
+    def send_command_with_return(self, command: str, command_kind: str = QUERY_COMMAND):
         """Send a command to the server that returns a result, and extract the result"""
         # print(f"send_command_with_return({command})")
         command_packet = "/* Java Script */" \
                 + "/* Socket Start Packet */" \
                 + command \
                 + "/* Socket End Packet */"
-        (success, returned_result, message) = self.send_command_packet(command_packet)
+        (success, returned_result, message) = self.send_command_packet(command_packet, command_kind)
         return success, returned_result, message
 
     # Send a command to the server with no returned value needed
     # Return a 2-ple:  success flag,    error message if any
     @tracelog
-    def send_command_no_return(self, command: str):
+    def send_command_no_return(self, command: str, command_kind: str = SETTING_COMMAND):
         """Send a command to the server that does not return a result"""
         # print(f"send_command_with_return({command})")
         command_packet = "/* Java Script */" \
                 + "/* Socket Start Packet */" \
                 + command \
                 + "/* Socket End Packet */"
-        (success, returned_result, message) = self.send_command_packet(command_packet)
+        (success, returned_result, message) = self.send_command_packet(command_packet, command_kind)
         # print(f"send_command_with_return, ignoring returned result: {returned_result}")
         return success, message
 
     # Send command packet and read response
     # Return a 3-ple:  success flag,  response,  error message if any
     @tracelog
-    def send_command_packet(self, command_packet: str):
+    def send_command_packet(self, command_packet: str, command_kind: str = QUERY_COMMAND):
         """Send command packet to server, read response"""
         # print(f"send_command_packet({command_packet})")
         result = ""
         success = False
         message = ""
         address_tuple = (self._server_address, self._port_number)
-        TheSkyX._server_mutex.lock()
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as the_socket:
-            try:
-                the_socket.connect(address_tuple)
+        raw_reply = None
+        connection_lost = True
+        self._mutex.lock()
+        sent_at = time.monotonic()
+        (connect_seconds, send_seconds, receive_seconds) = TheSkyX.COMMAND_DEADLINES[command_kind]
+        try:
+            with self._transport.open_connection(address_tuple, connect_seconds) as the_socket:
                 bytes_to_send = bytes(command_packet, 'utf-8')
+                the_socket.settimeout(send_seconds)
                 the_socket.sendall(bytes_to_send)
-                returned_bytes = the_socket.recv(TheSkyX.MAX_RECEIVE_SIZE)
-                result_lines = returned_bytes.decode('utf=8') + "\n"
-                parsed_lines = result_lines.split("\n")
-                if len(parsed_lines) > 0:
-                    result = parsed_lines[0]
-                    success = True
-            except socket.gaierror as ge:
-                success = False
-                result = ""
-                message = ge.strerror
-            except ConnectionRefusedError as cr:
-                success = False
-                result = ""
-            except TimeoutError as te:
-                success = False
-                result = ""
-                message = te.strerror
-            except Exception as ex:
-                print("Unexpected error:", sys.exc_info()[0])
-                print(type(ex))
-                print(ex.args)
-                print(ex)
-                success = False
-                message = ex.strerror + " " + str(sys.exc_info()[0])
-        TheSkyX._server_mutex.unlock()
+                returned_bytes = self.receive_reply(the_socket, receive_seconds)
+            raw_reply = returned_bytes.decode('utf=8')
+            result_lines = raw_reply + "\n"
+            parsed_lines = result_lines.split("\n")
+            if len(parsed_lines) > 0:
+                result = parsed_lines[0]
+                success = True
+            connection_lost = False
+        except socket.gaierror as ge:
+            success = False
+            result = ""
+            message = ge.strerror
+        except ConnectionRefusedError as cr:
+            success = False
+            result = ""
+            message = "Connection refused"
+        except (TimeoutError, socket.timeout) as te:
+            success = False
+            result = ""
+            message = f"Timed out ({command_kind} command)"
+        except InterruptedError as ie:
+            # The session was cancelled while we waited for the reply
+            success = False
+            result = ""
+            message = str(ie)
+            connection_lost = False
+        except OSError as oe:
+            # E.g. connection reset or closed before the reply was complete
+            success = False
+            result = ""
+            message = str(oe)
+        except Exception as ex:
+            connection_lost = False
+            print("Unexpected error:", sys.exc_info()[0])
+            print(type(ex))
+            print(ex.args)
+            print(ex)
+            success = False
+            message = str(ex) + " " + str(sys.exc_info()[0])
+        if TheSkyX._trace is not None:
+            TheSkyX._trace.record(sent_at, command_packet, raw_reply, time.monotonic() - sent_at, message)
+        self._mutex.unlock()
+        self._connection_lost = connection_lost
         return success, result, message
 
+    # Read a complete reply, which may arrive in several pieces.  The wait is in short slices, checking for
+    # cancellation between them.  Raises ConnectionResetError if the connection closes before the reply's end,
+    # socket.timeout if the reply takes longer than the given time, and InterruptedError if cancelled.
+    def receive_reply(self, connection, timeout_seconds: float) -> bytes:
+        """Receive from the connection until the reply's error code has arrived"""
+        received = b""
+        time_waited = 0.0
+        connection.settimeout(TheSkyX.RECEIVE_SLICE_SECONDS)
+        while TheSkyX.END_OF_REPLY.search(received) is None:
+            try:
+                data = connection.recv(TheSkyX.MAX_RECEIVE_SIZE)
+            except socket.timeout:
+                time_waited += TheSkyX.RECEIVE_SLICE_SECONDS
+                if self._cancelled is not None and self._cancelled():
+                    raise InterruptedError("Cancelled while waiting for TheSkyX")
+                if time_waited >= timeout_seconds:
+                    raise
+                continue
+            if len(data) == 0:
+                raise ConnectionResetError("Connection closed before the reply was complete")
+            received += data
+        return received
+
     # Convert a bool to a string in javascript-bool format (lowercase)
     @staticmethod
     def js_bool(value: bool) -> str:
@@ -295,5 +446,5 @@ class TheSkyX:
         command_with_return = "var power=ccdsoftCamera.ThermalElectricCoolerPower;" \
                 + "var Out;" \
                 + "Out=power+\"\\n\";"
-        (success, power_result, message) = self.send_command_with_return(command_with_return)
+        (success, power_result, message) = self.send_command_with_return(command_with_return, TheSkyX.QUERY_COMMAND)
         return success, power_result, message
@@ -0,0 +1,106 @@
+# Characterize the link to a TheSkyX server before trusting it with a session: send a number of harmless
+# read commands (e.g. the camera temperature) through TheSkyX, one at a time or several at once, and
+# measure connection and round-trip times, commands answered per second and the fraction that fail.
+# Each run either connects for every command, as the session does, or keeps connections open and reuses
+# them (see MeasuredTransport), to show what connecting costs.  With a concurrency above 1, each of that
+# many threads sends its share of the commands on its own TheSkyX (with its own mutex, so they don't take
+# turns); TheSkyX itself runs one script at a time, so this measures how the server copes with the queue.
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QMutex
+
+from MeasuredTransport import MeasuredTransport
+from TheSkyX import TheSkyX
+from TheSkyXTransport import TheSkyXTransport
+from tracelog import *
+
+
+class TheSkyXProbe:
+    # Read commands that change nothing, by name: each is a TheSkyX method returning (success, ..., message)
+    COMMANDS = {"temperature": TheSkyX.get_camera_temperature,
+                "cooler-power": TheSkyX.get_cooler_power,
+                "binning": TheSkyX.get_camera_binning,
+                "exposure-complete": TheSkyX.get_exposure_is_complete}
+    DEFAULT_COMMAND = "temperature"
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self, server_address: str, port_number: int, transport: TheSkyXTransport = None):
+        self._server_address: str = server_address
+        self._port_number: int = port_number
+        self._transport: TheSkyXTransport = transport  # Inner transport; None for real sockets
+
+    # Send the commands and measure them.  Return the results, as a dictionary ready to save as JSON
+    @tracelog
+    def run(self, command_name: str, count: int, concurrency: int, reuse_connections: bool) -> {str: object}:
+        """Send count read commands, concurrency at a time, and measure the link"""
+        assert command_name in TheSkyXProbe.COMMANDS
+        command = TheSkyXProbe.COMMANDS[command_name]
+        transport = MeasuredTransport(self._transport, reuse_connections)
+        concurrency = max(1, min(concurrency, count))
+        shares = [count // concurrency + (1 if worker < count % concurrency else 0) for worker in range(concurrency)]
+
+        def send_share(share: int) -> [(float, bool, str)]:
+            server = TheSkyX(self._server_address, self._port_number, transport, mutex=QMutex())
+            outcomes = []
+            for _ in range(share):
+                command_started = time.perf_counter()
+                reply = command(server)
+                outcomes.append((time.perf_counter() - command_started, reply[0], reply[-1]))
+            return outcomes
+
+        run_started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            outcomes = [outcome for worker_outcomes in executor.map(send_share, shares)
+                        for outcome in worker_outcomes]
+        run_seconds = time.perf_counter() - run_started
+        transport.close_idle_connections()
+
+        errors: {str: int} = {}
+        for (_, success, message) in outcomes:
+            if not success:
+                errors[message] = errors.get(message, 0) + 1
+        failed = sum(errors.values())
+        return {"command": command_name,
+                "commands": count,
+                "concurrency": concurrency,
+                "connection_reuse": reuse_connections,
+                "connections_opened": transport.get_connections_opened(),
+                "connect_ms": TheSkyXProbe.summarize_milliseconds(transport.get_connect_seconds()),
+                "round_trip_ms": TheSkyXProbe.summarize_milliseconds([seconds for (seconds, success, _) in outcomes
+                                                                      if success]),
+                "commands_per_second": round((count - failed) / run_seconds, 1) if run_seconds > 0 else None,
+                "failed_commands": failed,
+                "error_rate": round(failed / count, 4) if count > 0 else 0.0,
+                "errors": errors}
+
+    # Percentiles and maximum of a list of times, in milliseconds; empty if there are none
+    @staticmethod
+    def summarize_milliseconds(seconds: [float]) -> {str: float}:
+        if len(seconds) == 0:
+            return {}
+        ordered = sorted(seconds)
+        summary = {f"p{percentile}": round(TheSkyXProbe.percentile(ordered, percentile) * 1000, 2)
+                   for percentile in TheSkyXProbe.PERCENTILES}
+        summary["max"] = round(ordered[-1] * 1000, 2)
+        return summary
+
+    # The given percentile of a sorted list, by the nearest-rank method
+    @staticmethod
+    def percentile(ordered: [float], percentile: float) -> float:
+        rank = max(1, -(-len(ordered) * percentile // 100))  # Ceiling
+        return ordered[int(rank) - 1]
+
+    # One line describing a run's results, for the console
+    @staticmethod
+    def describe(results: {str: object}) -> str:
+        def times(summary: {str: float}) -> str:
+            return " / ".join(f"{summary[key]}" for key in (f"p{p}" for p in TheSkyXProbe.PERCENTILES)) \
+                if len(summary) > 0 else "-"
+        return f"{results['concurrency']:>3} at a time, " \
+            + ("reusing connections " if results["connection_reuse"] else "connecting each time") \
+            + f"  connect ms {times(results['connect_ms'])}" \
+            + f"  round trip ms {times(results['round_trip_ms'])}" \
+            + f"  {results['commands_per_second']} commands/s" \
+            + f"  errors {results['error_rate'] * 100:.1f}% ({results['failed_commands']} failed)" \
+            + f"  ({results['connections_opened']} connections)"
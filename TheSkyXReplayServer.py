@@ -0,0 +1,54 @@
+# A TheSkyX stand-in that answers from a recorded trace (see TheSkyXTrace) instead of a simulated camera:
+# each packet gets the reply TheSkyX gave to the same packet in the recording, after the time the
+# recorded exchange took.  Replies to a packet sent several times (e.g. "is the exposure complete?") are
+# given in the order they were recorded; once they run out, the last is repeated.  A recorded exchange
+# with no reply (e.g. a dropped connection) closes the connection without replying.
+# Packets that were never recorded are answered with an error, and counted (see get_misses).
+#
+# Delays are on the given clock, so with a VirtualClock a recorded night replays in seconds with the
+# recorded timing.
+from RealClock import RealClock
+from SessionClock import SessionClock
+from SimulatedCamera import SimulatedCamera
+from TheSkyXStandInServer import TheSkyXStandInServer
+from tracelog import *
+
+
+class TheSkyXReplayServer(TheSkyXStandInServer):
+    NOT_RECORDED_ERROR_CODE = 1001
+
+    def __init__(self, exchanges: [{str: object}],
+                 clock: SessionClock = None,
+                 address: str = "localhost",
+                 port: int = 0,
+                 speed: float = 1.0):  # Recorded delays are divided by this; 0 for no delays
+        # The stand-in's camera isn't used to answer packets, only for its clock
+        TheSkyXStandInServer.__init__(self, SimulatedCamera(clock if clock is not None else RealClock()),
+                                      address, port)
+        self._speed: float = speed
+        self._replies: {str: [{str: object}]} = {}  # Recorded exchanges, by packet, in order
+        for exchange in exchanges:
+            self._replies.setdefault(exchange["packet"], []).append(exchange)
+        self._next_reply: {str: int} = {}  # Index of the next reply to give for each packet
+        self._misses: int = 0
+
+    def get_misses(self) -> int:
+        with self._script_lock:
+            return self._misses
+
+    # The recorded reply to the packet, after its recorded delay.  None to close the connection without replying.
+    def reply_to_packet(self, packet: str) -> str:
+        """Replay the recorded reply to the packet"""
+        recorded = self._replies.get(packet)
+        if recorded is None:
+            with self._script_lock:
+                self._misses += 1
+            message = "Packet not in the recorded trace"
+            return f"{message}|{message}. Error = {TheSkyXReplayServer.NOT_RECORDED_ERROR_CODE}."
+        with self._script_lock:
+            index = self._next_reply.get(packet, 0)
+            self._next_reply[packet] = index + 1
+        exchange = recorded[min(index, len(recorded) - 1)]
+        if self._speed > 0:
+            self._camera.get_clock().sleep(exchange["seconds"] / self._speed)
+        return exchange["reply"]
@@ -0,0 +1,299 @@
+# A local stand-in for TheSkyX's TCP server, so TheSkyX and the session worker can be exercised without
+# TheSkyX or a camera.  It accepts the same packets ("/* Java Script */ ... /* Socket End Packet */"),
+# any number per connection, and interprets the small part of TheSkyX's JavaScript this program sends:
+# statements separated by semicolons that set and read ccdsoftCamera properties, call its methods
+# (Connect, Disconnect, TakeImage, Abort), declare variables and build "Out" with "+".
+# The camera is a SimulatedCamera, so exposure and download times and the cooling curve are modelled,
+# on whatever clock the camera was given.
+#
+# The reply is like TheSkyX's: the value of Out (or, if Out wasn't set, of the last statement), then
+# "|No error. Error = 0.".  Errors are replied as "<message>|<message>. Error = <code>.".
+# For testing error handling, replies can be delayed, and a random fraction of camera commands can fail
+# or have their connection dropped with no reply.
+import random
+import re
+import socket
+import socketserver
+import threading
+
+from SimulatedCamera import SimulatedCamera
+from tracelog import *
+
+
+class TheSkyXStandInServer:
+    END_OF_PACKET = "/* Socket End Packet */"
+    NO_ERROR_SUFFIX = "|No error. Error = 0."
+    CAMERA_ERROR_CODE = 206  # Returned for simulated camera failures
+    SYNTAX_ERROR_CODE = 1000  # Returned for statements the stand-in doesn't understand
+    NOT_CONNECTED_ERROR_CODE = 200
+    RECEIVE_SIZE = 4096
+    CAMERA_PREFIX = "ccdsoftCamera."
+    CAMERA_METHODS = ("Connect", "Disconnect", "TakeImage", "Abort")
+
+    # latency_seconds: time to wait before each reply, on the camera's clock (so with a VirtualClock it
+    #     adds to the session's time without slowing the test)
+    # failure_rate: fraction of camera method calls and readings that reply with an error
+    # drop_rate: fraction of packets whose connection is closed with no reply
+    def __init__(self, camera: SimulatedCamera,
+                 address: str = "localhost",
+                 port: int = 0,  # 0 to use any free port; see get_port
+                 latency_seconds: float = 0.0,
+                 failure_rate: float = 0.0,
+                 drop_rate: float = 0.0,
+                 seed: int = None):
+        self._camera: SimulatedCamera = camera
+        self._latency_seconds: float = latency_seconds
+        self._failure_rate: float = failure_rate
+        self._drop_rate: float = drop_rate
+        self._random = random.Random(seed)  # Drawn from only while holding _script_lock
+        self._script_lock = threading.Lock()  # TheSkyX runs one script at a time
+        self._server_thread: threading.Thread = None
+        self._packets_received: int = 0
+
+        # Camera settings that TheSkyX holds until an image is taken
+        self._asynchronous: bool = False
+        self._frame_type_code: int = SimulatedCamera.BIAS_FRAME_CODE
+        self._binning: int = 1
+        self._exposure_seconds: float = 0.0
+        self._regulate_temperature: bool = False
+        self._set_point: float = 0.0
+        self._other_properties: {str: object} = {}  # Set but not modelled (ImageReduction, AutoSaveOn, ...)
+
+        stand_in = self
+
+        class RequestHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                stand_in.handle_connection(self.request)
+
+        class TcpServer(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True  # So a stand-in can be restarted on the same port right away
+            daemon_threads = True
+
+        self._tcp_server = TcpServer((address, port), RequestHandler)
+
+    def get_port(self) -> int:
+        return self._tcp_server.server_address[1]
+
+    def get_camera(self) -> SimulatedCamera:
+        return self._camera
+
+    def get_packets_received(self) -> int:
+        with self._script_lock:
+            return self._packets_received
+
+    # Serve in a background thread, returning at once
+    @tracelog
+    def start(self):
+        """Start serving connections in a background thread"""
+        self._server_thread = threading.Thread(target=self._tcp_server.serve_forever, daemon=True)
+        self._server_thread.start()
+
+    # Serve in this thread until stop() is called from another thread
+    def serve_forever(self):
+        self._tcp_server.serve_forever()
+
+    @tracelog
+    def stop(self):
+        """Stop serving and close the listening socket"""
+        self._tcp_server.shutdown()
+        self._tcp_server.server_close()
+        if self._server_thread is not None:
+            self._server_thread.join()
+            self._server_thread = None
+
+    # Read packets from one connection and answer each, until the client closes it
+    def handle_connection(self, connection: socket.socket):
+        """Answer the packets arriving on one client connection"""
+        received = ""
+        while True:
+            try:
+                data = connection.recv(TheSkyXStandInServer.RECEIVE_SIZE)
+            except OSError:
+                return
+            if len(data) == 0:
+                return
+            received += data.decode("utf-8")
+            while TheSkyXStandInServer.END_OF_PACKET in received:
+                (packet, received) = received.split(TheSkyXStandInServer.END_OF_PACKET, 1)
+                # Connections are served on their own threads; count and draw under the lock
+                with self._script_lock:
+                    self._packets_received += 1
+                    dropped = self._random.random() < self._drop_rate
+                if dropped:
+                    connection.close()
+                    return
+                reply = self.reply_to_packet(packet + TheSkyXStandInServer.END_OF_PACKET)
+                if reply is None:
+                    connection.close()
+                    return
+                self._camera.get_clock().sleep(self._latency_seconds)
+                try:
+                    connection.sendall(reply.encode("utf-8"))
+                except OSError:
+                    return
+
+    # The reply to one complete packet, or None to close the connection without replying.
+    # (TheSkyXReplayServer overrides this to answer from a recording.)
+    def reply_to_packet(self, packet: str) -> str:
+        """Run the script in the packet and format TheSkyX's reply"""
+        script = re.sub(r"/\*.*?\*/", "", packet, flags=re.DOTALL)
+        with self._script_lock:
+            (success, value, error_code) = self.run_script(script)
+        if success:
+            return value + TheSkyXStandInServer.NO_ERROR_SUFFIX
+        else:
+            return f"{value}|{value}. Error = {error_code}."
+
+    # Run the statements of a script.  Return success, the result (Out, or the last statement's value) or
+    # an error message, and the error code.
+    def run_script(self, script: str) -> (bool, str, int):
+        """Interpret a script of JavaScript statements"""
+        variables: {str: object} = {}
+        last_value = None
+        for statement in script.split(";"):
+            statement = statement.strip()
+            if statement == "":
+                continue
+            (success, last_value, error_code) = self.run_statement(statement, variables)
+            if not success:
+                return False, str(last_value), error_code
+        if variables.get("Out") is not None:
+            return True, self.js_string(variables["Out"]), 0
+        return True, self.js_string(last_value), 0
+
+    # One statement: a declaration, an assignment, or an expression such as a method call
+    def run_statement(self, statement: str, variables: {str: object}) -> (bool, object, int):
+        declaration = re.fullmatch(r"var\s+(\w+)", statement)
+        if declaration is not None:
+            variables[declaration.group(1)] = None
+            return True, None, 0
+        assignment = re.fullmatch(r"(?:var\s+)?([\w.]+)\s*=\s*(.+)", statement, flags=re.DOTALL)
+        if assignment is not None:
+            (target, expression) = assignment.groups()
+            (success, value, error_code) = self.evaluate(expression.strip(), variables)
+            if not success:
+                return False, value, error_code
+            if target.startswith(TheSkyXStandInServer.CAMERA_PREFIX):
+                return self.set_camera_property(target[len(TheSkyXStandInServer.CAMERA_PREFIX):], value)
+            variables[target] = value
+            return True, value, 0
+        return self.evaluate(statement, variables)
+
+    # An expression: literals, variables, camera properties and method calls, joined with "+"
+    def evaluate(self, expression: str, variables: {str: object}) -> (bool, object, int):
+        terms = [term.strip() for term in re.findall(r'"(?:[^"\\]|\\.)*"|[^+]+', expression)]
+        values = []
+        for term in terms:
+            (success, value, error_code) = self.evaluate_term(term, variables)
+            if not success:
+                return False, value, error_code
+            values.append(value)
+        if len(values) == 1:
+            return True, values[0], 0
+        return True, "".join(self.js_string(value) for value in values), 0
+
+    def evaluate_term(self, term: str, variables: {str: object}) -> (bool, object, int):
+        if term.startswith('"') and term.endswith('"'):
+            return True, term[1:-1].replace("\\n", "\n").replace('\\"', '"'), 0
+        if term in ("true", "false"):
+            return True, term == "true", 0
+        if re.fullmatch(r"-?\d+(\.\d*)?", term):
+            return True, float(term), 0
+        if term in variables:
+            return True, variables[term], 0
+        method_call = re.fullmatch(r"ccdsoftCamera\.(\w+)\(\)", term)
+        if method_call is not None:
+            return self.call_camera_method(method_call.group(1))
+        if term.startswith(TheSkyXStandInServer.CAMERA_PREFIX):
+            return self.get_camera_property(term[len(TheSkyXStandInServer.CAMERA_PREFIX):])
+        return False, f"ReferenceError: {term} is not defined", TheSkyXStandInServer.SYNTAX_ERROR_CODE
+
+    # Called only from run_script, so _script_lock is already held
+    def simulated_failure(self) -> bool:
+        """Decide at random whether this camera operation fails"""
+        return self._random.random() < self._failure_rate
+
+    @tracelog
+    def call_camera_method(self, method_name: str) -> (bool, object, int):
+        """Run a ccdsoftCamera method"""
+        if method_name not in TheSkyXStandInServer.CAMERA_METHODS:
+            return False, f"TypeError: ccdsoftCamera.{method_name} is not a function", \
+                TheSkyXStandInServer.SYNTAX_ERROR_CODE
+        if self.simulated_failure():
+            return False, f"Simulated camera failure in {method_name}", TheSkyXStandInServer.CAMERA_ERROR_CODE
+        if method_name == "Connect":
+            self._camera.set_connected(True)
+        elif method_name == "Disconnect":
+            self._camera.set_connected(False)
+        elif method_name == "Abort":
+            self._camera.abort_exposure()
+        else:
+            assert method_name == "TakeImage"
+            if not self._camera.is_connected():
+                return False, "Camera not connected", TheSkyXStandInServer.NOT_CONNECTED_ERROR_CODE
+            self._camera.set_image(self._frame_type_code, self._binning, self._exposure_seconds)
+            if self._asynchronous:
+                self._camera.start_exposure()
+            else:
+                self._camera.take_exposure()
+        return True, 0, 0
+
+    @tracelog
+    def get_camera_property(self, property_name: str) -> (bool, object, int):
+        """Read a ccdsoftCamera property"""
+        if property_name == "AutoSavePath":
+            return True, self._camera.get_autosave_path(), 0
+        if self.simulated_failure():
+            return False, f"Simulated camera failure reading {property_name}", TheSkyXStandInServer.CAMERA_ERROR_CODE
+        if property_name == "Temperature":
+            return True, self._camera.get_temperature(), 0
+        elif property_name == "ThermalElectricCoolerPower":
+            return True, self._camera.get_cooler_power(), 0
+        elif property_name == "IsExposureComplete":
+            return True, 1 if self._camera.exposure_is_complete() else 0, 0
+        elif property_name == "TemperatureSetPoint":
+            return True, self._set_point, 0
+        elif property_name == "RegulateTemperature":
+            return True, self._regulate_temperature, 0
+        elif property_name in ("BinX", "BinY"):
+            return True, self._binning, 0
+        elif property_name == "Frame":
+            return True, self._frame_type_code, 0
+        elif property_name == "ExposureTime":
+            return True, self._exposure_seconds, 0
+        elif property_name in self._other_properties:
+            return True, self._other_properties[property_name], 0
+        return False, f"TypeError: ccdsoftCamera.{property_name} is undefined", TheSkyXStandInServer.SYNTAX_ERROR_CODE
+
+    @tracelog
+    def set_camera_property(self, property_name: str, value) -> (bool, object, int):
+        """Set a ccdsoftCamera property"""
+        if property_name == "Asynchronous":
+            self._asynchronous = bool(value)
+        elif property_name == "Frame":
+            self._frame_type_code = int(value)
+        elif property_name in ("BinX", "BinY"):
+            self._binning = int(value)
+        elif property_name == "ExposureTime":
+            self._exposure_seconds = float(value)
+        elif property_name == "TemperatureSetPoint":
+            self._set_point = float(value)
+            if self._regulate_temperature:
+                self._camera.set_cooling(True, self._set_point)
+        elif property_name == "RegulateTemperature":
+            self._regulate_temperature = bool(value)
+            self._camera.set_cooling(self._regulate_temperature, self._set_point)
+        else:
+            self._other_properties[property_name] = value
+        return True, value, 0
+
+    # Format a value the way JavaScript converts it to a string
+    @staticmethod
+    def js_string(value) -> str:
+        if value is None:
+            return "undefined"
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, float) and value.is_integer():
+            return str(int(value))
+        return str(value)
@@ -0,0 +1,85 @@
+# Recording of the command traffic between this program and TheSkyX: every packet sent, the reply
+# received (exactly as received, None if there was none) and how long the exchange took.  A trace of a
+# real session can be replayed by TheSkyXReplayServer, so session logic can be benchmarked and tested
+# against a real camera's timing without the camera.
+#
+# A trace file has one JSON object per line: first a header ({"trace_format": 1, "started": ...}), then one
+# line per exchange ({"t": seconds since the recording started, "packet": ..., "reply": ..., "seconds": ...,
+# "error": ...}).  Files whose names end in ".gz" are compressed.
+import gzip
+import json
+import threading
+import time
+from datetime import datetime
+
+from tracelog import *
+
+
+class TheSkyXTrace:
+    TRACE_FORMAT_VERSION = 1
+
+    def __init__(self, file_path: str):
+        self._file_path: str = file_path
+        self._file = None
+        self._lock = threading.Lock()  # Several TheSkyX instances may send at once
+        self._started: float = 0.0
+        self._exchanges: int = 0
+
+    @staticmethod
+    def open_trace_file(file_path: str, mode: str):
+        """Open a trace file for text reading or writing, compressed if it's a .gz"""
+        if file_path.endswith(".gz"):
+            return gzip.open(file_path, mode + "t", encoding="utf-8")
+        return open(file_path, mode, encoding="utf-8")
+
+    # Begin recording, writing the header.  Return success and an error message
+    @tracelog
+    def start(self) -> (bool, str):
+        """Create the trace file and start recording to it"""
+        try:
+            self._file = self.open_trace_file(self._file_path, "w")
+            self._file.write(json.dumps({"trace_format": TheSkyXTrace.TRACE_FORMAT_VERSION,
+                                         "started": datetime.now().isoformat(timespec="seconds")}) + "\n")
+        except OSError as error:
+            self._file = None
+            return False, str(error)
+        self._started = time.monotonic()
+        return True, ""
+
+    @tracelog
+    def stop(self):
+        """Finish recording and close the trace file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def get_exchanges(self) -> int:
+        return self._exchanges
+
+    # Record one exchange.  Written (and flushed) at once, so a crash doesn't lose the trace
+    def record(self, sent_at: float, packet: str, reply: str, seconds: float, error: str):
+        """Add a packet, its reply and timing to the trace"""
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps({"t": round(sent_at - self._started, 4),
+                                         "packet": packet,
+                                         "reply": reply,
+                                         "seconds": round(seconds, 4),
+                                         "error": error}) + "\n")
+            self._file.flush()
+            self._exchanges += 1
+
+    # Read the exchanges from a trace file.  Return them (None if the file is unreadable) and an error message
+    @staticmethod
+    def read_exchanges(file_path: str) -> ([{str: object}], str):
+        """Load the recorded exchanges from a trace file"""
+        try:
+            with TheSkyXTrace.open_trace_file(file_path, "r") as trace_file:
+                lines = [json.loads(line) for line in trace_file if line.strip() != ""]
+        except (OSError, EOFError, json.JSONDecodeError) as error:
+            return None, str(error)
+        if len(lines) == 0 or lines[0].get("trace_format") != TheSkyXTrace.TRACE_FORMAT_VERSION:
+            return None, "Not a TheSkyX trace file"
+        return lines[1:], ""
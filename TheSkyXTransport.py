@@ -0,0 +1,15 @@
+# How TheSkyX reaches the server: opens a connection for each command packet.  SocketTransport opens
+# real TCP connections; ImpairedTransport wraps another transport and makes the link slow or unreliable,
+# for measuring how sessions behave over a poor network.
+# A connection is anything with the socket methods TheSkyX uses: settimeout, sendall, recv and close
+# (and use in a "with" statement).  recv raises socket.timeout when nothing arrives within the timeout.
+from abc import ABC, abstractmethod
+
+
+class TheSkyXTransport(ABC):
+
+    # Open a connection to the server; timeout_seconds limits each connect, send and receive (None for no
+    # limit).  Raises OSError (e.g. ConnectionRefusedError, socket.timeout) on failure.
+    @abstractmethod
+    def open_connection(self, address: (str, int), timeout_seconds: float = None):
+        pass
@@ -0,0 +1,248 @@
+# Vectorized calculation of sun-based event times (sunset, dusk, dawn, sunrise) for
+# every night in a range of dates, in one batched numpy computation instead of one
+# ephem search per day.
+#
+# The solar position uses the low-precision formulae from Meeus, "Astronomical Algorithms",
+# chapter 25 (good to about 0.01 degree), with the apparent sidereal time from chapter 12.
+# Event times are found by Newton iteration on the sun's altitude, done for all dates at once.
+# The conventions match those of the ephem-based DataModel.calc_* methods:
+#       no atmospheric refraction (the observer pressure is zero);
+#       sunset, sunrise and dawns are found for the sun's upper limb (ephem's default),
+#       dusks are found for the sun's centre (DataModel uses use_center=True for dusk)
+# Checked with max_difference_from_ephem: at mid latitudes the results agree with ephem to
+# within a few seconds.  Near the polar limits, where the sun barely grazes a twilight horizon,
+# the event times are very sensitive and can differ by tens of seconds.
+from datetime import date, datetime, timezone
+
+import numpy
+
+from EndTime import EndTime
+from NightWindows import NightWindows
+from StartTime import StartTime
+from tracelog import *
+
+
+class TwilightTable:
+    UNIX_EPOCH_JULIAN_DAY = 2440587.5
+    J2000_JULIAN_DAY = 2451545.0
+    SIDEREAL_RATE = 360.98564736629  # Degrees of hour angle per day
+    SOLAR_PARALLAX_DEGREES = 8.794 / 3600.0
+    SOLAR_SEMIDIAMETER_DEGREES = 959.63 / 3600.0  # At 1 AU
+    NEWTON_ITERATIONS = 5
+    NEWTON_MAX_STEP_DAYS = 0.25  # Don't let one correction run away to a different day
+    CONVERGENCE_RADIANS = 1.0e-5  # About 2 arc seconds, or a fraction of a second of time
+    TYPICAL_EVENT_OFFSET_DAYS = 0.3  # Rough time from transit to evening event
+    GRAZING_MARGIN = 0.05  # How far past the horizon-crossing limit to still look for an event
+    GRAZING_CLIP = 0.999
+
+    # Horizons (degrees) and whether the sun's centre or upper limb is used, for each kind
+    # of session start and end time.  These are the same values used by DataModel.
+    START_EVENTS = {StartTime.SUNSET: (-34.0 / 60.0, False),
+                    StartTime.CIVIL_DUSK: (-6.0, True),
+                    StartTime.NAUTICAL_DUSK: (-12.0, True),
+                    StartTime.ASTRONOMICAL_DUSK: (-18.0, True)}
+    END_EVENTS = {EndTime.SUNRISE: (-34.0 / 60.0, False),
+                  EndTime.CIVIL_DAWN: (-6.0, False),
+                  EndTime.NAUTICAL_DAWN: (-12.0, False),
+                  EndTime.ASTRONOMICAL_DAWN: (-18.0, False)}
+
+    def __init__(self, latitude: float, longitude: float):
+        self._latitude = latitude
+        self._longitude = longitude
+
+    # Calculate the nightly window from the given evening event to the following morning event,
+    # for every night from first_date to last_date inclusive.  Dates are local calendar dates
+    # at the site; the night of a date is the one that starts on the evening of that date.
+    @tracelog
+    def night_windows(self, first_date: date, last_date: date,
+                      start_time_type: str = StartTime.CIVIL_DUSK,
+                      end_time_type: str = EndTime.CIVIL_DAWN) -> NightWindows:
+        """Calculate dark window start, end and duration for every night in a date range"""
+        assert start_time_type in TwilightTable.START_EVENTS
+        assert end_time_type in TwilightTable.END_EVENTS
+        dates = self.date_range(first_date, last_date)
+        (start_horizon, start_use_center) = TwilightTable.START_EVENTS[start_time_type]
+        (end_horizon, end_use_center) = TwilightTable.END_EVENTS[end_time_type]
+        start_days = self.evening_events(dates, start_horizon, start_use_center)
+        end_days = self.morning_events(dates, end_horizon, end_use_center)
+        return NightWindows(dates, self.julian_days_to_datetime64(start_days),
+                            self.julian_days_to_datetime64(end_days))
+
+    # Find the setting of the sun through the given horizon on the evening of each date.
+    # Returns Julian Days (UT), NaN where the sun doesn't cross that horizon that evening.
+    def evening_events(self, dates: numpy.ndarray, horizon: float, use_center: bool) -> numpy.ndarray:
+        """Julian days of the sun setting through a given horizon on each evening"""
+        local_noon = self.local_noon_julian_days(dates)
+        return self.find_events(local_noon, horizon, use_center, setting=True)
+
+    # Find the rising of the sun through the given horizon on the morning after each date
+    def morning_events(self, dates: numpy.ndarray, horizon: float, use_center: bool) -> numpy.ndarray:
+        """Julian days of the sun rising through a given horizon on each following morning"""
+        next_local_noon = self.local_noon_julian_days(dates) + 1.0
+        return self.find_events(next_local_noon, horizon, use_center, setting=False)
+
+    # Starting from the meridian transit nearest each reference time, estimate the event with
+    # the usual hour-angle formula, then polish all the estimates together with Newton's method.
+    def find_events(self, reference_days: numpy.ndarray, horizon: float,
+                    use_center: bool, setting: bool) -> numpy.ndarray:
+        """Find sun horizon crossings near each reference Julian day, vectorized"""
+        latitude = numpy.radians(self._latitude)
+        (right_ascension, declination, distance, sidereal) = self.sun_position(reference_days)
+        hour_angle = self.wrap_degrees(sidereal + self._longitude - right_ascension)
+        transit = reference_days - hour_angle / TwilightTable.SIDEREAL_RATE
+        # Use the declination from around the time of the event, not of noon, to decide
+        # whether the event happens at all
+        (_, declination, distance, _) = self.sun_position(
+            transit + (TwilightTable.TYPICAL_EVENT_OFFSET_DAYS if setting else -TwilightTable.TYPICAL_EVENT_OFFSET_DAYS))
+        target = numpy.radians(self.target_altitude(horizon, use_center, distance))
+        cos_h0 = (numpy.sin(target) - numpy.sin(latitude) * numpy.sin(declination)) \
+            / (numpy.cos(latitude) * numpy.cos(declination))
+        # Where the sun only just reaches the horizon, start from near the grazing point and let
+        # the iteration decide.  Well beyond that, there is no event.
+        cos_h0 = numpy.where(numpy.abs(cos_h0) <= 1.0 + TwilightTable.GRAZING_MARGIN,
+                             numpy.clip(cos_h0, -TwilightTable.GRAZING_CLIP, TwilightTable.GRAZING_CLIP),
+                             numpy.nan)
+        half_arc_days = numpy.degrees(numpy.arccos(cos_h0)) / TwilightTable.SIDEREAL_RATE
+        event_days = transit + half_arc_days if setting else transit - half_arc_days
+
+        for _ in range(TwilightTable.NEWTON_ITERATIONS):
+            (right_ascension, declination, distance, sidereal) = self.sun_position(event_days)
+            hour_angle = numpy.radians(sidereal + self._longitude - right_ascension)
+            sin_altitude = numpy.sin(latitude) * numpy.sin(declination) \
+                + numpy.cos(latitude) * numpy.cos(declination) * numpy.cos(hour_angle)
+            altitude = numpy.arcsin(numpy.clip(sin_altitude, -1.0, 1.0))
+            # Topocentric correction for the sun's (tiny) horizontal parallax
+            altitude -= numpy.radians(TwilightTable.SOLAR_PARALLAX_DEGREES / distance) * numpy.cos(altitude)
+            target = numpy.radians(self.target_altitude(horizon, use_center, distance))
+            # Rate of change of altitude, radians per day
+            altitude_rate = -numpy.cos(latitude) * numpy.cos(declination) * numpy.sin(hour_angle) \
+                * numpy.radians(TwilightTable.SIDEREAL_RATE) / numpy.cos(altitude)
+            with numpy.errstate(divide="ignore", invalid="ignore"):
+                step = (altitude - target) / altitude_rate
+            event_days = event_days - numpy.clip(step, -TwilightTable.NEWTON_MAX_STEP_DAYS,
+                                                 TwilightTable.NEWTON_MAX_STEP_DAYS)
+        # Near the polar limits the sun can graze the horizon without crossing it, and the
+        # iteration settles on the grazing point instead of converging.  Those are not events.
+        with numpy.errstate(invalid="ignore"):
+            converged = numpy.abs(altitude - target) < TwilightTable.CONVERGENCE_RADIANS
+        return numpy.where(converged, event_days, numpy.nan)
+
+    # The altitude of the sun's centre at the moment of the event.  For upper-limb events the
+    # centre is one semidiameter below the horizon.
+    @staticmethod
+    def target_altitude(horizon: float, use_center: bool, distance: numpy.ndarray) -> numpy.ndarray:
+        """Altitude, in degrees, the sun's centre has at the event"""
+        if use_center:
+            return numpy.full_like(distance, horizon)
+        return horizon - TwilightTable.SOLAR_SEMIDIAMETER_DEGREES / distance
+
+    # Apparent right ascension (degrees), declination (radians), and distance (AU) of the sun,
+    # and the apparent Greenwich sidereal time (degrees), at each of the given Julian days (UT)
+    @staticmethod
+    def sun_position(julian_days: numpy.ndarray) -> (numpy.ndarray, numpy.ndarray,
+                                                     numpy.ndarray, numpy.ndarray):
+        """Low-precision apparent solar coordinates and sidereal time, vectorized"""
+        days = julian_days - TwilightTable.J2000_JULIAN_DAY
+        centuries = days / 36525.0
+        mean_longitude = 280.46646 + centuries * (36000.76983 + centuries * 0.0003032)
+        mean_anomaly = numpy.radians(357.52911 + centuries * (35999.05029 - centuries * 0.0001537))
+        eccentricity = 0.016708634 - centuries * (0.000042037 + centuries * 0.0000001267)
+        centre = (1.914602 - centuries * (0.004817 + centuries * 0.000014)) * numpy.sin(mean_anomaly) \
+            + (0.019993 - centuries * 0.000101) * numpy.sin(2 * mean_anomaly) \
+            + 0.000289 * numpy.sin(3 * mean_anomaly)
+        true_anomaly = mean_anomaly + numpy.radians(centre)
+        distance = 1.000001018 * (1 - eccentricity * eccentricity) / (1 + eccentricity * numpy.cos(true_anomaly))
+
+        # Nutation and aberration
+        node = numpy.radians(125.04 - 1934.136 * centuries)
+        nutation_longitude = -0.00478 * numpy.sin(node)
+        apparent_longitude = numpy.radians(mean_longitude + centre - 0.00569 + nutation_longitude)
+        mean_obliquity = 23.0 + (26.0 + (21.448 - centuries * (46.815 + centuries
+                                                                * (0.00059 - centuries * 0.001813))) / 60.0) / 60.0
+        obliquity = numpy.radians(mean_obliquity + 0.00256 * numpy.cos(node))
+
+        right_ascension = numpy.degrees(numpy.arctan2(numpy.cos(obliquity) * numpy.sin(apparent_longitude),
+                                                      numpy.cos(apparent_longitude)))
+        declination = numpy.arcsin(numpy.sin(obliquity) * numpy.sin(apparent_longitude))
+        mean_sidereal = 280.46061837 + TwilightTable.SIDEREAL_RATE * days \
+            + centuries * centuries * (0.000387933 - centuries / 38710000.0)
+        sidereal = mean_sidereal + nutation_longitude * numpy.cos(obliquity)
+        return right_ascension, declination, distance, sidereal
+
+    # Julian day of local mean noon, at the site's longitude, for each date
+    def local_noon_julian_days(self, dates: numpy.ndarray) -> numpy.ndarray:
+        """Julian days (UT) of local mean noon on each of the given dates"""
+        days_since_epoch = dates.astype("datetime64[D]").astype(numpy.float64)
+        return days_since_epoch + TwilightTable.UNIX_EPOCH_JULIAN_DAY + 0.5 - self._longitude / 360.0
+
+    @staticmethod
+    def date_range(first_date: date, last_date: date) -> numpy.ndarray:
+        """Array of every date from first_date to last_date inclusive"""
+        assert first_date <= last_date
+        return numpy.arange(numpy.datetime64(first_date, "D"),
+                            numpy.datetime64(last_date, "D") + numpy.timedelta64(1, "D"))
+
+    # Convert Julian days to numpy UTC datetimes, rounded to the second.  NaN becomes NaT.
+    @staticmethod
+    def julian_days_to_datetime64(julian_days: numpy.ndarray) -> numpy.ndarray:
+        """Convert an array of Julian days (UT) to datetime64 seconds, with NaT for missing"""
+        seconds = (julian_days - TwilightTable.UNIX_EPOCH_JULIAN_DAY) * 86400.0
+        result = numpy.full(seconds.shape, numpy.datetime64("NaT"), dtype="datetime64[s]")
+        valid = numpy.isfinite(seconds)
+        result[valid] = numpy.round(seconds[valid]).astype(numpy.int64).astype("datetime64[s]")
+        return result
+
+    @staticmethod
+    def wrap_degrees(angle: numpy.ndarray) -> numpy.ndarray:
+        """Reduce angles in degrees to the range -180 to +180"""
+        return (angle + 180.0) % 360.0 - 180.0
+
+    # Check this vectorized calculation against the ephem-based searches that DataModel uses,
+    # for every night in the given range.  Return the largest disagreement in seconds, and the nights
+    # where one has a window and the other doesn't (the disagreement is then infinite); the caller
+    # decides what to report.  This is slow (it runs ephem for each date) and intended for verification only.
+    @tracelog
+    def max_difference_from_ephem(self, data_model, first_date: date, last_date: date) -> (float, [date]):
+        """Largest difference, in seconds, between this table and ephem for a date range, and mismatched nights"""
+        import ephem
+        worst = 0.0
+        mismatched_nights: [date] = []
+        for (start_type, end_type) in zip(TwilightTable.START_EVENTS, TwilightTable.END_EVENTS):
+            windows = self.night_windows(first_date, last_date, start_type, end_type)
+            (start_horizon, start_use_center) = TwilightTable.START_EVENTS[start_type]
+            (end_horizon, end_use_center) = TwilightTable.END_EVENTS[end_type]
+            for index in range(len(windows)):
+                night: date = windows.dates[index].astype(date)
+                observer = data_model.get_observer(night.year, night.month, night.day,
+                                                   str(ephem.degrees(numpy.radians(start_horizon))))
+                observer.date = self.ephem_date_for_day_number(
+                    self.local_noon_julian_days(windows.dates[index:index + 1])[0])
+                try:
+                    ephem_start = observer.next_setting(ephem.Sun(), use_center=start_use_center).datetime()
+                    observer.horizon = str(ephem.degrees(numpy.radians(end_horizon)))
+                    ephem_end = observer.next_rising(ephem.Sun(), use_center=end_use_center).datetime()
+                except ephem.CircumpolarError:
+                    # No such event this night (high latitude summer); the table should agree
+                    if not (numpy.isnat(windows.starts[index]) or numpy.isnat(windows.ends[index])):
+                        mismatched_nights.append(night)
+                        worst = float("inf")
+                    continue
+                if numpy.isnat(windows.starts[index]) or numpy.isnat(windows.ends[index]):
+                    mismatched_nights.append(night)
+                    worst = float("inf")
+                    continue
+                worst = max(worst,
+                            abs(self.seconds_between(windows.starts[index], ephem_start)),
+                            abs(self.seconds_between(windows.ends[index], ephem_end)))
+        return worst, sorted(set(mismatched_nights))
+
+    @staticmethod
+    def ephem_date_for_day_number(julian_day: float) -> datetime:
+        """Naive UTC datetime for a Julian day, as the ephem Observer expects"""
+        seconds = (julian_day - TwilightTable.UNIX_EPOCH_JULIAN_DAY) * 86400.0
+        return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(tzinfo=None)
+
+    @staticmethod
+    def seconds_between(calculated: numpy.datetime64, expected: datetime) -> float:
+        """Signed difference in seconds between a datetime64 and a naive UTC datetime"""
+        return float((calculated - numpy.datetime64(expected, "s")) / numpy.timedelta64(1, "s"))
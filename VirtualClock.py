@@ -0,0 +1,33 @@
+# Session clock for simulations.  Time only moves when someone sleeps: sleep() advances the clock by
+# the requested amount and returns at once.  So a session (with a simulated camera reading the same
+# clock) runs through its waits, cooling and exposures as fast as the code can go.
+import threading
+import time
+from datetime import datetime, timedelta
+
+from SessionClock import SessionClock
+
+
+class VirtualClock(SessionClock):
+
+    # Start at the given time of day, or the real time now
+    def __init__(self, start_time: datetime = None):
+        self._start_time: datetime = start_time if start_time is not None else datetime.now()
+        self._elapsed_seconds: float = 0.0
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            return self._start_time + timedelta(seconds=self._elapsed_seconds)
+
+    def monotonic(self) -> float:
+        with self._lock:
+            return self._elapsed_seconds
+
+    def sleep(self, seconds: float):
+        """Advance the clock by the given time, without waiting"""
+        if seconds > 0:
+            with self._lock:
+                self._elapsed_seconds += seconds
+        # Give other threads (e.g. one watching for cancellation) a chance to run
+        time.sleep(0)
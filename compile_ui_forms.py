@@ -0,0 +1,32 @@
+# Compile the Qt Designer .ui files into python form modules (MainWindow.ui -> MainWindowUi.py, etc.)
+# so the program doesn't have to parse the XML at startup.  Run this after editing any .ui file:
+#       python compile_ui_forms.py
+# Each form records a fingerprint of the .ui file it came from; MultiOsUtil.load_ui_form falls back
+# to loading the .ui file directly if the form is missing or out of date, so forgetting to run this
+# only costs startup time.
+import io
+import os
+import re
+
+from PyQt5 import uic
+
+from MultiOsUtil import MultiOsUtil
+
+UI_FILE_NAMES = ["MainWindow.ui", "AddFrameSet.ui", "BulkEntry.ui"]
+
+# Work in the program directory so the generated files name the .ui files without a machine-specific path
+os.chdir(os.path.dirname(os.path.realpath(__file__)))
+for ui_file_name in UI_FILE_NAMES:
+    ui_path = MultiOsUtil.path_for_file_in_program_directory(ui_file_name)
+    compiled = io.StringIO()
+    with open(ui_file_name, "r") as ui_file:
+        uic.compileUi(ui_file, compiled)
+    form_source = compiled.getvalue()
+    form_class_name = re.search(r"^class (\w+)\(object\):", form_source, re.MULTILINE).group(1)
+    form_module_name = MultiOsUtil.compiled_form_module_name(ui_file_name)
+    with open(MultiOsUtil.path_for_file_in_program_directory(form_module_name + ".py"), "w") as form_file:
+        form_file.write(form_source)
+        form_file.write(f"\n\n# Written by compile_ui_forms.py, used by MultiOsUtil.load_ui_form\n")
+        form_file.write(f"FORM_CLASS_NAME = \"{form_class_name}\"\n")
+        form_file.write(f"UI_SOURCE_SHA1 = \"{MultiOsUtil.ui_file_sha1(ui_path)}\"\n")
+    print(f"{ui_file_name} -> {form_module_name}.py ({form_class_name})")
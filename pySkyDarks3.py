@@ -1,11 +1,21 @@
 import sys
+from time import perf_counter
+
+# "--startup-report" prints how long each stage of startup took, to measure startup speed.
+# It is removed from the arguments so it doesn't look like a file name.
+startup_report = "--startup-report" in sys.argv
+if startup_report:
+    sys.argv.remove("--startup-report")
+startup_times = [("Start", perf_counter())]
 
 from PyQt5 import QtWidgets
-from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtCore import QCoreApplication, QTimer
 
 from DataModel import DataModel
 from MainWindow import MainWindow
 
+startup_times.append(("Imports", perf_counter()))
+
 app = QtWidgets.QApplication(sys.argv)
 
 # Set organization info to allow un-parameterized QSettings constructor
@@ -15,6 +25,7 @@ QCoreApplication.setApplicationName("pySkyDarks2")
 QCoreApplication.setApplicationVersion("1.0")
 # Preferences are stored with the following keys
 #       last_opened_path        The last file opened or saved, so next can go to same place
+startup_times.append(("QApplication", perf_counter()))
 
 # Data model for this application.  If we were given a file name as an argument,
 # load the data model from that file.  If not, create a new data model with default
@@ -37,10 +48,27 @@ else:
     if data_model is None:
         print(f"Unable to create data model from preferences")
         sys.exit(101)
+startup_times.append(("Data model", perf_counter()))
 
 window = MainWindow()
+startup_times.append(("Main window", perf_counter()))
 window.accept_data_model(data_model)
+startup_times.append(("Fill in fields", perf_counter()))
 window.ui.show()
+startup_times.append(("Show window", perf_counter()))
 
-app.exec_()
 
+# Called from the event loop once it is running, i.e. when the window is ready to use
+def print_startup_report():
+    startup_times.append(("Event loop running", perf_counter()))
+    print("Startup times (seconds):")
+    for index in range(1, len(startup_times)):
+        (stage, stage_end) = startup_times[index]
+        print(f"   {stage:20} {stage_end - startup_times[index - 1][1]:7.3f}")
+    print(f"   {'Total':20} {startup_times[-1][1] - startup_times[0][1]:7.3f}")
+
+
+if startup_report:
+    QTimer.singleShot(0, print_startup_report)
+
+app.exec_()
@@ -0,0 +1,107 @@
+import argparse
+import sys
+from time import perf_counter
+
+from PyQt5.QtCore import QCoreApplication
+
+from DataModel import DataModel
+from FrameRetryPolicy import FrameRetryPolicy
+from HeadlessSession import HeadlessSession
+from SettingsCache import SettingsCache
+from TheSkyX import TheSkyX
+from TheSkyXTrace import TheSkyXTrace
+
+# Run a session from a saved plan file with no GUI, e.g. on an observatory computer with no display:
+#       python pySkyDarks3Headless.py plan.ewho2
+# Progress is printed to the console; completed counts are saved back to the plan file.
+# Ctrl-C cancels the session cleanly.
+# With --simulate the session is run against a simulated camera on a virtual clock, so a whole night
+# passes in seconds; the plan file is not changed and no wake-on-lan is sent.
+# With --metrics-port (or the metrics_port preference) the session's progress is served for monitoring
+# at http://localhost:<port>/metrics.
+# If the connection to TheSkyX is lost, the session keeps trying for --reconnect-seconds (or the
+# reconnect_seconds preference) and resumes the frame it was taking; 0 ends the session instead.
+# A frame that fails is taken again, or its frame set skipped, as --retry-policy (or the frame_retry_policy
+# preference) says, e.g. --retry-policy start=retry:3:skip,camera=abort,timeout=retry:1:skip
+# With --trace, every exchange with TheSkyX is recorded, for replaying with run_theskyx_stand_in.py --replay
+# or run_session_benchmark.py --replay.
+
+app = QCoreApplication(sys.argv)
+
+# Same organization info as the GUI, so both use the same preferences
+QCoreApplication.setOrganizationName("EarwigHavenObservatory")
+QCoreApplication.setOrganizationDomain("earwighavenobservatory.com")
+QCoreApplication.setApplicationName("pySkyDarks2")
+QCoreApplication.setApplicationVersion("1.0")
+
+parser = argparse.ArgumentParser(description="Acquire dark and bias frames from a plan file, without the GUI")
+parser.add_argument("plan_file", help="Plan file saved by pySkyDarks3")
+parser.add_argument("--log-file", help="Also append session progress to this file")
+parser.add_argument("--save-at-end-only", action="store_true",
+                    help="Save completed counts to the plan file only when the session ends")
+parser.add_argument("--simulate", action="store_true",
+                    help="Run the session against a simulated camera, as fast as possible, without saving")
+parser.add_argument("--trace",
+                    help="Record all traffic with TheSkyX in this file (.gz to compress), for replaying later")
+parser.add_argument("--metrics-port", type=int, default=None,
+                    help="Serve session metrics on this port (default the metrics_port preference; 0 for none)")
+parser.add_argument("--metrics-address", default="localhost",
+                    help="Address to serve metrics on (default localhost; 0.0.0.0 for all interfaces)")
+parser.add_argument("--reconnect-seconds", type=int, default=None,
+                    help="Keep trying to reach TheSkyX this long if the connection is lost "
+                         "(default the reconnect_seconds preference; 0 to end the session)")
+parser.add_argument("--retry-policy", default=None,
+                    help="What to do when a frame fails, e.g. start=retry:2:skip,camera=retry:2:skip,timeout=abort "
+                         "(default the frame_retry_policy preference)")
+args = parser.parse_args(app.arguments()[1:])
+metrics_port = args.metrics_port if args.metrics_port is not None else SettingsCache.instance().get_metrics_port()
+reconnect_seconds = args.reconnect_seconds if args.reconnect_seconds is not None \
+    else SettingsCache.instance().get_reconnect_seconds()
+(retry_policy, message) = FrameRetryPolicy.parse(args.retry_policy if args.retry_policy is not None
+                                                 else SettingsCache.instance().get_frame_retry_policy()
+                                                 or FrameRetryPolicy.DEFAULT_TEXT)
+if retry_policy is None:
+    print(f"Invalid retry policy: {message}")
+    sys.exit(2)
+
+data_model = DataModel.make_from_file_named(args.plan_file)
+if data_model is None:
+    print(f"Unable to read data model from file {args.plan_file}")
+    sys.exit(100)
+
+trace = None
+if args.trace is not None:
+    trace = TheSkyXTrace(args.trace)
+    (success, message) = trace.start()
+    if not success:
+        print(f"Unable to write trace file {args.trace}: {message}")
+        sys.exit(100)
+    TheSkyX.set_trace(trace)
+
+if args.simulate:
+    from SimulatedCamera import SimulatedCamera
+    from SimulatedTheSkyX import SimulatedTheSkyX
+    from VirtualClock import VirtualClock
+    clock = VirtualClock()
+    camera = SimulatedCamera(clock)
+    data_model.set_send_wake_on_lan_before_starting(False)
+    session = HeadlessSession(data_model, None, log_file_path=args.log_file,
+                              clock=clock, server=SimulatedTheSkyX(camera),
+                              metrics_port=metrics_port, metrics_address=args.metrics_address,
+                              reconnect_seconds=reconnect_seconds, retry_policy=retry_policy)
+    real_started = perf_counter()
+    succeeded = session.run()
+    print(f"Simulated {camera.get_frames_taken()} frames in {clock.monotonic() / 3600:.2f} hours "
+          f"of session time ({perf_counter() - real_started:.1f} seconds)")
+else:
+    session = HeadlessSession(data_model, args.plan_file,
+                              save_after_each_frame=not args.save_at_end_only,
+                              log_file_path=args.log_file,
+                              metrics_port=metrics_port, metrics_address=args.metrics_address,
+                              reconnect_seconds=reconnect_seconds, retry_policy=retry_policy)
+    succeeded = session.run()
+if trace is not None:
+    TheSkyX.set_trace(None)
+    trace.stop()
+    print(f"Recorded {trace.get_exchanges()} exchanges with TheSkyX in {args.trace}")
+sys.exit(0 if succeeded else 1)
@@ -0,0 +1,83 @@
+import argparse
+import sys
+from datetime import date, timedelta
+
+from PyQt5.QtCore import QCoreApplication
+
+from CampaignPlanner import CampaignPlanner
+from DataModel import DataModel
+
+# Split a plan that won't fit in one night across as few nights as possible, e.g.
+#       python run_campaign_planner.py plan.ewho2 --from 2026-10-20 --to 2026-11-05
+# Each night's window comes from the plan's location and start and end time settings.  A plan file is
+# written for each night used, beside the master plan (plan-night-2026-10-20.ewho2, ...), and each can be
+# run as an ordinary session, in the GUI or with pySkyDarks3Headless.py.  Frames already complete in the
+# master plan are not planned again.
+# Frame times are estimated from a table of typical download times; give the times measured by a session
+# (shown in its console) with --download, e.g. --download 1:8,2:4, for a closer fit.  --dry-run only lists
+# the nights.
+
+app = QCoreApplication(sys.argv)
+QCoreApplication.setOrganizationName("EarwigHavenObservatory")
+QCoreApplication.setOrganizationDomain("earwighavenobservatory.com")
+QCoreApplication.setApplicationName("pySkyDarks2")
+QCoreApplication.setApplicationVersion("1.0")
+
+parser = argparse.ArgumentParser(description="Split a frame plan across as few nights as possible")
+parser.add_argument("plan_file", help="Plan file saved by pySkyDarks3")
+parser.add_argument("--from", dest="first_date", default=None,
+                    help="First night, as YYYY-MM-DD (default today)")
+parser.add_argument("--to", dest="last_date", default=None,
+                    help="Last night, as YYYY-MM-DD (default two weeks after the first)")
+parser.add_argument("--download", default=None,
+                    help="Download seconds by binning, e.g. 1:8,2:4 (default a table of typical times)")
+parser.add_argument("--output", default=None,
+                    help="Base name for the night plan files (default the plan file's name)")
+parser.add_argument("--dry-run", action="store_true", help="List the nights without writing plan files")
+args = parser.parse_args(app.arguments()[1:])
+
+try:
+    first_date = date.fromisoformat(args.first_date) if args.first_date is not None else date.today()
+    last_date = date.fromisoformat(args.last_date) if args.last_date is not None \
+        else first_date + timedelta(days=13)
+except ValueError as error:
+    print(f"Invalid date: {error}")
+    sys.exit(2)
+if last_date < first_date:
+    print(f"--to {last_date} is before --from {first_date}")
+    sys.exit(2)
+
+download_seconds = None
+if args.download is not None:
+    try:
+        download_seconds = {int(binning): float(seconds)
+                            for (binning, seconds) in (item.split(":") for item in args.download.split(","))}
+    except ValueError:
+        print(f"Invalid --download \"{args.download}\", expected e.g. 1:8,2:4")
+        sys.exit(2)
+
+data_model = DataModel.make_from_file_named(args.plan_file)
+if data_model is None:
+    print(f"Unable to read data model from file {args.plan_file}")
+    sys.exit(100)
+
+planner = CampaignPlanner(data_model, download_seconds)
+(nights, leftovers) = planner.plan(first_date, last_date)
+print(f"{len(nights)} night(s) from {first_date} to {last_date}:")
+for night in nights:
+    print(f"   {night.get_night_date()}: {night.get_start_date_time():%H:%M} to {night.get_end_date_time():%H:%M}, "
+          + f"{night.get_number_of_frames()} frames, "
+          + f"{round(night.get_planned_seconds() / 60)} of {round(night.get_capacity_seconds() / 60)} minutes")
+for (plan_index, frame_set, number_left) in leftovers:
+    print(f"   Not fitting: {number_left} frames of plan row {plan_index + 1} ({frame_set})")
+
+exit_code = 0
+if not args.dry_run and len(nights) > 0:
+    (success, files_written, message) = planner.write_night_plans(nights, args.output if args.output is not None
+                                                                  else args.plan_file)
+    for file_name in files_written:
+        print(f"Wrote {file_name}")
+    if not success:
+        print(message)
+        exit_code = 100
+sys.exit(exit_code)
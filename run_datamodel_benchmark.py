@@ -0,0 +1,60 @@
+import argparse
+import sys
+
+from PyQt5.QtCore import QCoreApplication
+
+from DataModelBenchmark import DataModelBenchmark
+from SessionBenchmark import SessionBenchmark
+
+# Time the DataModel's plan and twilight operations on synthetic plans, e.g.
+#       python run_datamodel_benchmark.py --sizes 10,1000,100000 --output datamodel.json --compare previous.json
+# The plans are generated from --seed, so runs with the same seed and sizes are comparable.
+
+app = QCoreApplication(sys.argv)
+QCoreApplication.setOrganizationName("EarwigHavenObservatory")
+QCoreApplication.setOrganizationDomain("earwighavenobservatory.com")
+QCoreApplication.setApplicationName("pySkyDarks2")
+QCoreApplication.setApplicationVersion("1.0")
+
+parser = argparse.ArgumentParser(description="Micro-benchmarks of DataModel operations")
+parser.add_argument("--seed", type=int, default=1, help="Seed for generating the synthetic plans")
+parser.add_argument("--sizes", default=",".join(str(size) for size in DataModelBenchmark.DEFAULT_SIZES),
+                    help="Numbers of frame sets in the synthetic plans, comma-separated")
+parser.add_argument("--repeats", type=int, default=DataModelBenchmark.DEFAULT_REPEATS,
+                    help="Times each operation is run; the best and mean are reported")
+parser.add_argument("--output", help="Save the report to this JSON file")
+parser.add_argument("--compare", help="Compare with a report saved earlier")
+args = parser.parse_args(app.arguments()[1:])
+
+try:
+    sizes = [int(size) for size in args.sizes.split(",")]
+except ValueError:
+    print(f"Invalid --sizes \"{args.sizes}\", expected e.g. 10,1000,100000")
+    sys.exit(2)
+if args.repeats < 1:
+    print("--repeats must be at least 1")
+    sys.exit(2)
+
+report = DataModelBenchmark(args.seed, sizes, args.repeats).run()
+print(f"DataModel benchmark, version {report['program_version']}, seed {args.seed}, {args.repeats} repeats")
+print(f"   {'operation':26} {'size':>7} {'best (s)':>10} {'mean (s)':>10} {'peak memory':>12}")
+for result in report["results"]:
+    print(f"   {result['operation']:26} {result['size']:7} {result['best_seconds']:10.6f} "
+          f"{result['mean_seconds']:10.6f} {result['peak_bytes']:12,}")
+
+exit_code = 0
+if args.output is not None:
+    (success, message) = SessionBenchmark.save_report(report, args.output)
+    if not success:
+        print(f"Unable to save report to {args.output}: {message}")
+        exit_code = 1
+if args.compare is not None:
+    (earlier, message) = SessionBenchmark.load_report(args.compare)
+    if earlier is None:
+        print(f"Unable to read report {args.compare}: {message}")
+        exit_code = 1
+    else:
+        print(f"Compared with {args.compare} (version {earlier.get('program_version')}):")
+        for line in DataModelBenchmark.compare_reports(earlier, report):
+            print("   " + line)
+sys.exit(exit_code)
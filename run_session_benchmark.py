@@ -0,0 +1,123 @@
+import argparse
+import sys
+
+from PyQt5.QtCore import QCoreApplication
+
+from DataModel import DataModel
+from FrameRetryPolicy import FrameRetryPolicy
+from ImpairedTransport import ImpairedTransport
+from SessionBenchmark import SessionBenchmark
+from TheSkyXTrace import TheSkyXTrace
+
+# Measure session throughput for representative plans against the simulated TheSkyX, e.g.
+#       python run_session_benchmark.py --rtt 0.05 --output benchmark.json --compare previous.json
+# Each plan's session runs on a virtual clock, so the whole suite takes seconds.
+# Options such as --jitter and --drop-rate degrade the link between the session and the server, e.g.
+#       python run_session_benchmark.py --latency 0.05 --jitter 0.2 --latency-distribution exponential --seed 7
+# and --reconnect-seconds lets the session ride out the lost connections, e.g.
+#       python run_session_benchmark.py --drop-rate 0.02 --reconnect-seconds 300
+# --failure-rate makes the simulated camera fail, to see how the frame --retry-policy copes, e.g.
+#       python run_session_benchmark.py --failure-rate 0.01 --retry-policy start=retry:1:skip,camera=abort
+# With --replay, a plan file is run against a trace recorded from TheSkyX (pySkyDarks3Headless.py --trace):
+#       python run_session_benchmark.py --replay night.trace.gz --plan plan.ewho2
+
+app = QCoreApplication(sys.argv)
+QCoreApplication.setOrganizationName("EarwigHavenObservatory")
+QCoreApplication.setOrganizationDomain("earwighavenobservatory.com")
+QCoreApplication.setApplicationName("pySkyDarks2")
+QCoreApplication.setApplicationVersion("1.0")
+
+parser = argparse.ArgumentParser(description="Session throughput benchmark against a simulated TheSkyX")
+parser.add_argument("plans", nargs="*", choices=[[]] + list(SessionBenchmark.PLANS.keys()),
+                    help="Plans to run (default all): " + ", ".join(SessionBenchmark.PLANS.keys()))
+parser.add_argument("--rtt", type=float, default=0.0, help="Network round-trip seconds added to each command")
+parser.add_argument("--download", default=None,
+                    help="Download seconds by binning, e.g. 1:8,2:4,3:3,4:2 (default the simulated camera's)")
+parser.add_argument("--jitter", type=float, default=0.0,
+                    help="Impair the link: add reply delays with this spread (seconds), from --latency-distribution")
+parser.add_argument("--latency", type=float, default=0.0, help="Impair the link: mean extra reply delay (seconds)")
+parser.add_argument("--latency-distribution", choices=ImpairedTransport.LATENCY_DISTRIBUTIONS, default="normal",
+                    help="Distribution of the extra reply delays (default normal)")
+parser.add_argument("--refuse-rate", type=float, default=0.0,
+                    help="Impair the link: fraction (0 to 1) of connections refused")
+parser.add_argument("--drop-rate", type=float, default=0.0,
+                    help="Impair the link: fraction (0 to 1) of connections dropped before the reply")
+parser.add_argument("--partial-read-rate", type=float, default=0.0,
+                    help="Impair the link: fraction (0 to 1) of replies received in several pieces")
+parser.add_argument("--seed", type=int, default=1, help="Seed for the link impairments (default 1)")
+parser.add_argument("--reconnect-seconds", type=float, default=0,
+                    help="Reconnect and resume for up to this long when the connection is lost (default 0, don't)")
+parser.add_argument("--failure-rate", type=float, default=0.0,
+                    help="Fraction (0 to 1) of simulated camera operations that fail")
+parser.add_argument("--retry-policy", default=FrameRetryPolicy.DEFAULT_TEXT,
+                    help=f"What to do when a frame fails (default {FrameRetryPolicy.DEFAULT_TEXT})")
+parser.add_argument("--replay", help="Run the --plan file against this recorded TheSkyX trace instead")
+parser.add_argument("--plan", help="Plan file to run with --replay (the plan the trace was recorded with)")
+parser.add_argument("--output", help="Save the report to this JSON file")
+parser.add_argument("--compare", help="Compare with a report saved earlier")
+args = parser.parse_args(app.arguments()[1:])
+
+download_seconds = None
+if args.download is not None:
+    try:
+        download_seconds = {int(binning): float(seconds)
+                            for (binning, seconds) in (item.split(":") for item in args.download.split(","))}
+    except ValueError:
+        print(f"Invalid --download \"{args.download}\", expected e.g. 1:8,2:4")
+        sys.exit(2)
+
+impairments = None
+if args.jitter > 0 or args.latency > 0 or args.refuse_rate > 0 or args.drop_rate > 0 or args.partial_read_rate > 0:
+    impairments = {"latency_seconds": args.latency, "jitter_seconds": args.jitter,
+                   "latency_distribution": args.latency_distribution,
+                   "refuse_rate": args.refuse_rate, "drop_rate": args.drop_rate,
+                   "partial_read_rate": args.partial_read_rate, "seed": args.seed}
+
+(retry_policy, message) = FrameRetryPolicy.parse(args.retry_policy)
+if retry_policy is None:
+    print(f"Invalid --retry-policy: {message}")
+    sys.exit(2)
+
+benchmark = SessionBenchmark(args.rtt, download_seconds, impairments, args.reconnect_seconds,
+                             args.failure_rate, retry_policy)
+if args.replay is not None:
+    if args.plan is None:
+        print("--replay needs the --plan file the trace was recorded with")
+        sys.exit(2)
+    (exchanges, message) = TheSkyXTrace.read_exchanges(args.replay)
+    if exchanges is None:
+        print(f"Unable to read trace {args.replay}: {message}")
+        sys.exit(100)
+    data_model = DataModel.make_from_file_named(args.plan)
+    if data_model is None:
+        print(f"Unable to read data model from file {args.plan}")
+        sys.exit(100)
+    report = benchmark.make_report({"replay": benchmark.run_replay(exchanges, data_model.get_incomplete_framesets(),
+                                                                   data_model.get_session_temperature_info())})
+else:
+    report = benchmark.run(args.plans if len(args.plans) > 0 else None)
+print(f"Session benchmark, version {report['program_version']}, round trip {args.rtt} seconds")
+if impairments is not None:
+    print("Link impairments: " + ", ".join(f"{name} {value}" for (name, value) in impairments.items()))
+for (plan_name, results) in report["results"].items():
+    print(f"{plan_name}: {results['description']}")
+    for (metric, value) in results.items():
+        if metric != "description":
+            print(f"   {metric:28} {value}")
+
+exit_code = 0
+if args.output is not None:
+    (success, message) = SessionBenchmark.save_report(report, args.output)
+    if not success:
+        print(f"Unable to save report to {args.output}: {message}")
+        exit_code = 1
+if args.compare is not None:
+    (earlier, message) = SessionBenchmark.load_report(args.compare)
+    if earlier is None:
+        print(f"Unable to read report {args.compare}: {message}")
+        exit_code = 1
+    else:
+        print(f"Compared with {args.compare} (version {earlier.get('program_version')}):")
+        for line in SessionBenchmark.compare_reports(earlier, report):
+            print("   " + line)
+sys.exit(exit_code)
@@ -0,0 +1,62 @@
+import argparse
+import json
+import sys
+
+from PyQt5.QtCore import QCoreApplication
+
+from TheSkyXProbe import TheSkyXProbe
+
+# Characterize the link to a TheSkyX server (e.g. a new observatory PC, or a new network path to it), e.g.
+#       python run_theskyx_probe.py 192.168.1.20 --count 200 --concurrency 1,4,8
+# For each concurrency, the commands are sent first connecting for each one (as a session does), then
+# reusing connections.  Each run reports connect and round-trip time percentiles (50th, 90th, 99th, in
+# milliseconds), commands answered per second and the error rate.  --output saves the results as JSON.
+# The commands only read from the camera, so this can be run while a session is waiting to start - but
+# not while one is running, as the probe's commands would delay the session's.
+
+app = QCoreApplication(sys.argv)
+QCoreApplication.setOrganizationName("EarwigHavenObservatory")
+QCoreApplication.setOrganizationDomain("earwighavenobservatory.com")
+QCoreApplication.setApplicationName("pySkyDarks2")
+QCoreApplication.setApplicationVersion("1.0")
+
+parser = argparse.ArgumentParser(description="Measure latency and throughput of TheSkyX's TCP server")
+parser.add_argument("address", help="Address of the computer running TheSkyX")
+parser.add_argument("--port", type=int, default=3040, help="TheSkyX's TCP server port (default 3040)")
+parser.add_argument("--command", choices=list(TheSkyXProbe.COMMANDS.keys()), default=TheSkyXProbe.DEFAULT_COMMAND,
+                    help=f"Read command to send (default {TheSkyXProbe.DEFAULT_COMMAND})")
+parser.add_argument("--count", type=int, default=100, help="Commands to send in each run (default 100)")
+parser.add_argument("--concurrency", default="1,4",
+                    help="Commands sent at once, as a list of values to try (default 1,4)")
+parser.add_argument("--output", help="Save the results to this JSON file")
+args = parser.parse_args(app.arguments()[1:])
+
+try:
+    concurrencies = [int(value) for value in args.concurrency.split(",")]
+except ValueError:
+    concurrencies = []
+if len(concurrencies) == 0 or min(concurrencies) < 1 or args.count < 1:
+    print(f"Invalid --concurrency \"{args.concurrency}\" or --count {args.count}, expected e.g. --count 100 "
+          + "--concurrency 1,4")
+    sys.exit(2)
+
+probe = TheSkyXProbe(args.address, args.port)
+print(f"Probing TheSkyX at {args.address}:{args.port} with {args.count} \"{args.command}\" commands per run")
+all_results = []
+for concurrency in concurrencies:
+    for reuse_connections in (False, True):
+        results = probe.run(args.command, args.count, concurrency, reuse_connections)
+        all_results.append(results)
+        print(TheSkyXProbe.describe(results))
+        for (message, count) in results["errors"].items():
+            print(f"      {count} failed: {message}")
+
+exit_code = 0
+if args.output is not None:
+    try:
+        with open(args.output, "w") as output_file:
+            json.dump({"address": args.address, "port": args.port, "runs": all_results}, output_file, indent=2)
+    except OSError as error:
+        print(f"Unable to save results to {args.output}: {error.strerror}")
+        exit_code = 1
+sys.exit(exit_code)
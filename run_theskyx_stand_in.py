@@ -0,0 +1,48 @@
+import argparse
+import sys
+
+from RealClock import RealClock
+from SimulatedCamera import SimulatedCamera
+from TheSkyXReplayServer import TheSkyXReplayServer
+from TheSkyXStandInServer import TheSkyXStandInServer
+from TheSkyXTrace import TheSkyXTrace
+
+# Run a stand-in for TheSkyX's TCP server, with a simulated camera, so the program can be tried out
+# or tested without TheSkyX:
+#       python run_theskyx_stand_in.py --port 3040
+# then set the plan's server address to this computer.  Ctrl-C stops the server.
+# With --replay, it answers from a trace recorded from TheSkyX (pySkyDarks3Headless.py --trace) instead,
+# with the recorded timing.
+
+parser = argparse.ArgumentParser(description="Stand-in for TheSkyX's TCP server, with a simulated camera")
+parser.add_argument("--address", default="localhost", help="Address to listen on (default localhost)")
+parser.add_argument("--port", type=int, default=3040, help="Port to listen on (default 3040, as TheSkyX)")
+parser.add_argument("--latency", type=float, default=0.0, help="Seconds to wait before each reply")
+parser.add_argument("--failure-rate", type=float, default=0.0,
+                    help="Fraction (0 to 1) of camera commands that reply with an error")
+parser.add_argument("--drop-rate", type=float, default=0.0,
+                    help="Fraction (0 to 1) of commands whose connection is closed without a reply")
+parser.add_argument("--seed", type=int, help="Seed for the random failures, to repeat a run")
+parser.add_argument("--replay", help="Answer from this recorded trace instead of the simulated camera")
+parser.add_argument("--speed", type=float, default=1.0,
+                    help="With --replay, divide the recorded delays by this (0 for no delays)")
+args = parser.parse_args()
+
+if args.replay is not None:
+    (exchanges, message) = TheSkyXTrace.read_exchanges(args.replay)
+    if exchanges is None:
+        print(f"Unable to read trace {args.replay}: {message}")
+        sys.exit(100)
+    server = TheSkyXReplayServer(exchanges, RealClock(), args.address, args.port, speed=args.speed)
+    print(f"Replaying {len(exchanges)} recorded exchanges", flush=True)
+else:
+    server = TheSkyXStandInServer(SimulatedCamera(RealClock()), args.address, args.port,
+                                  latency_seconds=args.latency,
+                                  failure_rate=args.failure_rate,
+                                  drop_rate=args.drop_rate,
+                                  seed=args.seed)
+print(f"TheSkyX stand-in listening on {args.address}:{server.get_port()}", flush=True)
+try:
+    server.serve_forever()
+except KeyboardInterrupt:
+    pass
@@ -9,7 +9,7 @@ a = Analysis(['pySkyDarks3.py'],
              datas=[('MainWindow.ui', '.'),
              ('BulkEntry.ui', '.'),
              ('AddFrameSet.ui', '.')],
-             hiddenimports=[],
+             hiddenimports=['MainWindowUi', 'AddFrameSetUi', 'BulkEntryUi'],
              hookspath=[],
              runtime_hooks=[],
              excludes=[],